@@ -0,0 +1,28 @@
+import sys
+
+# Canonical string of every address seen by the process, keyed by value. Addresses come from
+# payload felts, from zero-padded `event.data.from_address` strings and from database rows;
+# mapping them all to one interned '0x...' string keeps cache keys and stored rows consistent
+_canonical: dict[int, str] = {}
+
+
+def normalize_address(address: int | str) -> str:
+    """Get the canonical form of an address: lowercase hex with the 0x prefix and no zero padding.
+
+    Args:
+        address: Address as a felt integer or a hex string (padded or not). Strings are always
+            parsed as hex, with or without the 0x prefix; pass felts as ints, not as str(felt)
+
+    Returns:
+        str: Interned canonical address, the same object for every call with the same value
+    """
+    if isinstance(address, int):
+        value = address
+    else:
+        value = int(address, 16)
+
+    canonical = _canonical.get(value)
+    if canonical is None:
+        canonical = sys.intern(f'0x{value:x}')
+        _canonical[value] = canonical
+    return canonical
@@ -0,0 +1,103 @@
+from collections.abc import Iterable
+from decimal import MAX_PREC
+from decimal import Context
+from decimal import Decimal
+
+# Fixed-point scale of prices and price impacts (1e18 = 1.0)
+PRICE_SCALE = 10**18
+PRICE_DECIMALS = 18
+
+# Fees are expressed in basis points of the input amount
+BPS = 10_000
+# Swap fee of every pair. Pairs charge a fixed 0.3% and emit no fee rate, neither on creation nor
+# through ConfigUpdated, so this constant is the only source of Pair.fee_bps
+DEFAULT_FEE_BPS = 30
+
+# Decimal context that never rounds, so fixed-point values convert exactly
+_EXACT = Context(prec=MAX_PREC)
+
+
+def swap_price_impact(
+    amount0_in: int,
+    amount1_in: int,
+    amount0_out: int,
+    amount1_out: int,
+    reserve0: int,
+    reserve1: int,
+    fee_bps: int = DEFAULT_FEE_BPS,
+) -> int | None:
+    """Compute the price impact of a swap with integer arithmetic, scaled by PRICE_SCALE.
+
+    Reserves before the swap are derived from the reserves after it, so the result does not
+    depend on whether the Sync of the swap was processed first. The fee is taken off the input,
+    so the impact measures the price move alone: 1 - market_price / effective_price, where
+    market_price = reserve_in / reserve_out and effective_price = (amount_in - fee) / amount_out.
+
+    Args:
+        amount0_in: token0 sent to the pair
+        amount1_in: token1 sent to the pair
+        amount0_out: token0 sent by the pair
+        amount1_out: token1 sent by the pair
+        reserve0: token0 reserve after the swap
+        reserve1: token1 reserve after the swap
+        fee_bps: Swap fee of the pair in basis points
+
+    Returns:
+        int: Absolute price impact scaled by PRICE_SCALE, 0 if the swap direction is ambiguous
+            and None if the reserves before the swap are empty
+    """
+    if amount0_in > 0 and amount1_out > 0:
+        amount_in, amount_out = amount0_in, amount1_out
+        reserve_in, reserve_out = reserve0 - amount0_in, reserve1 + amount1_out
+    elif amount1_in > 0 and amount0_out > 0:
+        amount_in, amount_out = amount1_in, amount0_out
+        reserve_in, reserve_out = reserve1 - amount1_in, reserve0 + amount0_out
+    else:
+        return 0
+
+    if reserve_in <= 0 or reserve_out <= 0:
+        return None
+
+    # effective / market = (amount_in_with_fee * reserve_out) / (amount_out * reserve_in), in BPS units
+    effective = amount_in * (BPS - fee_bps) * reserve_out
+    if effective <= 0:
+        return None
+    market = amount_out * reserve_in * BPS
+    return abs(effective - market) * PRICE_SCALE // effective
+
+
+def swap_price_impacts(
+    swaps: Iterable[tuple[int, int, int, int, int, int]],
+    fee_bps: int = DEFAULT_FEE_BPS,
+) -> list[int | None]:
+    """Compute price impacts of many swaps of one pair, e.g. when backfilling SwapEvent rows.
+
+    Args:
+        swaps: (amount0_in, amount1_in, amount0_out, amount1_out, reserve0, reserve1) per swap
+        fee_bps: Swap fee of the pair in basis points
+
+    Returns:
+        list: Price impacts scaled by PRICE_SCALE, in the order of `swaps`
+    """
+    return [swap_price_impact(*swap, fee_bps=fee_bps) for swap in swaps]
+
+
+def spot_price(reserve0: int, reserve1: int, decimals: int = PRICE_DECIMALS) -> int | None:
+    """Compute the price of token0 in token1 from raw reserves with integer arithmetic.
+
+    Args:
+        reserve0: token0 reserve
+        reserve1: token1 reserve
+        decimals: Fixed-point decimals of the result, rounded down
+
+    Returns:
+        int: reserve1 / reserve0 scaled by 10**decimals, None for an empty pool
+    """
+    if reserve0 <= 0 or reserve1 <= 0:
+        return None
+    return reserve1 * 10**decimals // reserve0
+
+
+def to_decimal(value: int, decimals: int = PRICE_DECIMALS) -> Decimal:
+    """Convert a fixed-point value, PRICE_SCALE by default, to an exact Decimal for storage."""
+    return Decimal(value).scaleb(-decimals, _EXACT)
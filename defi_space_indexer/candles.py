@@ -0,0 +1,88 @@
+from decimal import Decimal
+
+from defi_space_indexer import models as models
+from defi_space_indexer.amm_math import spot_price
+from defi_space_indexer.amm_math import to_decimal
+from defi_space_indexer.entity_cache import save_entity
+
+# Candle resolutions in seconds: 1m, 5m, 1h, 1d
+CANDLE_INTERVALS = (60, 300, 3600, 86400)
+
+# Candle of the latest bucket per (pair, interval). A new bucket opens at the close of the previous one;
+# older buckets are never touched again, so only the latest is kept
+_candles: dict[tuple[str, int], models.PairCandle] = {}
+
+# Decimals of candle prices, matching the PairCandle columns
+CANDLE_PRICE_DECIMALS = 36
+
+
+def get_price(reserve0: int, reserve1: int) -> Decimal | None:
+    """Get the price of token0 in token1 from raw reserves, None for an empty pool."""
+    price = spot_price(reserve0, reserve1, CANDLE_PRICE_DECIMALS)
+    if price is None:
+        return None
+    return to_decimal(price, CANDLE_PRICE_DECIMALS)
+
+
+async def update_candles(
+    pair: models.Pair,
+    price: Decimal,
+    timestamp: int,
+    volume0: int = 0,
+    volume1: int = 0,
+    trades: int = 0,
+) -> None:
+    """Fold a price move, and optionally a trade, into the pair's candles at every resolution.
+
+    Writes go through save_entity, so a level touching the same bucket many times writes it once.
+
+    Args:
+        pair: Pair whose price moved
+        price: New price of token0 in token1
+        timestamp: Block timestamp of the move
+        volume0: Traded token0 amount (in + out)
+        volume1: Traded token1 amount (in + out)
+        trades: Number of swaps to count
+    """
+    for interval in CANDLE_INTERVALS:
+        bucket_start = timestamp - timestamp % interval
+        key = (pair.address, interval)
+        candle = _candles.get(key)
+
+        if candle is None or candle.bucket_start != bucket_start:
+            previous = candle
+            candle = await models.PairCandle.get_or_none(
+                pair_address=pair.address, interval=interval, bucket_start=bucket_start
+            )
+            if candle is None:
+                open_price = Decimal(previous.close) if previous is not None else price
+                candle = models.PairCandle(
+                    pair_address=pair.address,
+                    interval=interval,
+                    bucket_start=bucket_start,
+                    open=open_price,
+                    high=max(open_price, price),
+                    low=min(open_price, price),
+                    close=price,
+                    volume0=0,
+                    volume1=0,
+                    trade_count=0,
+                    updated_at=timestamp,
+                    pair=pair,
+                )
+            _candles[key] = candle
+
+        candle.high = max(Decimal(candle.high), price)
+        candle.low = min(Decimal(candle.low), price)
+        candle.close = price
+        if trades:
+            candle.volume0 = int(candle.volume0) + volume0
+            candle.volume1 = int(candle.volume1) + volume1
+            candle.trade_count += trades
+        candle.updated_at = timestamp
+        await save_entity(candle)
+
+
+def clear_candle_cache() -> None:
+    """Drop the cached candles, e.g. after a rollback reverted their rows."""
+    _candles.clear()
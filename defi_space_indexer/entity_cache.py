@@ -0,0 +1,148 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import TypeVar
+
+from dipdup.models import Model
+
+from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+
+# Entity tables keyed by address that are read by (nearly) every event of their contract
+CACHED_MODELS: tuple[type[Model], ...] = (models.Pair, models.Farm, models.GameSession)
+
+ModelT = TypeVar('ModelT', bound=Model)
+
+# Identity map: one live instance per (model, address); handlers mutate and save that instance through
+# save_entity, so the cache stays in sync with the database without extra bookkeeping. Keyed by canonical address
+_entities: dict[type[Model], dict[str, Model]] = {model: {} for model in CACHED_MODELS}
+
+# Agents by session and agent index, as deposit, withdrawal and game over events only carry the index.
+# Every handler writing an agent goes through this map and save_entity, like the entities above
+_agents_by_index: dict[str, dict[int, models.Agent]] = {}
+
+# Game session addresses by game_session_index, as pairs, farms and faucets only carry the index
+_session_addresses: dict[int, list[str]] = {}
+
+# Entities saved while a level is being processed, flushed once each when the level ends
+_deferred_saves: ContextVar[dict[int, Model] | None] = ContextVar('deferred_saves', default=None)
+
+
+async def get_entity(model: type[ModelT], address: str) -> ModelT | None:
+    """Get an entity by address, reading the database only on the first lookup.
+
+    Args:
+        model: One of CACHED_MODELS
+        address: Contract address of the entity
+
+    Returns:
+        The cached instance, or None if the entity does not exist (misses are not cached)
+    """
+    entities = _entities[model]
+    address = normalize_address(address)
+    entity = entities.get(address)
+    if entity is None:
+        entity = await model.get_or_none(address=address)
+        if entity is not None:
+            entities[address] = entity
+    return entity  # type: ignore[return-value]
+
+
+def remember_entity(entity: Model) -> None:
+    """Add a freshly created entity to the cache."""
+    _entities[type(entity)][normalize_address(entity.address)] = entity  # type: ignore[attr-defined]
+    if isinstance(entity, models.GameSession):
+        # The session may be new to its index, or have moved to another one
+        _session_addresses.clear()
+
+
+async def get_agent_by_index(session_address: str, agent_index: int) -> models.Agent | None:
+    """Get the agent of a game session by its index, reading the database only on the first lookup.
+
+    Args:
+        session_address: Address of the game session
+        agent_index: Index of the agent in the session
+
+    Returns:
+        The cached agent, or None if the session has no agent with this index
+    """
+    session_address = normalize_address(session_address)
+    agents = _agents_by_index.setdefault(session_address, {})
+    agent = agents.get(agent_index)
+    if agent is None:
+        agent = await models.Agent.filter(session_address=session_address, agent_index=agent_index).first()
+        if agent is not None:
+            agents[agent_index] = agent
+    return agent
+
+
+async def get_session_addresses(game_session_id: int) -> list[str]:
+    """Get the game sessions a pair, farm or faucet belongs to, reading the database only on the first lookup.
+
+    Args:
+        game_session_id: game_session_id of the pair, farm or faucet
+
+    Returns:
+        list: Addresses of the sessions with this game_session_index (misses are not cached)
+    """
+    addresses = _session_addresses.get(game_session_id)
+    if addresses is None:
+        addresses = await models.GameSession.filter(game_session_index=game_session_id).values_list(
+            'address', flat=True
+        )
+        if addresses:
+            _session_addresses[game_session_id] = addresses
+    return addresses
+
+
+def remember_agent(agent: models.Agent) -> None:
+    """Add a freshly created agent to the session index map."""
+    _agents_by_index.setdefault(normalize_address(agent.session_address), {})[agent.agent_index] = agent
+
+
+def clear_entity_cache() -> None:
+    """Drop every cached entity, e.g. after a rollback reverted their rows."""
+    for entities in _entities.values():
+        entities.clear()
+    _agents_by_index.clear()
+    _session_addresses.clear()
+
+
+async def save_entity(entity: Model) -> None:
+    """Save a cached entity, or defer the save to the end of the level when saves are being coalesced.
+
+    Args:
+        entity: Instance returned by get_entity or passed to remember_entity
+    """
+    deferred = _deferred_saves.get()
+    if deferred is None:
+        await _save(entity)
+    else:
+        deferred[id(entity)] = entity
+
+
+async def _save(entity: Model) -> None:
+    await entity.save()
+    # DipDup versions a save as the diff against the data the instance was loaded with, and never moves
+    # that baseline. Cached instances outlive levels, so move it here: a rollback then restores the state
+    # of the previous level instead of the state of the first load
+    entity._original_versioned_data = entity.versioned_data
+
+
+@asynccontextmanager
+async def coalesce_entity_saves() -> AsyncIterator[None]:
+    """Coalesce save_entity calls made inside the block into a single UPDATE per entity.
+
+    Several events of a level often touch the same entity (a swap emits Swap, Sync, ReserveUpdated
+    and PriceAccumulatorUpdated for one pair). Since they share one cached instance, only the final
+    state has to be written. Deferred saves are dropped if the block raises, as the level is aborted.
+    """
+    deferred: dict[int, Model] = {}
+    token = _deferred_saves.set(deferred)
+    try:
+        yield
+    finally:
+        _deferred_saves.reset(token)
+
+    for entity in deferred.values():
+        await _save(entity)
@@ -0,0 +1,54 @@
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+import dipdup.models
+from dipdup.models import Model
+
+# Maximum number of rows per INSERT statement when flushing a buffer
+EVENT_BUFFER_BATCH_SIZE = int(os.environ.get('EVENT_BUFFER_BATCH_SIZE', '1000'))
+
+# Append-only event rows created while a level is being processed, per model in creation order
+_buffers: ContextVar[dict[type[Model], list[Model]] | None] = ContextVar('event_buffers', default=None)
+
+
+async def add_event(event: Model) -> None:
+    """Insert an append-only event row, or buffer it until the end of the level when events are being buffered.
+
+    Buffered rows get their primary key on flush, so callers must not rely on it.
+
+    Args:
+        event: Unsaved event model instance
+    """
+    buffers = _buffers.get()
+    if buffers is None:
+        await event.save()
+    else:
+        buffers.setdefault(type(event), []).append(event)
+
+
+@asynccontextmanager
+async def buffer_events() -> AsyncIterator[None]:
+    """Buffer add_event calls made inside the block and write them per model when it exits.
+
+    Rows are inserted in the order they were added, inside the level's transaction. Bulk inserts
+    do not return primary keys, which a versioned transaction needs to record each row for rollback,
+    so rows are bulk-inserted only outside versioned transactions (levels behind the rollback depth)
+    and saved one by one otherwise. Buffered rows are dropped if the block raises.
+    """
+    buffers: dict[type[Model], list[Model]] = {}
+    token = _buffers.set(buffers)
+    try:
+        yield
+    finally:
+        _buffers.reset(token)
+
+    # NOTE: Looked up on the module, as the transaction manager replaces the function when registered
+    versioned = dipdup.models.get_transaction() is not None
+    for model, events in buffers.items():
+        if versioned:
+            for event in events:
+                await event.save()
+        else:
+            await model.bulk_create(events, batch_size=EVENT_BUFFER_BATCH_SIZE)
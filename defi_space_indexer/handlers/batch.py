@@ -1,10 +1,23 @@
 from dipdup.context import HandlerContext
 from dipdup.index import MatchedHandler
 
+from defi_space_indexer.entity_cache import coalesce_entity_saves
+from defi_space_indexer.event_buffer import buffer_events
+from defi_space_indexer.scoring import track_level
+
 
 async def batch(
     ctx: HandlerContext,
     handlers: tuple[MatchedHandler, ...],
 ) -> None:
-    for handler in handlers:
-        await ctx.fire_matched_handler(handler)
+    handlers = tuple(handlers)
+    if not handlers:
+        return
+
+    # Entities touched by several events of the level are written once, after the last handler,
+    # and append-only event rows of the level are written per model, in bulk behind the rollback depth.
+    # Agents marked dirty are tagged with the level, so scoring waits for the level to be committed
+    with track_level(handlers[0].index.name, handlers[0].level):
+        async with coalesce_entity_saves(), buffer_events():
+            for handler in handlers:
+                await ctx.fire_matched_handler(handler)
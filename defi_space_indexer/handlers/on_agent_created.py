@@ -2,6 +2,11 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_agent_by_index
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import remember_agent
+from defi_space_indexer.entity_cache import save_entity
 from defi_space_indexer.types.game_session.starknet_events.agent_created import AgentCreatedPayload
 
 
@@ -11,12 +16,12 @@ async def on_agent_created(
 ) -> None:
     # Extract data from event payload
     agent_index = event.payload.agent_index
-    agent_address = f'0x{event.payload.agent_address:x}'
-    session_address = f'0x{event.payload.session_address:x}'
+    agent_address = normalize_address(event.payload.agent_address)
+    session_address = normalize_address(event.payload.session_address)
     block_timestamp = event.payload.block_timestamp
 
     # Check if game session exists
-    session = await models.GameSession.get_or_none(address=session_address)
+    session = await get_entity(models.GameSession, session_address)
     if not session:
         ctx.logger.warning(f'Game session {session_address} not found when creating agent')
         return
@@ -36,13 +41,16 @@ async def on_agent_created(
     )
 
     if not created:
+        # Update the cached instance, if any, so the cache keeps a single instance per agent
+        agent = await get_agent_by_index(session_address, agent_index) or agent
         agent.updated_at = block_timestamp
-        await agent.save()
+        await save_entity(agent)
+    remember_agent(agent)
 
-    # Update GameSession agents list if not already present
-    if agent_address not in session.agents_list:
-        session.agents_list.append(agent_address)
+    # Count the new agent on its GameSession
+    if created:
+        session.agent_count += 1
         session.updated_at = block_timestamp
-        await session.save()
+        await save_entity(session)
 
     ctx.logger.info(f'Agent created: index={agent_index}, address={agent_address}, session={session_address}')
@@ -2,6 +2,11 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_agent_by_index
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import save_entity
+from defi_space_indexer.scoring import mark_agent_dirty
 from defi_space_indexer.types.game_session.starknet_events.agent_updated import AgentUpdatedPayload
 
 
@@ -11,16 +16,16 @@ async def on_agent_updated(
 ) -> None:
     # Extract data from event payload
     agent_index = event.payload.agent_index
-    agent_address = f'0x{event.payload.agent_address:x}'
+    agent_address = normalize_address(event.payload.agent_address)
     old_total_deposited = event.payload.old_total_deposited
     new_total_deposited = event.payload.new_total_deposited
-    session_address = f'0x{event.payload.session_address:x}'
+    session_address = normalize_address(event.payload.session_address)
     block_timestamp = event.payload.block_timestamp
 
     # Check if agent exists
-    agent = await models.Agent.get_or_none(address=agent_address, session_address=session_address)
+    agent = await get_agent_by_index(session_address, agent_index)
 
-    if not agent:
+    if not agent or agent.address != agent_address:
         ctx.logger.warning(
             f'Agent {agent_address} with index {agent_index} in session {session_address} not found when updating'
         )
@@ -29,13 +34,14 @@ async def on_agent_updated(
     # Update the agent's total_deposited value
     agent.total_deposited = new_total_deposited
     agent.updated_at = block_timestamp
-    await agent.save()
+    await save_entity(agent)
+    mark_agent_dirty(agent_address, session_address)
 
     # Also update the session's updated_at timestamp
-    session = await models.GameSession.get_or_none(address=session_address)
+    session = await get_entity(models.GameSession, session_address)
     if session:
         session.updated_at = block_timestamp
-        await session.save()
+        await save_entity(session)
 
     ctx.logger.info(
         f'Agent updated: index={agent_index}, address={agent_address}, '
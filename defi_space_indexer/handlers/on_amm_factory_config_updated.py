@@ -2,6 +2,8 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.event_buffer import add_event
 from defi_space_indexer.types.amm_factory.starknet_events.config_updated import ConfigUpdatedPayload
 
 
@@ -13,7 +15,7 @@ async def on_amm_factory_config_updated(
     field_name = event.payload.field_name
     old_value = event.payload.old_value
     new_value = event.payload.new_value
-    factory_address = f'0x{event.payload.factory_address:x}'
+    factory_address = normalize_address(event.payload.factory_address)
     block_timestamp = event.payload.block_timestamp
 
     # Get factory from database
@@ -27,27 +29,26 @@ async def on_amm_factory_config_updated(
 
     # Update the appropriate field in the AmmFactory model based on field_name
     if field_name_str == 'owner':
-        factory.owner = f'0x{new_value:x}'
+        factory.owner = normalize_address(new_value)
     elif field_name_str == 'fee_to':
-        factory.fee_to = f'0x{new_value:x}'
+        factory.fee_to = normalize_address(new_value)
     elif field_name_str == 'pair_contract_class_hash':
-        factory.pair_contract_class_hash = f'0x{new_value:x}'
+        factory.pair_contract_class_hash = normalize_address(new_value)
     elif field_name_str == 'game_session_id':
         factory.game_session_id = int(new_value)
     # Add other fields as needed
 
-    # Update the config history
-    if not factory.config_history:
-        factory.config_history = []
-
     # Add the change to the config history
-    factory.config_history.append(
-        {
-            'field': field_name_str,
-            'old_value': f'0x{old_value:x}',
-            'new_value': f'0x{new_value:x}',
-            'timestamp': block_timestamp,
-        }
+    await add_event(
+        models.ConfigChange(
+            transaction_hash=event.data.transaction_hash,
+            created_at=block_timestamp,
+            entity_type=models.ConfigEntityType.AMM_FACTORY,
+            entity_address=factory.address,
+            field=field_name_str,
+            old_value=normalize_address(old_value),
+            new_value=normalize_address(new_value),
+        )
     )
 
     # Update the timestamp
@@ -58,5 +59,5 @@ async def on_amm_factory_config_updated(
 
     ctx.logger.info(
         f'AmmFactory config updated: {factory_address}, field={field_name_str}, '
-        f'old_value=0x{old_value:x}, new_value=0x{new_value:x}'
+        f'old_value={normalize_address(old_value)}, new_value={normalize_address(new_value)}'
     )
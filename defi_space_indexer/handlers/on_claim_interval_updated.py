@@ -2,6 +2,7 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
 from defi_space_indexer.types.faucet.starknet_events.claim_interval_updated import ClaimIntervalUpdatedPayload
 
 
@@ -15,7 +16,7 @@ async def on_claim_interval_updated(
     block_timestamp = event.payload.block_timestamp
 
     # Get the faucet address from the event data
-    faucet_address = event.data.from_address
+    faucet_address = normalize_address(event.data.from_address)
 
     # Get faucet from database
     faucet = await models.Faucet.get_or_none(address=faucet_address)
@@ -2,6 +2,7 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
 from defi_space_indexer.types.faucet.starknet_events.config_updated import ConfigUpdatedPayload
 
 
@@ -13,7 +14,7 @@ async def on_config_updated(
     field_name = event.payload.field_name
     old_value = event.payload.old_value
     new_value = event.payload.new_value
-    faucet_address = f'0x{event.payload.faucet_address:x}'
+    faucet_address = normalize_address(event.payload.faucet_address)
     block_timestamp = event.payload.block_timestamp
 
     # Get faucet from database
@@ -27,7 +28,7 @@ async def on_config_updated(
 
     # Update the appropriate field in the Faucet model based on field_name
     if field_name_str == 'owner':
-        faucet.owner = f'0x{new_value:x}'
+        faucet.owner = normalize_address(new_value)
     elif field_name_str == 'game_session_id':
         faucet.game_session_id = int(new_value)
     # Add other fields as needed
@@ -40,5 +41,5 @@ async def on_config_updated(
 
     ctx.logger.info(
         f'Faucet config updated: {faucet_address}, field={field_name_str}, '
-        f'old_value=0x{old_value:x}, new_value=0x{new_value:x}'
+        f'old_value={normalize_address(old_value)}, new_value={normalize_address(new_value)}'
     )
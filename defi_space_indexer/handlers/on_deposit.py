@@ -2,6 +2,11 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import save_entity
+from defi_space_indexer.event_buffer import add_event
+from defi_space_indexer.scoring import mark_game_agent_dirty
 from defi_space_indexer.types.farming_farm.starknet_events.deposit import DepositPayload
 
 
@@ -10,7 +15,7 @@ async def on_deposit(
     event: StarknetEvent[DepositPayload],
 ) -> None:
     # Extract data from event payload
-    user_address = f'0x{event.payload.user_address:x}'
+    user_address = normalize_address(event.payload.user_address)
     staked_amount = event.payload.staked_amount
     total_staked = event.payload.total_staked
     user_staked = event.payload.user_staked
@@ -19,11 +24,11 @@ async def on_deposit(
     block_timestamp = event.payload.block_timestamp
 
     # Get farm address from event data
-    farm_address = event.data.from_address
+    farm_address = normalize_address(event.data.from_address)
     transaction_hash = event.data.transaction_hash
 
     # Get farm from database
-    farm = await models.Farm.get_or_none(address=farm_address)
+    farm = await get_entity(models.Farm, farm_address)
     if not farm:
         ctx.logger.warning(f'Farm {farm_address} not found when processing deposit event')
         return
@@ -32,7 +37,7 @@ async def on_deposit(
     farm.total_staked = total_staked
     farm.multiplier = multiplier
     farm.updated_at = block_timestamp
-    await farm.save()
+    await save_entity(farm)
 
     # Get or create agent stake
     agent_stake, created = await models.AgentStake.get_or_create(
@@ -41,8 +46,6 @@ async def on_deposit(
         defaults={
             'staked_amount': 0,
             'penalty_end_time': 0,
-            'reward_per_token_paid': {},
-            'rewards': {},
             'created_at': block_timestamp,
             'updated_at': block_timestamp,
             'farm': farm,
@@ -54,16 +57,19 @@ async def on_deposit(
     agent_stake.penalty_end_time = penalty_end_time
     agent_stake.updated_at = block_timestamp
     await agent_stake.save()
+    await mark_game_agent_dirty(user_address, farm.game_session_id)
 
     # Create agent stake event
-    await models.AgentStakeEvent.create(
-        transaction_hash=transaction_hash,
-        created_at=block_timestamp,
-        event_type=models.StakeEventType.DEPOSIT,
-        agent_address=user_address,
-        staked_amount=staked_amount,
-        farm=farm,
-        stake=agent_stake,
+    await add_event(
+        models.AgentStakeEvent(
+            transaction_hash=transaction_hash,
+            created_at=block_timestamp,
+            event_type=models.StakeEventType.DEPOSIT,
+            agent_address=user_address,
+            staked_amount=staked_amount,
+            farm=farm,
+            stake=agent_stake,
+        )
     )
 
     ctx.logger.info(
@@ -2,6 +2,11 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_agent_by_index
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import save_entity
+from defi_space_indexer.event_buffer import add_event
 from defi_space_indexer.types.game_session.starknet_events.emergency_withdraw import EmergencyWithdrawPayload
 
 
@@ -10,23 +15,23 @@ async def on_emergency_withdraw(
     event: StarknetEvent[EmergencyWithdrawPayload],
 ) -> None:
     # Extract data from event payload
-    user_address = f'0x{event.payload.user:x}'
+    user_address = normalize_address(event.payload.user)
     amount = event.payload.amount
     block_timestamp = event.payload.block_timestamp
 
     # Get session address from event data
-    session_address = event.data.from_address
+    session_address = normalize_address(event.data.from_address)
     transaction_hash = event.data.transaction_hash
 
     # Get game session from database
-    session = await models.GameSession.get_or_none(address=session_address)
+    session = await get_entity(models.GameSession, session_address)
     if not session:
         ctx.logger.warning(f'Game session {session_address} not found when processing emergency withdrawal')
         return
 
     # Update session timestamp
     session.updated_at = block_timestamp
-    await session.save()
+    await save_entity(session)
 
     # Get all user deposits for this user in this session
     user_deposits = await models.UserDeposit.filter(user_address=user_address, session_address=session_address)
@@ -48,28 +53,23 @@ async def on_emergency_withdraw(
         # Update agent's updated_at timestamp but don't modify total_deposited
         # total_deposited is handled by the on_agent_updated handler
         for agent_index in agent_indexes:
-            # Find the agent by index in the session's agents list
-            agent = None
-            for agent_address in session.agents_list:
-                agent_obj = await models.Agent.get_or_none(address=agent_address, session_address=session_address)
-                if agent_obj and agent_obj.agent_index == agent_index:
-                    agent = agent_obj
-                    break
-
+            agent = await get_agent_by_index(session_address, agent_index)
             if agent:
                 # Update timestamp only
                 agent.updated_at = block_timestamp
-                await agent.save()
+                await save_entity(agent)
                 ctx.logger.info(f'Updated timestamp for agent with index={agent_index}, session={session_address}')
 
     # Create game event record for tracking
-    await models.GameEvent.create(
-        transaction_hash=transaction_hash,
-        created_at=block_timestamp,
-        event_type=models.GameEventType.EMERGENCY_WITHDRAW,
-        user_address=user_address,
-        amount=amount,
-        session=session,
+    await add_event(
+        models.GameEvent(
+            transaction_hash=transaction_hash,
+            created_at=block_timestamp,
+            event_type=models.GameEventType.EMERGENCY_WITHDRAW,
+            user_address=user_address,
+            amount=amount,
+            session=session,
+        )
     )
 
     ctx.logger.info(f'Emergency withdraw processed: user={user_address}, session={session_address}, amount={amount}')
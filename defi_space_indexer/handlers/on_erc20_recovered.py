@@ -2,6 +2,9 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import save_entity
 from defi_space_indexer.types.farming_farm.starknet_events.erc20_recovered import ERC20RecoveredPayload
 
 
@@ -10,23 +13,23 @@ async def on_erc20_recovered(
     event: StarknetEvent[ERC20RecoveredPayload],
 ) -> None:
     # Extract data from event payload
-    token_address = f'0x{event.payload.token_address:x}'
+    token_address = normalize_address(event.payload.token_address)
     token_amount = event.payload.token_amount
-    recipient_address = f'0x{event.payload.to:x}'
+    recipient_address = normalize_address(event.payload.to)
     block_timestamp = event.payload.block_timestamp
 
     # Get farm address from event data
-    farm_address = event.data.from_address
+    farm_address = normalize_address(event.data.from_address)
 
     # Get farm from database
-    farm = await models.Farm.get_or_none(address=farm_address)
+    farm = await get_entity(models.Farm, farm_address)
     if not farm:
         ctx.logger.warning(f'Farm {farm_address} not found when processing ERC20 recovery')
         return
 
     # Update farm timestamp
     farm.updated_at = block_timestamp
-    await farm.save()
+    await save_entity(farm)
 
     # Log the recovery event
     ctx.logger.info(
@@ -2,6 +2,7 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
 from defi_space_indexer.types.amm_factory.starknet_events.factory_initialized import FactoryInitializedPayload
 
 
@@ -10,10 +11,10 @@ async def on_factory_initialized(
     event: StarknetEvent[FactoryInitializedPayload],
 ) -> None:
     # Extract data from event payload
-    factory_address = f'0x{event.payload.factory_address:x}'
-    owner = f'0x{event.payload.owner:x}'
-    fee_to = f'0x{event.payload.fee_to:x}'
-    pair_contract_class_hash = f'0x{event.payload.pair_contract_class_hash:x}'
+    factory_address = normalize_address(event.payload.factory_address)
+    owner = normalize_address(event.payload.owner)
+    fee_to = normalize_address(event.payload.fee_to)
+    pair_contract_class_hash = normalize_address(event.payload.pair_contract_class_hash)
     block_timestamp = event.payload.block_timestamp
 
     # Check if factory already exists
@@ -34,7 +35,6 @@ async def on_factory_initialized(
         fee_to=fee_to,
         pair_contract_class_hash=pair_contract_class_hash,
         num_of_pairs=0,
-        config_history=[],
         created_at=block_timestamp,
         updated_at=block_timestamp,
     )
@@ -2,6 +2,8 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.event_buffer import add_event
 from defi_space_indexer.types.farming_factory.starknet_events.farm_class_hash_updated import FarmClassHashUpdatedPayload
 
 
@@ -10,9 +12,9 @@ async def on_farm_class_hash_updated(
     event: StarknetEvent[FarmClassHashUpdatedPayload],
 ) -> None:
     # Extract data from event payload
-    old_hash = f'0x{event.payload.old_hash:x}'
-    new_hash = f'0x{event.payload.new_hash:x}'
-    farm_factory_address = f'0x{event.payload.farm_factory:x}'
+    old_hash = normalize_address(event.payload.old_hash)
+    new_hash = normalize_address(event.payload.new_hash)
+    farm_factory_address = normalize_address(event.payload.farm_factory)
     block_timestamp = event.payload.block_timestamp
 
     # Get farm factory from database
@@ -25,13 +27,17 @@ async def on_farm_class_hash_updated(
     farm_factory.farm_class_hash = new_hash
     farm_factory.updated_at = block_timestamp
 
-    # Update or initialize the config_history field
-    if not farm_factory.config_history:
-        farm_factory.config_history = []
-
     # Add the change to config history
-    farm_factory.config_history.append(
-        {'field': 'farm_class_hash', 'old_value': old_hash, 'new_value': new_hash, 'timestamp': block_timestamp}
+    await add_event(
+        models.ConfigChange(
+            transaction_hash=event.data.transaction_hash,
+            created_at=block_timestamp,
+            entity_type=models.ConfigEntityType.FARM_FACTORY,
+            entity_address=farm_factory.address,
+            field='farm_class_hash',
+            old_value=old_hash,
+            new_value=new_hash,
+        )
     )
 
     # Save the changes
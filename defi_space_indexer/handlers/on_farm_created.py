@@ -2,8 +2,12 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import remember_entity
+from defi_space_indexer.entity_cache import save_entity
 from defi_space_indexer.types.farming_factory.starknet_events.farm_created import FarmCreatedPayload
-from defi_space_indexer.utils import get_token_info
+from defi_space_indexer.utils import get_cached_token_info
 
 
 async def on_farm_created(
@@ -11,20 +15,20 @@ async def on_farm_created(
     event: StarknetEvent[FarmCreatedPayload],
 ) -> None:
     # Extract data from event payload
-    factory_address = f'0x{event.payload.farm_factory:x}'
-    lp_token_address = f'0x{event.payload.lp_token:x}'
-    farm_address = f'0x{event.payload.farm:x}'
+    factory_address = normalize_address(event.payload.farm_factory)
+    lp_token_address = normalize_address(event.payload.lp_token)
+    farm_address = normalize_address(event.payload.farm)
     farm_index = event.payload.farm_index
     game_session_id = event.payload.game_session_id
     block_timestamp = event.payload.block_timestamp
     penalty_duration = event.payload.penalty_duration
     withdraw_penalty = event.payload.withdraw_penalty
     multiplier = event.payload.multiplier
-    penalty_receiver = f'0x{event.payload.penalty_receiver:x}'
+    penalty_receiver = normalize_address(event.payload.penalty_receiver)
 
     # Get transaction hash from event data
 
-    lp_token_name, lp_token_symbol, _ = await get_token_info(lp_token_address)
+    lp_token_name, lp_token_symbol, _ = await get_cached_token_info(lp_token_address)
 
     # Get the farm factory from the database
     farm_factory = await models.FarmFactory.get_or_none(address=factory_address)
@@ -33,7 +37,7 @@ async def on_farm_created(
         return
 
     # Check if the farm already exists
-    farm = await models.Farm.get_or_none(address=farm_address)
+    farm = await get_entity(models.Farm, farm_address)
     if farm:
         ctx.logger.info(f'Farm {farm_address} already exists, updating details')
         farm.factory_address = factory_address
@@ -44,7 +48,7 @@ async def on_farm_created(
         farm.multiplier = multiplier
         farm.penalty_receiver = penalty_receiver
         farm.updated_at = block_timestamp
-        await farm.save()
+        await save_entity(farm)
         return
 
     # Create contract and index for the new farm
@@ -68,7 +72,6 @@ async def on_farm_created(
         withdraw_penalty=withdraw_penalty,
         penalty_receiver=penalty_receiver,
         authorized_rewarders={},
-        config_history=[],
         active_rewards={},
         reward_tokens=[],
         lp_token_name=lp_token_name,
@@ -78,6 +81,7 @@ async def on_farm_created(
         updated_at=block_timestamp,
         factory=farm_factory,
     )
+    remember_entity(farm)
 
     # Update farm count on the factory
     farm_factory.farm_count += 1
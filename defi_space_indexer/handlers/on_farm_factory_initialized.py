@@ -2,6 +2,7 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
 from defi_space_indexer.types.farming_factory.starknet_events.farm_factory_initialized import (
     FarmFactoryInitializedPayload,
 )
@@ -12,9 +13,9 @@ async def on_farm_factory_initialized(
     event: StarknetEvent[FarmFactoryInitializedPayload],
 ) -> None:
     # Extract data from event payload
-    farm_factory_address = f'0x{event.payload.farm_factory:x}'
-    owner = f'0x{event.payload.owner:x}'
-    farm_class_hash = f'0x{event.payload.farm_class_hash:x}'
+    farm_factory_address = normalize_address(event.payload.farm_factory)
+    owner = normalize_address(event.payload.owner)
+    farm_class_hash = normalize_address(event.payload.farm_class_hash)
     block_timestamp = event.payload.block_timestamp
 
     # Check if farm factory already exists
@@ -33,7 +34,6 @@ async def on_farm_factory_initialized(
         owner=owner,
         farm_class_hash=farm_class_hash,
         farm_count=0,
-        config_history=[],
         created_at=block_timestamp,
         updated_at=block_timestamp,
     )
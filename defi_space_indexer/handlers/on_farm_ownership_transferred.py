@@ -2,6 +2,10 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import save_entity
+from defi_space_indexer.event_buffer import add_event
 from defi_space_indexer.types.farming_farm.starknet_events.ownership_transferred import OwnershipTransferredPayload
 
 
@@ -10,15 +14,15 @@ async def on_farm_ownership_transferred(
     event: StarknetEvent[OwnershipTransferredPayload],
 ) -> None:
     # Extract data from event payload
-    previous_owner = f'0x{event.payload.previous_owner:x}'
-    new_owner = f'0x{event.payload.new_owner:x}'
+    previous_owner = normalize_address(event.payload.previous_owner)
+    new_owner = normalize_address(event.payload.new_owner)
     block_timestamp = event.payload.block_timestamp
 
     # Get farm address from event data
-    farm_address = event.data.from_address
+    farm_address = normalize_address(event.data.from_address)
 
     # Get farm from database
-    farm = await models.Farm.get_or_none(address=farm_address)
+    farm = await get_entity(models.Farm, farm_address)
     if not farm:
         ctx.logger.warning(f'Farm {farm_address} not found when transferring ownership')
         return
@@ -27,17 +31,21 @@ async def on_farm_ownership_transferred(
     farm.owner = new_owner
     farm.updated_at = block_timestamp
 
-    # Update or initialize the config_history field
-    if not farm.config_history:
-        farm.config_history = []
-
     # Add the ownership change to config history
-    farm.config_history.append(
-        {'field': 'owner', 'old_value': previous_owner, 'new_value': new_owner, 'timestamp': block_timestamp}
+    await add_event(
+        models.ConfigChange(
+            transaction_hash=event.data.transaction_hash,
+            created_at=block_timestamp,
+            entity_type=models.ConfigEntityType.FARM,
+            entity_address=farm.address,
+            field='owner',
+            old_value=previous_owner,
+            new_value=new_owner,
+        )
     )
 
     # Save the changes
-    await farm.save()
+    await save_entity(farm)
 
     ctx.logger.info(
         f'Farm ownership transferred: farm={farm_address}, previous_owner={previous_owner}, new_owner={new_owner}'
@@ -2,6 +2,8 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.event_buffer import add_event
 from defi_space_indexer.types.faucet_factory.starknet_events.faucet_class_hash_updated import (
     FaucetClassHashUpdatedPayload,
 )
@@ -12,9 +14,9 @@ async def on_faucet_class_hash_updated(
     event: StarknetEvent[FaucetClassHashUpdatedPayload],
 ) -> None:
     # Extract data from the event
-    factory_address = f'0x{event.payload.faucet_factory:x}'
-    old_hash = f'0x{event.payload.old_hash:x}'
-    new_hash = f'0x{event.payload.new_hash:x}'
+    factory_address = normalize_address(event.payload.faucet_factory)
+    old_hash = normalize_address(event.payload.old_hash)
+    new_hash = normalize_address(event.payload.new_hash)
     block_timestamp = event.payload.block_timestamp
 
     # Update the factory model
@@ -26,13 +28,16 @@ async def on_faucet_class_hash_updated(
         return
 
     # Log the class hash change in the config history
-    factory.config_history.append(
-        {
-            'field': 'faucet_class_hash',
-            'old_value': factory.faucet_class_hash,
-            'new_value': new_hash,
-            'timestamp': block_timestamp,
-        }
+    await add_event(
+        models.ConfigChange(
+            transaction_hash=event.data.transaction_hash,
+            created_at=block_timestamp,
+            entity_type=models.ConfigEntityType.FAUCET_FACTORY,
+            entity_address=factory.address,
+            field='faucet_class_hash',
+            old_value=factory.faucet_class_hash,
+            new_value=new_hash,
+        )
     )
 
     # Update the class hash
@@ -2,6 +2,8 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.event_buffer import add_event
 from defi_space_indexer.types.faucet.starknet_events.config_updated import ConfigUpdatedPayload
 
 
@@ -13,7 +15,7 @@ async def on_faucet_config_updated(
     field_name = event.payload.field_name
     old_value = event.payload.old_value
     new_value = event.payload.new_value
-    faucet_address = f'0x{event.payload.faucet_address:x}'
+    faucet_address = normalize_address(event.payload.faucet_address)
     block_timestamp = event.payload.block_timestamp
 
     # Get faucet from database
@@ -27,7 +29,7 @@ async def on_faucet_config_updated(
 
     # Update the appropriate field in the Faucet model based on field_name
     if field_name_str == 'owner':
-        faucet.owner = f'0x{new_value:x}'
+        faucet.owner = normalize_address(new_value)
     elif field_name_str == 'claim_interval':
         # Use string representation for large integers to avoid overflow
         faucet.claim_interval = str(new_value)
@@ -36,25 +38,24 @@ async def on_faucet_config_updated(
         faucet.game_session_id = int(new_value) if int(new_value) < 2**31 else None
     # Add other fields as needed
 
-    # Update or initialize the config_history field
-    if not faucet.config_history:
-        faucet.config_history = []
-
     # Format values based on field type
     old_value_formatted = str(old_value)
     new_value_formatted = str(new_value)
     if field_name_str in ['owner']:
-        old_value_formatted = f'0x{old_value:x}'
-        new_value_formatted = f'0x{new_value:x}'
+        old_value_formatted = normalize_address(old_value)
+        new_value_formatted = normalize_address(new_value)
 
     # Add the change to config history
-    faucet.config_history.append(
-        {
-            'field': field_name_str,
-            'old_value': old_value_formatted,
-            'new_value': new_value_formatted,
-            'timestamp': block_timestamp,
-        }
+    await add_event(
+        models.ConfigChange(
+            transaction_hash=event.data.transaction_hash,
+            created_at=block_timestamp,
+            entity_type=models.ConfigEntityType.FAUCET,
+            entity_address=faucet.address,
+            field=field_name_str,
+            old_value=old_value_formatted,
+            new_value=new_value_formatted,
+        )
     )
 
     # Update the timestamp
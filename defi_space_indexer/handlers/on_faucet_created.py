@@ -2,6 +2,7 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
 from defi_space_indexer.types.faucet_factory.starknet_events.faucet_created import FaucetCreatedPayload
 
 
@@ -10,8 +11,8 @@ async def on_faucet_created(
     event: StarknetEvent[FaucetCreatedPayload],
 ) -> None:
     # Extract data from the event
-    faucet_address = f'0x{event.payload.faucet:x}'
-    factory_address = f'0x{event.payload.faucet_factory:x}'
+    faucet_address = normalize_address(event.payload.faucet)
+    factory_address = normalize_address(event.payload.faucet_factory)
     claim_interval = event.payload.claim_interval
     faucet_index = event.payload.faucet_index
     block_timestamp = event.payload.block_timestamp
@@ -43,7 +44,6 @@ async def on_faucet_created(
         claim_interval=claim_interval,
         game_session_id=game_session_id,
         tokens_list=[],
-        config_history=[],
         created_at=block_timestamp,
         updated_at=block_timestamp,
     )
@@ -2,6 +2,8 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.event_buffer import add_event
 from defi_space_indexer.types.faucet_factory.starknet_events.config_updated import ConfigUpdatedPayload
 
 
@@ -10,7 +12,7 @@ async def on_faucet_factory_config_updated(
     event: StarknetEvent[ConfigUpdatedPayload],
 ) -> None:
     # Extract data from the event
-    factory_address = f'0x{event.payload.faucet_factory:x}'
+    factory_address = normalize_address(event.payload.faucet_factory)
     field_name = event.payload.field_name
     old_value = event.payload.old_value
     new_value = event.payload.new_value
@@ -23,13 +25,16 @@ async def on_faucet_factory_config_updated(
         return
 
     # Log the config change in the history
-    factory.config_history.append(
-        {
-            'field': field_name,
-            'old_value': old_value,
-            'new_value': new_value,
-            'timestamp': block_timestamp,
-        }
+    await add_event(
+        models.ConfigChange(
+            transaction_hash=event.data.transaction_hash,
+            created_at=block_timestamp,
+            entity_type=models.ConfigEntityType.FAUCET_FACTORY,
+            entity_address=factory.address,
+            field=str(field_name),
+            old_value=str(old_value),
+            new_value=str(new_value),
+        )
     )
 
     # Update the specific field if it's a tracked field
@@ -2,6 +2,7 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
 from defi_space_indexer.types.faucet_factory.starknet_events.faucet_factory_initialized import (
     FaucetFactoryInitializedPayload,
 )
@@ -12,9 +13,9 @@ async def on_faucet_factory_initialized(
     event: StarknetEvent[FaucetFactoryInitializedPayload],
 ) -> None:
     # Extract data from the event
-    faucet_factory_address = f'0x{event.payload.faucet_factory:x}'
-    owner = f'0x{event.payload.owner:x}'
-    faucet_class_hash = f'0x{event.payload.faucet_class_hash:x}'
+    faucet_factory_address = normalize_address(event.payload.faucet_factory)
+    owner = normalize_address(event.payload.owner)
+    faucet_class_hash = normalize_address(event.payload.faucet_class_hash)
     block_timestamp = event.payload.block_timestamp
 
     # Create a new FaucetFactory model
@@ -24,7 +25,6 @@ async def on_faucet_factory_initialized(
         faucet_class_hash=faucet_class_hash,
         faucet_count=0,
         game_session_id=0,  # Default to 0 until set
-        config_history=[],
         created_at=block_timestamp,
         updated_at=block_timestamp,
     )
@@ -2,6 +2,8 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.event_buffer import add_event
 from defi_space_indexer.types.faucet_factory.starknet_events.ownership_transferred import OwnershipTransferredPayload
 
 
@@ -10,9 +12,9 @@ async def on_faucet_factory_ownership_transferred(
     event: StarknetEvent[OwnershipTransferredPayload],
 ) -> None:
     # Extract data from the event
-    factory_address = f'0x{event.payload.faucet_factory:x}'
-    previous_owner = f'0x{event.payload.previous_owner:x}'
-    new_owner = f'0x{event.payload.new_owner:x}'
+    factory_address = normalize_address(event.payload.faucet_factory)
+    previous_owner = normalize_address(event.payload.previous_owner)
+    new_owner = normalize_address(event.payload.new_owner)
     block_timestamp = event.payload.block_timestamp
 
     # Update the factory model
@@ -24,13 +26,16 @@ async def on_faucet_factory_ownership_transferred(
         return
 
     # Log the ownership change in the config history
-    factory.config_history.append(
-        {
-            'field': 'owner',
-            'old_value': factory.owner,
-            'new_value': new_owner,
-            'timestamp': block_timestamp,
-        }
+    await add_event(
+        models.ConfigChange(
+            transaction_hash=event.data.transaction_hash,
+            created_at=block_timestamp,
+            entity_type=models.ConfigEntityType.FAUCET_FACTORY,
+            entity_address=factory.address,
+            field='owner',
+            old_value=factory.owner,
+            new_value=new_owner,
+        )
     )
 
     # Update the owner
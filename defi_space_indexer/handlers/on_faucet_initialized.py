@@ -2,6 +2,7 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
 from defi_space_indexer.types.faucet.starknet_events.faucet_initialized import FaucetInitializedPayload
 
 
@@ -10,8 +11,8 @@ async def on_faucet_initialized(
     event: StarknetEvent[FaucetInitializedPayload],
 ) -> None:
     # Extract data from event payload
-    faucet_address = f'0x{event.payload.faucet_address:x}'
-    owner = f'0x{event.payload.owner:x}'
+    faucet_address = normalize_address(event.payload.faucet_address)
+    owner = normalize_address(event.payload.owner)
     claim_interval = event.payload.claim_interval
     game_session_id = event.payload.game_session_id
     block_timestamp = event.payload.block_timestamp
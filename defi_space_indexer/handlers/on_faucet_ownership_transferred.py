@@ -2,6 +2,7 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
 from defi_space_indexer.types.faucet.starknet_events.ownership_transferred import OwnershipTransferredPayload
 
 
@@ -10,12 +11,12 @@ async def on_faucet_ownership_transferred(
     event: StarknetEvent[OwnershipTransferredPayload],
 ) -> None:
     # Extract data from event payload
-    previous_owner = f'0x{event.payload.previous_owner:x}'
-    new_owner = f'0x{event.payload.new_owner:x}'
+    previous_owner = normalize_address(event.payload.previous_owner)
+    new_owner = normalize_address(event.payload.new_owner)
     block_timestamp = event.payload.block_timestamp
 
     # Get faucet address from event data
-    faucet_address = event.data.from_address
+    faucet_address = normalize_address(event.data.from_address)
 
     # Get faucet from database
     faucet = await models.Faucet.get_or_none(address=faucet_address)
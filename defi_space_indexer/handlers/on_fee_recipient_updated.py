@@ -2,6 +2,10 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import save_entity
+from defi_space_indexer.event_buffer import add_event
 from defi_space_indexer.types.game_session.starknet_events.fee_recipient_updated import FeeRecipientUpdatedPayload
 
 
@@ -10,15 +14,15 @@ async def on_fee_recipient_updated(
     event: StarknetEvent[FeeRecipientUpdatedPayload],
 ) -> None:
     # Extract data from event payload
-    previous_recipient = f'0x{event.payload.previous_recipient:x}'
-    new_recipient = f'0x{event.payload.new_recipient:x}'
+    previous_recipient = normalize_address(event.payload.previous_recipient)
+    new_recipient = normalize_address(event.payload.new_recipient)
     block_timestamp = event.payload.block_timestamp
 
     # Get game session address from event data
-    session_address = event.data.from_address
+    session_address = normalize_address(event.data.from_address)
 
     # Get game session from database
-    session = await models.GameSession.get_or_none(address=session_address)
+    session = await get_entity(models.GameSession, session_address)
     if not session:
         ctx.logger.warning(f'Game session {session_address} not found when updating fee recipient')
         return
@@ -27,22 +31,21 @@ async def on_fee_recipient_updated(
     session.fee_recipient = new_recipient
     session.updated_at = block_timestamp
 
-    # Update or initialize the config_history field
-    if not session.config_history:
-        session.config_history = []
-
     # Add the fee recipient change to config history
-    session.config_history.append(
-        {
-            'field': 'fee_recipient',
-            'old_value': previous_recipient,
-            'new_value': new_recipient,
-            'timestamp': block_timestamp,
-        }
+    await add_event(
+        models.ConfigChange(
+            transaction_hash=event.data.transaction_hash,
+            created_at=block_timestamp,
+            entity_type=models.ConfigEntityType.GAME_SESSION,
+            entity_address=session.address,
+            field='fee_recipient',
+            old_value=previous_recipient,
+            new_value=new_recipient,
+        )
     )
 
     # Save the changes
-    await session.save()
+    await save_entity(session)
 
     ctx.logger.info(
         f'Game session fee recipient updated: session={session_address}, '
@@ -2,6 +2,8 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.event_buffer import add_event
 from defi_space_indexer.types.amm_factory.starknet_events.fees_receiver_updated import FeesReceiverUpdatedPayload
 
 
@@ -10,9 +12,9 @@ async def on_fees_receiver_updated(
     event: StarknetEvent[FeesReceiverUpdatedPayload],
 ) -> None:
     # Extract data from event payload
-    previous_fee_to = f'0x{event.payload.previous_fee_to:x}'
-    new_fee_to = f'0x{event.payload.new_fee_to:x}'
-    factory_address = f'0x{event.payload.factory_address:x}'
+    previous_fee_to = normalize_address(event.payload.previous_fee_to)
+    new_fee_to = normalize_address(event.payload.new_fee_to)
+    factory_address = normalize_address(event.payload.factory_address)
     block_timestamp = event.payload.block_timestamp
 
     # Get factory from database
@@ -25,13 +27,17 @@ async def on_fees_receiver_updated(
     factory.fee_to = new_fee_to
     factory.updated_at = block_timestamp
 
-    # Update or initialize the config_history field
-    if not factory.config_history:
-        factory.config_history = []
-
     # Add the fee receiver change to config history
-    factory.config_history.append(
-        {'field': 'fee_to', 'old_value': previous_fee_to, 'new_value': new_fee_to, 'timestamp': block_timestamp}
+    await add_event(
+        models.ConfigChange(
+            transaction_hash=event.data.transaction_hash,
+            created_at=block_timestamp,
+            entity_type=models.ConfigEntityType.AMM_FACTORY,
+            entity_address=factory.address,
+            field='fee_to',
+            old_value=previous_fee_to,
+            new_value=new_fee_to,
+        )
     )
 
     # Save the changes
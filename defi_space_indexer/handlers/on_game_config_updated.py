@@ -2,6 +2,10 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import save_entity
+from defi_space_indexer.event_buffer import add_event
 from defi_space_indexer.types.game_session.starknet_events.config_updated import ConfigUpdatedPayload
 
 
@@ -13,11 +17,11 @@ async def on_game_config_updated(
     field_name = event.payload.field_name
     old_value = event.payload.old_value
     new_value = event.payload.new_value
-    session_address = f'0x{event.payload.session_address:x}'
+    session_address = normalize_address(event.payload.session_address)
     block_timestamp = event.payload.block_timestamp
 
     # Get game session from database
-    session = await models.GameSession.get_or_none(address=session_address)
+    session = await get_entity(models.GameSession, session_address)
     if not session:
         ctx.logger.warning(f'Game session {session_address} not found when updating config')
         return
@@ -31,35 +35,34 @@ async def on_game_config_updated(
     elif field_name_str == 'platform_fee_percentage':
         session.platform_fee_percentage = int(new_value)
     elif field_name_str == 'fee_recipient':
-        session.fee_recipient = f'0x{new_value:x}'
+        session.fee_recipient = normalize_address(new_value)
     # Add other fields as needed
 
-    # Update or initialize the config_history field
-    if not session.config_history:
-        session.config_history = []
-
     # Format values based on field type
-    old_value_formatted = old_value
-    new_value_formatted = new_value
+    old_value_formatted = str(old_value)
+    new_value_formatted = str(new_value)
     if field_name_str in ['fee_recipient']:
-        old_value_formatted = f'0x{old_value:x}'
-        new_value_formatted = f'0x{new_value:x}'
+        old_value_formatted = normalize_address(old_value)
+        new_value_formatted = normalize_address(new_value)
 
     # Add the change to config history
-    session.config_history.append(
-        {
-            'field': field_name_str,
-            'old_value': old_value_formatted,
-            'new_value': new_value_formatted,
-            'timestamp': block_timestamp,
-        }
+    await add_event(
+        models.ConfigChange(
+            transaction_hash=event.data.transaction_hash,
+            created_at=block_timestamp,
+            entity_type=models.ConfigEntityType.GAME_SESSION,
+            entity_address=session.address,
+            field=field_name_str,
+            old_value=old_value_formatted,
+            new_value=new_value_formatted,
+        )
     )
 
     # Update the timestamp
     session.updated_at = block_timestamp
 
     # Save the updated session model
-    await session.save()
+    await save_entity(session)
 
     ctx.logger.info(
         f'Game session config updated: {session_address}, field={field_name_str}, '
@@ -2,6 +2,8 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.event_buffer import add_event
 from defi_space_indexer.types.game_factory.starknet_events.config_updated import ConfigUpdatedPayload
 
 
@@ -13,7 +15,7 @@ async def on_game_factory_config_updated(
     field_name = event.payload.field_name
     old_value = event.payload.old_value
     new_value = event.payload.new_value
-    factory_address = f'0x{event.payload.factory_address:x}'
+    factory_address = normalize_address(event.payload.factory_address)
     block_timestamp = event.payload.block_timestamp
 
     # Get game factory from database
@@ -27,30 +29,29 @@ async def on_game_factory_config_updated(
 
     # Update the appropriate field in the GameFactory model based on field_name
     if field_name_str == 'owner':
-        factory.owner = f'0x{new_value:x}'
+        factory.owner = normalize_address(new_value)
     elif field_name_str == 'game_session_class_hash':
-        factory.game_session_class_hash = f'0x{new_value:x}'
+        factory.game_session_class_hash = normalize_address(new_value)
     # Add other fields as needed
 
-    # Update or initialize the config_history field
-    if not factory.config_history:
-        factory.config_history = []
-
     # Format values based on field type
     old_value_formatted = str(old_value)  # Convert to string to avoid integer overflow
     new_value_formatted = str(new_value)  # Convert to string to avoid integer overflow
     if field_name_str in ['owner', 'game_session_class_hash']:
-        old_value_formatted = f'0x{old_value:x}'
-        new_value_formatted = f'0x{new_value:x}'
+        old_value_formatted = normalize_address(old_value)
+        new_value_formatted = normalize_address(new_value)
 
     # Add the change to config history
-    factory.config_history.append(
-        {
-            'field': field_name_str,
-            'old_value': old_value_formatted,
-            'new_value': new_value_formatted,
-            'timestamp': block_timestamp,
-        }
+    await add_event(
+        models.ConfigChange(
+            transaction_hash=event.data.transaction_hash,
+            created_at=block_timestamp,
+            entity_type=models.ConfigEntityType.GAME_FACTORY,
+            entity_address=factory.address,
+            field=field_name_str,
+            old_value=old_value_formatted,
+            new_value=new_value_formatted,
+        )
     )
 
     # Update the timestamp
@@ -2,6 +2,7 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
 from defi_space_indexer.types.game_factory.starknet_events.factory_initialized import FactoryInitializedPayload
 
 
@@ -10,9 +11,9 @@ async def on_game_factory_initialized(
     event: StarknetEvent[FactoryInitializedPayload],
 ) -> None:
     # Extract data from event payload
-    factory_address = f'0x{event.payload.factory_address:x}'
-    owner = f'0x{event.payload.owner:x}'
-    game_session_class_hash = f'0x{event.payload.game_session_class_hash:x}'
+    factory_address = normalize_address(event.payload.factory_address)
+    owner = normalize_address(event.payload.owner)
+    game_session_class_hash = normalize_address(event.payload.game_session_class_hash)
     block_timestamp = event.payload.block_timestamp
 
     # Check if game factory already exists
@@ -31,8 +32,6 @@ async def on_game_factory_initialized(
         owner=owner,
         game_session_class_hash=game_session_class_hash,
         game_session_count=0,
-        game_sessions_list=[],
-        config_history=[],
         created_at=block_timestamp,
         updated_at=block_timestamp,
     )
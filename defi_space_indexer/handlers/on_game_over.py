@@ -2,6 +2,11 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_agent_by_index
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import save_entity
+from defi_space_indexer.event_buffer import add_event
 from defi_space_indexer.types.game_session.starknet_events.game_over import GameOverPayload
 
 
@@ -19,11 +24,11 @@ async def on_game_over(
     block_timestamp = event.payload.block_timestamp
 
     # Get session address from event data
-    session_address = event.data.from_address
+    session_address = normalize_address(event.data.from_address)
     transaction_hash = event.data.transaction_hash
 
     # Get game session from database
-    session = await models.GameSession.get_or_none(address=session_address)
+    session = await get_entity(models.GameSession, session_address)
     if not session:
         ctx.logger.warning(f'Game session {session_address} not found when processing game over event')
         return
@@ -35,30 +40,26 @@ async def on_game_over(
     session.game_end_timestamp = block_timestamp
     session.ended_at = block_timestamp
     session.updated_at = block_timestamp
-    await session.save()
+    await save_entity(session)
 
     # Update the winning agent's total score
-    winning_agent = None
-    for agent_address in session.agents_list:
-        agent_obj = await models.Agent.get_or_none(address=agent_address, session_address=session_address)
-        if agent_obj and agent_obj.agent_index == winning_agent_index:
-            winning_agent = agent_obj
-            break
-
+    winning_agent = await get_agent_by_index(session_address, winning_agent_index)
     if winning_agent:
         winning_agent.total_score = total_score
         winning_agent.updated_at = block_timestamp
-        await winning_agent.save()
+        await save_entity(winning_agent)
         ctx.logger.info(f'Updated winning agent {winning_agent_index} total score: {total_score}')
 
     # Create a game event record for the game over event
-    await models.GameEvent.create(
-        transaction_hash=transaction_hash,
-        created_at=block_timestamp,
-        event_type=models.GameEventType.GAME_OVER,
-        user_address=session.owner,  # Use the owner address since this is a system event
-        amount=total_rewards,  # The total rewards amount is the most relevant amount
-        session=session,
+    await add_event(
+        models.GameEvent(
+            transaction_hash=transaction_hash,
+            created_at=block_timestamp,
+            event_type=models.GameEventType.GAME_OVER,
+            user_address=session.owner,  # Use the owner address since this is a system event
+            amount=total_rewards,  # The total rewards amount is the most relevant amount
+            session=session,
+        )
     )
 
     # Log game completion details
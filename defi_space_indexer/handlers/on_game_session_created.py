@@ -2,8 +2,12 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import remember_entity
+from defi_space_indexer.entity_cache import save_entity
 from defi_space_indexer.types.game_factory.starknet_events.game_session_created import GameSessionCreatedPayload
-from defi_space_indexer.utils import get_token_info
+from defi_space_indexer.utils import get_cached_token_info
 
 
 async def on_game_session_created(
@@ -11,14 +15,14 @@ async def on_game_session_created(
     event: StarknetEvent[GameSessionCreatedPayload],
 ) -> None:
     # Extract data from event payload
-    game_session_address = f'0x{event.payload.game_session:x}'
-    token_win_condition_address = f'0x{event.payload.token_win_condition:x}'
-    deposit_token_address = f'0x{event.payload.deposit_token:x}'
+    game_session_address = normalize_address(event.payload.game_session)
+    token_win_condition_address = normalize_address(event.payload.token_win_condition)
+    deposit_token_address = normalize_address(event.payload.deposit_token)
     token_win_condition_threshold = event.payload.token_win_condition_threshold
     burn_fee_percentage = event.payload.burn_fee_percentage
     platform_fee_percentage = event.payload.platform_fee_percentage
-    creator_address = f'0x{event.payload.creator:x}'
-    factory_address = f'0x{event.payload.factory_address:x}'
+    creator_address = normalize_address(event.payload.creator)
+    factory_address = normalize_address(event.payload.factory_address)
     session_index = event.payload.session_index
     total_sessions = event.payload.total_sessions
     game_start_timestamp = event.payload.game_start_timestamp
@@ -32,13 +36,11 @@ async def on_game_session_created(
 
     # Update factory information
     factory.game_session_count = total_sessions
-    if game_session_address not in factory.game_sessions_list:
-        factory.game_sessions_list.append(game_session_address)
     factory.updated_at = block_timestamp
     await factory.save()
 
     # Check if game session already exists
-    session = await models.GameSession.get_or_none(address=game_session_address)
+    session = await get_entity(models.GameSession, game_session_address)
     if session:
         ctx.logger.info(f'Game session {game_session_address} already exists, updating')
         session.game_factory = factory_address
@@ -51,7 +53,8 @@ async def on_game_session_created(
         session.updated_at = block_timestamp
         session.factory = factory
         session.game_session_index = session_index
-        await session.save()
+        await save_entity(session)
+        remember_entity(session)
         return
 
     # Create contract and index for the new game session
@@ -63,10 +66,10 @@ async def on_game_session_created(
     await ctx.add_index(name=index_name, template='game_session_events', values={'contract': contract_name})
 
     # Get token info
-    token_win_condition_name, token_win_condition_symbol, token_win_condition_decimals = await get_token_info(
+    token_win_condition_name, token_win_condition_symbol, token_win_condition_decimals = await get_cached_token_info(
         token_win_condition_address
     )
-    user_deposit_token_name, user_deposit_token_symbol, user_deposit_token_decimals = await get_token_info(
+    user_deposit_token_name, user_deposit_token_symbol, user_deposit_token_decimals = await get_cached_token_info(
         deposit_token_address
     )
 
@@ -93,13 +96,13 @@ async def on_game_session_created(
         game_over=False,
         winning_agent_index=None,
         total_rewards=0,
-        agents_list=[],
-        config_history=[],
+        agent_count=0,
         created_at=block_timestamp,
         updated_at=block_timestamp,
         factory=factory,
         game_session_index=session_index,
     )
+    remember_entity(session)
 
     ctx.logger.info(
         f'Game session created: address={game_session_address}, factory={factory_address}, '
@@ -2,7 +2,13 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import save_entity
+from defi_space_indexer.event_buffer import add_event
+from defi_space_indexer.scoring import mark_game_agent_dirty
 from defi_space_indexer.types.farming_farm.starknet_events.harvest import HarvestPayload
+from defi_space_indexer.utils import to_amount
 
 
 async def on_harvest(
@@ -10,20 +16,20 @@ async def on_harvest(
     event: StarknetEvent[HarvestPayload],
 ) -> None:
     # Extract data from event payload
-    user_address = f'0x{event.payload.user_address:x}'
-    reward_token_address = f'0x{event.payload.reward_token:x}'
-    reward_amount = str(event.payload.reward_amount)  # Convert to string to avoid overflow
-    total_staked = str(event.payload.total_staked)  # Convert to string to avoid overflow
-    user_staked = str(event.payload.user_staked)  # Convert to string to avoid overflow
-    reward_per_token_stored = str(event.payload.reward_per_token_stored)  # Convert to string to avoid overflow
+    user_address = normalize_address(event.payload.user_address)
+    reward_token_address = normalize_address(event.payload.reward_token)
+    reward_amount = event.payload.reward_amount
+    total_staked = event.payload.total_staked
+    user_staked = event.payload.user_staked
+    reward_per_token_stored = event.payload.reward_per_token_stored
     block_timestamp = event.payload.block_timestamp
 
     # Get farm address and transaction hash from event data
-    farm_address = event.data.from_address
+    farm_address = normalize_address(event.data.from_address)
     transaction_hash = event.data.transaction_hash
 
     # Get farm from database
-    farm = await models.Farm.get_or_none(address=farm_address)
+    farm = await get_entity(models.Farm, farm_address)
     if not farm:
         ctx.logger.warning(f'Farm {farm_address} not found when processing harvest event')
         return
@@ -38,10 +44,10 @@ async def on_harvest(
 
     # Create or update reward token state
     reward_token_state = farm.active_rewards.get(reward_token_address, {})
-    reward_token_state['stored'] = reward_per_token_stored
+    reward_token_state['stored'] = str(reward_per_token_stored)  # JSON maps keep string amounts
     farm.active_rewards[reward_token_address] = reward_token_state
 
-    await farm.save()
+    await save_entity(farm)
 
     # Get or create agent stake
     agent_stake = await models.AgentStake.get_or_none(farm_address=farm_address, agent_address=user_address)
@@ -50,21 +56,11 @@ async def on_harvest(
         # Update agent stake amount
         agent_stake.staked_amount = user_staked
         agent_stake.updated_at = block_timestamp
-
-        # Update reward per token paid
-        if not agent_stake.reward_per_token_paid:
-            agent_stake.reward_per_token_paid = {}
-        agent_stake.reward_per_token_paid[reward_token_address] = reward_per_token_stored
-
-        # Update accumulated rewards
-        if not agent_stake.rewards:
-            agent_stake.rewards = {}
-
-        # After a harvest, the accumulated rewards are reset to 0 in the contract
-        agent_stake.rewards[reward_token_address] = '0'
-
         await agent_stake.save()
 
+    # Harvested rewards land in the agent's wallet even without an indexed stake
+    await mark_game_agent_dirty(user_address, farm.game_session_id)
+
     # Get reward info
     reward = await models.Reward.get_or_none(address=reward_token_address, farm_address=farm_address)
 
@@ -75,7 +71,7 @@ async def on_harvest(
         )
     else:
         # Update reward remaining amount by subtracting harvested reward
-        reward.remaining_amount = str(int(reward.remaining_amount) - int(reward_amount))
+        reward.remaining_amount = to_amount(reward.remaining_amount) - reward_amount
         reward.updated_at = block_timestamp
         await reward.save()
 
@@ -87,24 +83,41 @@ async def on_harvest(
     if reward_per_agent:
         # After harvest, pending rewards should be 0 according to the contract logic
         # because all accumulated rewards have been claimed
-        reward_per_agent.last_pending_rewards = '0'
+        reward_per_agent.last_pending_rewards = 0
         reward_per_agent.reward_per_token_paid = reward_per_token_stored
+        reward_per_agent.rewards = 0
         reward_per_agent.updated_at = block_timestamp
         await reward_per_agent.save()
+    elif agent_stake and reward:
+        # Checkpoint the agent at the harvested reward per token
+        await models.RewardPerAgent.create(
+            agent_address=user_address,
+            reward_token_address=reward_token_address,
+            farm_address=farm_address,
+            last_pending_rewards=0,
+            reward_per_token_paid=reward_per_token_stored,
+            rewards=0,
+            created_at=block_timestamp,
+            updated_at=block_timestamp,
+            agent_stake=agent_stake,
+            reward=reward,
+        )
 
     # Create reward event
-    await models.RewardEvent.create(
-        transaction_hash=transaction_hash,
-        created_at=block_timestamp,
-        event_type=models.RewardEventType.HARVEST,
-        agent_address=user_address,
-        reward_token=reward_token_address,
-        reward_amount=reward_amount,
-        # Set these fields to null for harvest events
-        reward_rate=None,
-        reward_duration=None,
-        period_finish=None,
-        farm=farm,
+    await add_event(
+        models.RewardEvent(
+            transaction_hash=transaction_hash,
+            created_at=block_timestamp,
+            event_type=models.RewardEventType.HARVEST,
+            agent_address=user_address,
+            reward_token=reward_token_address,
+            reward_amount=reward_amount,
+            # Set these fields to null for harvest events
+            reward_rate=None,
+            reward_duration=None,
+            period_finish=None,
+            farm=farm,
+        )
     )
 
     ctx.logger.info(
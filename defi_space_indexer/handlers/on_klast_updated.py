@@ -2,6 +2,9 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import save_entity
 from defi_space_indexer.types.amm_pair.starknet_events.k_last_updated import KLastUpdatedPayload
 
 
@@ -12,11 +15,11 @@ async def on_klast_updated(
     # Extract data from event payload
     old_klast = event.payload.old_klast
     new_klast = event.payload.new_klast
-    pair_address = f'0x{event.payload.pair_address:x}'
+    pair_address = normalize_address(event.payload.pair_address)
     block_timestamp = event.payload.block_timestamp
 
     # Get pair from database
-    pair = await models.Pair.get_or_none(address=pair_address)
+    pair = await get_entity(models.Pair, pair_address)
     if not pair:
         ctx.logger.warning(f'Pair {pair_address} not found when updating klast')
         return
@@ -24,6 +27,6 @@ async def on_klast_updated(
     # Update the pair
     pair.klast = new_klast
     pair.updated_at = block_timestamp
-    await pair.save()
+    await save_entity(pair)
 
     ctx.logger.info(f'Pair klast updated: pair={pair_address}, old_klast={old_klast}, new_klast={new_klast}')
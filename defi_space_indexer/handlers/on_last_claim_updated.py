@@ -2,6 +2,7 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
 from defi_space_indexer.types.faucet.starknet_events.last_claim_updated import LastClaimUpdatedPayload
 
 
@@ -10,13 +11,13 @@ async def on_last_claim_updated(
     event: StarknetEvent[LastClaimUpdatedPayload],
 ) -> None:
     # Extract data from event payload
-    user_address = f'0x{event.payload.user_address:x}'
+    user_address = normalize_address(event.payload.user_address)
     previous_timestamp = event.payload.previous_timestamp
     new_timestamp = event.payload.new_timestamp
     block_timestamp = event.payload.block_timestamp
 
     # Get faucet address from event data
-    faucet_address = event.data.from_address
+    faucet_address = normalize_address(event.data.from_address)
 
     # Get the whitelisted user from database
     user = await models.WhitelistedUser.get_or_none(address=user_address, faucet_address=faucet_address)
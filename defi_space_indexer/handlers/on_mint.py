@@ -2,6 +2,12 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import save_entity
+from defi_space_indexer.event_buffer import add_event
+from defi_space_indexer.reserve_history import record_reserves
+from defi_space_indexer.scoring import mark_game_agent_dirty
 from defi_space_indexer.types.amm_pair.starknet_events.mint import MintPayload
 
 
@@ -10,7 +16,7 @@ async def on_mint(
     event: StarknetEvent[MintPayload],
 ) -> None:
     # Extract data from event payload
-    sender_address = f'0x{event.payload.sender:x}'
+    sender_address = normalize_address(event.payload.sender)
     amount0 = event.payload.amount0
     amount1 = event.payload.amount1
     reserve0 = event.payload.reserve0
@@ -20,11 +26,11 @@ async def on_mint(
     block_timestamp = event.payload.block_timestamp
 
     # Get pair address from event data
-    pair_address = event.data.from_address
+    pair_address = normalize_address(event.data.from_address)
     transaction_hash = event.data.transaction_hash
 
     # Get pair from database
-    pair = await models.Pair.get_or_none(address=pair_address)
+    pair = await get_entity(models.Pair, pair_address)
     if not pair:
         ctx.logger.warning(f'Pair {pair_address} not found when processing mint event')
         return
@@ -34,7 +40,10 @@ async def on_mint(
     pair.reserve1 = reserve1
     pair.total_supply = total_supply
     pair.updated_at = block_timestamp
-    await pair.save()
+    await save_entity(pair)
+
+    # Keep the reserves of this block for historical queries
+    await record_reserves(pair, event.data.level, block_timestamp)
 
     # Get or create liquidity position
     # Important: This creates or retrieves a LiquidityPosition linked to the pair
@@ -62,18 +71,21 @@ async def on_mint(
     # Ensure the relationship is maintained
     position.pair = pair
     await position.save()
+    await mark_game_agent_dirty(sender_address, pair.game_session_id)
 
     # Create liquidity event record
-    await models.LiquidityEvent.create(
-        transaction_hash=transaction_hash,
-        created_at=block_timestamp,
-        event_type=models.LiquidityEventType.MINT,
-        sender=sender_address,
-        amount0=amount0,
-        amount1=amount1,
-        liquidity=user_liquidity,
-        pair=pair,
-        position=position,
+    await add_event(
+        models.LiquidityEvent(
+            transaction_hash=transaction_hash,
+            created_at=block_timestamp,
+            event_type=models.LiquidityEventType.MINT,
+            sender=sender_address,
+            amount0=amount0,
+            amount1=amount1,
+            liquidity=user_liquidity,
+            pair=pair,
+            position=position,
+        )
     )
 
     ctx.logger.info(
@@ -2,6 +2,8 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.event_buffer import add_event
 from defi_space_indexer.types.amm_factory.starknet_events.owner_updated import OwnerUpdatedPayload
 
 
@@ -10,9 +12,9 @@ async def on_owner_updated(
     event: StarknetEvent[OwnerUpdatedPayload],
 ) -> None:
     # Extract data from event payload
-    previous_owner = f'0x{event.payload.previous_owner:x}'
-    new_owner = f'0x{event.payload.new_owner:x}'
-    factory_address = f'0x{event.payload.factory_address:x}'
+    previous_owner = normalize_address(event.payload.previous_owner)
+    new_owner = normalize_address(event.payload.new_owner)
+    factory_address = normalize_address(event.payload.factory_address)
     block_timestamp = event.payload.block_timestamp
 
     # Get factory from database
@@ -25,13 +27,17 @@ async def on_owner_updated(
     factory.owner = new_owner
     factory.updated_at = block_timestamp
 
-    # Update or initialize the config_history field
-    if not factory.config_history:
-        factory.config_history = []
-
     # Add the ownership change to config history
-    factory.config_history.append(
-        {'field': 'owner', 'old_value': previous_owner, 'new_value': new_owner, 'timestamp': block_timestamp}
+    await add_event(
+        models.ConfigChange(
+            transaction_hash=event.data.transaction_hash,
+            created_at=block_timestamp,
+            entity_type=models.ConfigEntityType.AMM_FACTORY,
+            entity_address=factory.address,
+            field='owner',
+            old_value=previous_owner,
+            new_value=new_owner,
+        )
     )
 
     # Save the changes
@@ -2,6 +2,10 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import save_entity
+from defi_space_indexer.event_buffer import add_event
 from defi_space_indexer.types.game_session.starknet_events.ownership_transferred import OwnershipTransferredPayload
 
 
@@ -10,15 +14,15 @@ async def on_ownership_transferred(
     event: StarknetEvent[OwnershipTransferredPayload],
 ) -> None:
     # Extract data from event payload
-    previous_owner = f'0x{event.payload.previous_owner:x}'
-    new_owner = f'0x{event.payload.new_owner:x}'
+    previous_owner = normalize_address(event.payload.previous_owner)
+    new_owner = normalize_address(event.payload.new_owner)
     block_timestamp = event.payload.block_timestamp
 
     # Get session address from event data
-    session_address = event.data.from_address
+    session_address = normalize_address(event.data.from_address)
 
     # Get game session from database
-    session = await models.GameSession.get_or_none(address=session_address)
+    session = await get_entity(models.GameSession, session_address)
     if not session:
         ctx.logger.warning(f'Game session {session_address} not found when transferring ownership')
         return
@@ -27,17 +31,21 @@ async def on_ownership_transferred(
     session.owner = new_owner
     session.updated_at = block_timestamp
 
-    # Update or initialize the config_history field
-    if not session.config_history:
-        session.config_history = []
-
     # Add the ownership change to config history
-    session.config_history.append(
-        {'field': 'owner', 'old_value': previous_owner, 'new_value': new_owner, 'timestamp': block_timestamp}
+    await add_event(
+        models.ConfigChange(
+            transaction_hash=event.data.transaction_hash,
+            created_at=block_timestamp,
+            entity_type=models.ConfigEntityType.GAME_SESSION,
+            entity_address=session.address,
+            field='owner',
+            old_value=previous_owner,
+            new_value=new_owner,
+        )
     )
 
     # Save the changes
-    await session.save()
+    await save_entity(session)
 
     ctx.logger.info(
         f'Game session ownership transferred: session={session_address}, '
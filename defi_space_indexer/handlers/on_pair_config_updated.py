@@ -2,7 +2,11 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import save_entity
 from defi_space_indexer.types.amm_pair.starknet_events.config_updated import ConfigUpdatedPayload
+from defi_space_indexer.utils import felt_to_string
 
 
 async def on_pair_config_updated(
@@ -13,14 +17,17 @@ async def on_pair_config_updated(
     field_name = event.payload.field_name
     old_value = event.payload.old_value
     new_value = event.payload.new_value
-    pair_address = f'0x{event.payload.pair_address:x}'
+    pair_address = normalize_address(event.payload.pair_address)
     block_timestamp = event.payload.block_timestamp
 
-    # Convert felt252 field_name to string for readability
-    field_name_str = str(field_name)
+    # field_name is a Cairo short string packed into a felt252; keep its decimal form if it does not decode
+    try:
+        field_name_str = felt_to_string(field_name)
+    except (OverflowError, UnicodeDecodeError):
+        field_name_str = str(field_name)
 
     # Get pair from database
-    pair = await models.Pair.get_or_none(address=pair_address)
+    pair = await get_entity(models.Pair, pair_address)
     if not pair:
         ctx.logger.warning(f'Pair {pair_address} not found when updating config')
         return
@@ -33,7 +40,7 @@ async def on_pair_config_updated(
 
     # Update timestamp
     pair.updated_at = block_timestamp
-    await pair.save()
+    await save_entity(pair)
 
     ctx.logger.info(
         f'Pair config updated: pair={pair_address}, field={field_name_str}, '
@@ -2,6 +2,8 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.event_buffer import add_event
 from defi_space_indexer.types.amm_factory.starknet_events.pair_contract_class_hash_updated import (
     PairContractClassHashUpdatedPayload,
 )
@@ -12,9 +14,9 @@ async def on_pair_contract_class_hash_updated(
     event: StarknetEvent[PairContractClassHashUpdatedPayload],
 ) -> None:
     # Extract data from event payload
-    old_hash = f'0x{event.payload.old_hash:x}'
-    new_hash = f'0x{event.payload.new_hash:x}'
-    factory_address = f'0x{event.payload.factory_address:x}'
+    old_hash = normalize_address(event.payload.old_hash)
+    new_hash = normalize_address(event.payload.new_hash)
+    factory_address = normalize_address(event.payload.factory_address)
     block_timestamp = event.payload.block_timestamp
 
     # Get factory from database
@@ -27,18 +29,17 @@ async def on_pair_contract_class_hash_updated(
     factory.pair_contract_class_hash = new_hash
     factory.updated_at = block_timestamp
 
-    # Update or initialize the config_history field
-    if not factory.config_history:
-        factory.config_history = []
-
     # Add the change to config history
-    factory.config_history.append(
-        {
-            'field': 'pair_contract_class_hash',
-            'old_value': old_hash,
-            'new_value': new_hash,
-            'timestamp': block_timestamp,
-        }
+    await add_event(
+        models.ConfigChange(
+            transaction_hash=event.data.transaction_hash,
+            created_at=block_timestamp,
+            entity_type=models.ConfigEntityType.AMM_FACTORY,
+            entity_address=factory.address,
+            field='pair_contract_class_hash',
+            old_value=old_hash,
+            new_value=new_hash,
+        )
     )
 
     # Save the changes
@@ -2,8 +2,13 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.amm_math import DEFAULT_FEE_BPS
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import remember_entity
+from defi_space_indexer.entity_cache import save_entity
 from defi_space_indexer.types.amm_factory.starknet_events.pair_created import PairCreatedPayload
-from defi_space_indexer.utils import get_token_info
+from defi_space_indexer.utils import get_cached_token_info
 
 
 async def on_pair_created(
@@ -11,11 +16,11 @@ async def on_pair_created(
     event: StarknetEvent[PairCreatedPayload],
 ) -> None:
     # Extract data from event payload
-    token0_address = f'0x{event.payload.token0:x}'
-    token1_address = f'0x{event.payload.token1:x}'
-    pair_address = f'0x{event.payload.pair:x}'
+    token0_address = normalize_address(event.payload.token0)
+    token1_address = normalize_address(event.payload.token1)
+    pair_address = normalize_address(event.payload.pair)
     total_pairs = event.payload.total_pairs
-    factory_address = f'0x{event.payload.factory_address:x}'
+    factory_address = normalize_address(event.payload.factory_address)
     game_session_id = event.payload.game_session_id
     block_timestamp = event.payload.block_timestamp
 
@@ -31,14 +36,14 @@ async def on_pair_created(
     await factory.save()
 
     # Fetch token names and symbols
-    token0_name, token0_symbol, token0_decimals = await get_token_info(token0_address)
-    token1_name, token1_symbol, token1_decimals = await get_token_info(token1_address)
+    token0_name, token0_symbol, token0_decimals = await get_cached_token_info(token0_address)
+    token1_name, token1_symbol, token1_decimals = await get_cached_token_info(token1_address)
 
     # LP token typically follows a format like "TOKEN0-TOKEN1 LP"
-    lp_token_name, lp_token_symbol, _ = await get_token_info(pair_address)
+    lp_token_name, lp_token_symbol, _ = await get_cached_token_info(pair_address)
 
     # Check if pair already exists
-    pair = await models.Pair.get_or_none(address=pair_address)
+    pair = await get_entity(models.Pair, pair_address)
     if pair:
         ctx.logger.info(f'Pair {pair_address} already exists, updating')
         pair.factory_address = factory_address
@@ -53,7 +58,7 @@ async def on_pair_created(
         pair.game_session_id = game_session_id
         pair.updated_at = block_timestamp
         pair.factory = factory
-        await pair.save()
+        await save_entity(pair)
         return
 
     # Create contract and index for the new pair
@@ -80,6 +85,7 @@ async def on_pair_created(
         reserve1=0,
         total_supply=0,
         klast=0,
+        fee_bps=DEFAULT_FEE_BPS,
         price_0_cumulative_last=0,
         price_1_cumulative_last=0,
         block_timestamp_last=block_timestamp,
@@ -88,6 +94,7 @@ async def on_pair_created(
         updated_at=block_timestamp,
         factory=factory,
     )
+    remember_entity(pair)
 
     ctx.logger.info(
         f'Pair created: address={pair_address}, factory={factory_address}, '
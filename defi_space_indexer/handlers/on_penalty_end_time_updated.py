@@ -2,6 +2,7 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
 from defi_space_indexer.types.farming_farm.starknet_events.penalty_end_time_updated import PenaltyEndTimeUpdatedPayload
 
 
@@ -10,13 +11,13 @@ async def on_penalty_end_time_updated(
     event: StarknetEvent[PenaltyEndTimeUpdatedPayload],
 ) -> None:
     # Extract data from event payload
-    user_address = f'0x{event.payload.user_address:x}'
+    user_address = normalize_address(event.payload.user_address)
     old_end_time = event.payload.old_end_time
     new_end_time = event.payload.new_end_time
     block_timestamp = event.payload.block_timestamp
 
     # Get farm address from event data
-    farm_address = event.data.from_address
+    farm_address = normalize_address(event.data.from_address)
 
     # Get agent stake from database
     agent_stake = await models.AgentStake.get_or_none(farm_address=farm_address, agent_address=user_address)
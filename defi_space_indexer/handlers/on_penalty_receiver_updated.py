@@ -2,6 +2,10 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import save_entity
+from defi_space_indexer.event_buffer import add_event
 from defi_space_indexer.types.farming_farm.starknet_events.penalty_receiver_updated import PenaltyReceiverUpdatedPayload
 
 
@@ -10,15 +14,15 @@ async def on_penalty_receiver_updated(
     event: StarknetEvent[PenaltyReceiverUpdatedPayload],
 ) -> None:
     # Extract data from event payload
-    previous_receiver = f'0x{event.payload.previous_receiver:x}'
-    new_receiver = f'0x{event.payload.new_receiver:x}'
+    previous_receiver = normalize_address(event.payload.previous_receiver)
+    new_receiver = normalize_address(event.payload.new_receiver)
     block_timestamp = event.payload.block_timestamp
 
     # Get farm address from event data
-    farm_address = event.data.from_address
+    farm_address = normalize_address(event.data.from_address)
 
     # Get farm from database
-    farm = await models.Farm.get_or_none(address=farm_address)
+    farm = await get_entity(models.Farm, farm_address)
     if not farm:
         ctx.logger.warning(f'Farm {farm_address} not found when updating penalty receiver')
         return
@@ -27,22 +31,21 @@ async def on_penalty_receiver_updated(
     farm.penalty_receiver = new_receiver
     farm.updated_at = block_timestamp
 
-    # Update or initialize the config_history field
-    if not farm.config_history:
-        farm.config_history = []
-
     # Add the change to config history
-    farm.config_history.append(
-        {
-            'field': 'penalty_receiver',
-            'old_value': previous_receiver,
-            'new_value': new_receiver,
-            'timestamp': block_timestamp,
-        }
+    await add_event(
+        models.ConfigChange(
+            transaction_hash=event.data.transaction_hash,
+            created_at=block_timestamp,
+            entity_type=models.ConfigEntityType.FARM,
+            entity_address=farm.address,
+            field='penalty_receiver',
+            old_value=previous_receiver,
+            new_value=new_receiver,
+        )
     )
 
     # Save the changes
-    await farm.save()
+    await save_entity(farm)
 
     ctx.logger.info(
         f'Penalty receiver updated: farm={farm_address}, '
@@ -2,6 +2,10 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import save_entity
+from defi_space_indexer.twap import update_price_accumulators
 from defi_space_indexer.types.amm_pair.starknet_events.price_accumulator_updated import PriceAccumulatorUpdatedPayload
 
 
@@ -12,23 +16,28 @@ async def on_price_accumulator_updated(
     # Extract data from event payload
     price_0_cumulative_last = event.payload.price_0_cumulative_last
     price_1_cumulative_last = event.payload.price_1_cumulative_last
-    pair_address = f'0x{event.payload.pair_address:x}'
+    pair_address = normalize_address(event.payload.pair_address)
     block_timestamp = event.payload.block_timestamp
 
     # Get pair from database
-    pair = await models.Pair.get_or_none(address=pair_address)
+    pair = await get_entity(models.Pair, pair_address)
     if not pair:
         ctx.logger.warning(f'Pair {pair_address} not found when updating price accumulators')
         return
 
-    # Update the pair
-    pair.price_0_cumulative_last = price_0_cumulative_last
-    pair.price_1_cumulative_last = price_1_cumulative_last
-    pair.block_timestamp_last = block_timestamp
+    # Update the pair, keeping the checkpoint for TWAP queries
+    await update_price_accumulators(
+        pair,
+        price_0_cumulative_last,
+        price_1_cumulative_last,
+        block_timestamp,
+        event.data.transaction_hash,
+        event.data.level,
+    )
     pair.updated_at = block_timestamp
 
     # Save the changes
-    await pair.save()
+    await save_entity(pair)
 
     ctx.logger.info(
         f'Price accumulators updated: pair={pair_address}, '
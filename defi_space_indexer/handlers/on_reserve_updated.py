@@ -2,6 +2,10 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import save_entity
+from defi_space_indexer.reserve_history import record_reserves
 from defi_space_indexer.types.amm_pair.starknet_events.reserve_updated import ReserveUpdatedPayload
 
 
@@ -14,11 +18,11 @@ async def on_reserve_updated(
     old_reserve1 = event.payload.old_reserve1
     new_reserve0 = event.payload.new_reserve0
     new_reserve1 = event.payload.new_reserve1
-    pair_address = f'0x{event.payload.pair_address:x}'
+    pair_address = normalize_address(event.payload.pair_address)
     block_timestamp = event.payload.block_timestamp
 
     # Get pair from database
-    pair = await models.Pair.get_or_none(address=pair_address)
+    pair = await get_entity(models.Pair, pair_address)
     if not pair:
         ctx.logger.warning(f'Pair {pair_address} not found when updating reserves')
         return
@@ -29,7 +33,10 @@ async def on_reserve_updated(
     pair.updated_at = block_timestamp
 
     # Save the changes
-    await pair.save()
+    await save_entity(pair)
+
+    # Keep the reserves of this block for historical queries
+    await record_reserves(pair, event.data.level, block_timestamp)
 
     ctx.logger.info(
         f'Reserves updated: pair={pair_address}, '
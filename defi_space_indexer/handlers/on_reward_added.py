@@ -2,8 +2,13 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import save_entity
+from defi_space_indexer.event_buffer import add_event
 from defi_space_indexer.types.farming_farm.starknet_events.reward_added import RewardAddedPayload
-from defi_space_indexer.utils import get_token_info
+from defi_space_indexer.utils import get_cached_token_info
+from defi_space_indexer.utils import to_amount
 
 
 async def on_reward_added(
@@ -11,7 +16,7 @@ async def on_reward_added(
     event: StarknetEvent[RewardAddedPayload],
 ) -> None:
     # Extract data from event payload
-    reward_token = f'0x{event.payload.reward_token:x}'
+    reward_token = normalize_address(event.payload.reward_token)
     reward_amount = event.payload.reward_amount
     reward_duration = event.payload.reward_duration
     reward_rate = event.payload.reward_rate
@@ -20,41 +25,39 @@ async def on_reward_added(
     unallocated_rewards = event.payload.unallocated_rewards
     token_decimals = event.payload.token_decimals
 
-    # Convert large integers to strings to avoid 64-bit range limitations
-    reward_amount_str = str(reward_amount)
+    # The farm's active_rewards JSON map keeps string amounts
     reward_rate_str = str(reward_rate)
     reward_per_token_stored_str = str(reward_per_token_stored)
     period_finish_str = str(period_finish)
-    unallocated_rewards_str = str(unallocated_rewards)
 
     # Get farm address from event data
-    farm_address = event.data.from_address
+    farm_address = normalize_address(event.data.from_address)
     transaction_hash = event.data.transaction_hash
     block_timestamp = event.payload.block_timestamp
 
     # Get farm from database
-    farm = await models.Farm.get_or_none(address=farm_address)
+    farm = await get_entity(models.Farm, farm_address)
     if not farm:
         ctx.logger.warning(f'Farm {farm_address} not found when processing reward added event')
         return
 
     # Fetch token name, symbol, and decimals
-    token_name, token_symbol, token_decimals = await get_token_info(reward_token)
+    token_name, token_symbol, token_decimals = await get_cached_token_info(reward_token)
 
     # Get or create Reward model
     reward, created = await models.Reward.get_or_create(
         address=reward_token,
         farm_address=farm_address,
         defaults={
-            'initial_amount': reward_amount_str,
-            'unallocated_rewards': unallocated_rewards_str,
-            'remaining_amount': reward_amount_str,
+            'initial_amount': reward_amount,
+            'unallocated_rewards': unallocated_rewards,
+            'remaining_amount': reward_amount,
             'rewards_duration': reward_duration,
-            'period_finish': period_finish_str,
-            'reward_rate': reward_rate_str,
+            'period_finish': period_finish,
+            'reward_rate': reward_rate,
             'game_session_id': farm.game_session_id,
             'last_update_time': block_timestamp,
-            'reward_per_token_stored': reward_per_token_stored_str,
+            'reward_per_token_stored': reward_per_token_stored,
             'reward_token_symbol': token_symbol,
             'reward_token_name': token_name,
             'decimals': token_decimals,
@@ -66,15 +69,15 @@ async def on_reward_added(
 
     if not created:
         # Update reward data
-        reward.initial_amount = reward_amount_str
-        reward.unallocated_rewards = unallocated_rewards_str
-        reward.remaining_amount = str(int(reward.remaining_amount) + int(reward_amount_str))
+        reward.initial_amount = reward_amount
+        reward.unallocated_rewards = unallocated_rewards
+        reward.remaining_amount = to_amount(reward.remaining_amount) + reward_amount
         reward.rewards_duration = reward_duration
-        reward.period_finish = period_finish_str
-        reward.reward_rate = reward_rate_str
+        reward.period_finish = period_finish
+        reward.reward_rate = reward_rate
         reward.game_session_id = farm.game_session_id
         reward.last_update_time = block_timestamp
-        reward.reward_per_token_stored = reward_per_token_stored_str
+        reward.reward_per_token_stored = reward_per_token_stored
         reward.reward_token_symbol = token_symbol
         reward.reward_token_name = token_name
         reward.decimals = token_decimals
@@ -94,20 +97,22 @@ async def on_reward_added(
         farm.reward_tokens.append(reward_token)
 
     farm.updated_at = block_timestamp
-    await farm.save()
+    await save_entity(farm)
 
     # Create reward event
-    await models.RewardEvent.create(
-        transaction_hash=transaction_hash,
-        created_at=block_timestamp,
-        event_type=models.RewardEventType.REWARD_ADDED,
-        agent_address=None,  # No specific agent for reward addition
-        reward_token=reward_token,
-        reward_amount=reward_amount_str,
-        reward_rate=reward_rate_str,
-        reward_duration=reward_duration,
-        period_finish=period_finish_str,
-        farm=farm,
+    await add_event(
+        models.RewardEvent(
+            transaction_hash=transaction_hash,
+            created_at=block_timestamp,
+            event_type=models.RewardEventType.REWARD_ADDED,
+            agent_address=None,  # No specific agent for reward addition
+            reward_token=reward_token,
+            reward_amount=reward_amount,
+            reward_rate=reward_rate,
+            reward_duration=reward_duration,
+            period_finish=period_finish,
+            farm=farm,
+        )
     )
 
     ctx.logger.info(
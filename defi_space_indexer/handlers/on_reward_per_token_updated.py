@@ -1,8 +1,20 @@
+import os
+
 from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import save_entity
 from defi_space_indexer.types.farming_farm.starknet_events.reward_per_token_updated import RewardPerTokenUpdatedPayload
+from defi_space_indexer.utils import to_amount
+
+# Only store checkpoints and leave pending rewards to the `reward_per_agent_pending` view
+LAZY_PENDING_REWARDS = os.environ.get('LAZY_PENDING_REWARDS', 'false').lower() == 'true'
+
+# Maximum number of RewardPerAgent rows per UPDATE statement
+REWARD_UPDATE_BATCH_SIZE = int(os.environ.get('REWARD_UPDATE_BATCH_SIZE', '1000'))
 
 
 async def on_reward_per_token_updated(
@@ -10,16 +22,16 @@ async def on_reward_per_token_updated(
     event: StarknetEvent[RewardPerTokenUpdatedPayload],
 ) -> None:
     # Extract data from event payload
-    reward_token_address = f'0x{event.payload.reward_token:x}'
-    previous_value = str(event.payload.previous_value)  # Convert to string to handle large integers
-    new_value = str(event.payload.new_value)  # Convert to string to handle large integers
+    reward_token_address = normalize_address(event.payload.reward_token)
+    previous_value = event.payload.previous_value
+    new_value = event.payload.new_value
     block_timestamp = event.payload.block_timestamp
 
     # Get farm address from event data
-    farm_address = event.data.from_address
+    farm_address = normalize_address(event.data.from_address)
 
     # Get farm from database
-    farm = await models.Farm.get_or_none(address=farm_address)
+    farm = await get_entity(models.Farm, farm_address)
     if not farm:
         ctx.logger.warning(f'Farm {farm_address} not found when updating reward per token')
         return
@@ -30,68 +42,63 @@ async def on_reward_per_token_updated(
 
     # Get existing reward token state or create new one
     reward_token_state = farm.active_rewards.get(reward_token_address, {})
-    reward_token_state['stored'] = new_value  # Already a string
+    reward_token_state['stored'] = str(new_value)  # JSON maps keep string amounts
     farm.active_rewards[reward_token_address] = reward_token_state
 
     farm.updated_at = block_timestamp
-    await farm.save()
+    await save_entity(farm)
 
     # Update Reward model if it exists
     reward = await models.Reward.get_or_none(address=reward_token_address, farm_address=farm_address)
 
     if reward:
-        reward.reward_per_token_stored = new_value  # Already a string
+        reward.reward_per_token_stored = new_value
         reward.last_update_time = block_timestamp
         reward.updated_at = block_timestamp
         await reward.save()
 
+    # In lazy mode the checkpoint above is all that's needed; pending rewards are computed on read
+    if reward and not LAZY_PENDING_REWARDS:
         # Get token decimals for precision factor
         decimals = reward.decimals
         precision_factor = 10**decimals
 
-        # Get all agent stakes for this farm
-        agent_stakes = await models.AgentStake.filter(farm_address=farm_address)
-
-        # Update pending rewards for all agent stakes
-        for agent_stake in agent_stakes:
-            # Only process agents that have a balance
-            if agent_stake.staked_amount == '0':
-                continue
+        # Load the reward state of every staker with a balance, together with their stake, in one query
+        rewards_per_agent = await models.RewardPerAgent.filter(
+            farm_address=farm_address,
+            reward_token_address=reward_token_address,
+            agent_stake__staked_amount__gt=0,
+        ).select_related('agent_stake')
 
+        # Recompute pending rewards in memory using the contract's earned function logic
+        updated_rewards_per_agent = []
+        for reward_per_agent in rewards_per_agent:
             # Get the agent's reward per token paid
-            if not agent_stake.reward_per_token_paid or reward_token_address not in agent_stake.reward_per_token_paid:
+            user_reward_per_token_paid = to_amount(reward_per_agent.reward_per_token_paid)
+            if new_value <= user_reward_per_token_paid:
                 continue
 
-            user_reward_per_token_paid = agent_stake.reward_per_token_paid[reward_token_address]
-
             # Get the agent's accumulated rewards
-            previous_rewards = '0'
-            if agent_stake.rewards and reward_token_address in agent_stake.rewards:
-                previous_rewards = agent_stake.rewards[reward_token_address]
-
-            # Get or create the RewardPerAgent record
-            reward_per_agent = await models.RewardPerAgent.get_or_none(
-                agent_address=agent_stake.agent_address,
-                reward_token_address=reward_token_address,
-                farm_address=farm_address,
+            previous_rewards = to_amount(reward_per_agent.rewards)
+
+            # Calculate new rewards: balance * (current_reward_per_token - user_reward_per_token_paid) / precision_factor
+            new_rewards = (
+                to_amount(reward_per_agent.agent_stake.staked_amount) * (new_value - user_reward_per_token_paid)
+            ) // precision_factor
+
+            # Add new rewards to previously accumulated rewards
+            reward_per_agent.last_pending_rewards = previous_rewards + new_rewards
+            reward_per_agent.updated_at = block_timestamp
+            updated_rewards_per_agent.append(reward_per_agent)
+
+        # Write all recomputed rows back at once
+        if updated_rewards_per_agent:
+            await models.RewardPerAgent.bulk_update(
+                updated_rewards_per_agent,
+                fields=['last_pending_rewards', 'updated_at'],
+                batch_size=REWARD_UPDATE_BATCH_SIZE,
             )
 
-            if reward_per_agent:
-                # Calculate new pending rewards using contract's earned function logic
-                if int(new_value) > int(user_reward_per_token_paid):
-                    # Calculate new rewards: balance * (current_reward_per_token - user_reward_per_token_paid) / precision_factor
-                    new_rewards = (
-                        int(agent_stake.staked_amount) * (int(new_value) - int(user_reward_per_token_paid))
-                    ) // precision_factor
-
-                    # Add new rewards to previously accumulated rewards
-                    total_last_pending_rewards = str(int(previous_rewards) + new_rewards)
-
-                    # Update the RewardPerAgent record
-                    reward_per_agent.last_pending_rewards = total_last_pending_rewards
-                    reward_per_agent.updated_at = block_timestamp
-                    await reward_per_agent.save()
-
     ctx.logger.info(
         f'Reward per token updated: farm={farm_address}, token={reward_token_address}, '
         f'previous_value={previous_value}, new_value={new_value}'
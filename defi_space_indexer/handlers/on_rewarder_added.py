@@ -2,6 +2,9 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import save_entity
 from defi_space_indexer.types.farming_farm.starknet_events.rewarder_added import RewarderAddedPayload
 
 
@@ -10,14 +13,14 @@ async def on_rewarder_added(
     event: StarknetEvent[RewarderAddedPayload],
 ) -> None:
     # Extract data from event payload
-    rewarder_address = f'0x{event.payload.rewarder:x}'
+    rewarder_address = normalize_address(event.payload.rewarder)
     block_timestamp = event.payload.block_timestamp
 
     # Get farm address from event data
-    farm_address = event.data.from_address
+    farm_address = normalize_address(event.data.from_address)
 
     # Get farm from database
-    farm = await models.Farm.get_or_none(address=farm_address)
+    farm = await get_entity(models.Farm, farm_address)
     if not farm:
         ctx.logger.warning(f'Farm {farm_address} not found when adding rewarder')
         return
@@ -30,7 +33,7 @@ async def on_rewarder_added(
         farm.authorized_rewarders.append(rewarder_address)
 
     farm.updated_at = block_timestamp
-    await farm.save()
+    await save_entity(farm)
 
     # Create or update Rewarder model
     rewarder, created = await models.Rewarder.get_or_create(
@@ -2,6 +2,9 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.event_buffer import add_event
 from defi_space_indexer.types.game_session.starknet_events.rewards_claimed import RewardsClaimedPayload
 
 
@@ -10,28 +13,30 @@ async def on_rewards_claimed(
     event: StarknetEvent[RewardsClaimedPayload],
 ) -> None:
     # Extract data from event payload
-    user_address = f'0x{event.payload.user:x}'
+    user_address = normalize_address(event.payload.user)
     amount = event.payload.amount
     block_timestamp = event.payload.block_timestamp
 
     # Get session address and transaction hash from event data
-    session_address = event.data.from_address
+    session_address = normalize_address(event.data.from_address)
     transaction_hash = event.data.transaction_hash
 
     # Get game session from database
-    session = await models.GameSession.get_or_none(address=session_address)
+    session = await get_entity(models.GameSession, session_address)
     if not session:
         ctx.logger.warning(f'Game session {session_address} not found when processing rewards claimed')
         return
 
     # Create game event record for tracking
-    await models.GameEvent.create(
-        transaction_hash=transaction_hash,
-        created_at=block_timestamp,
-        event_type=models.GameEventType.REWARDS_CLAIMED,
-        user_address=user_address,
-        amount=amount,
-        session=session,
+    await add_event(
+        models.GameEvent(
+            transaction_hash=transaction_hash,
+            created_at=block_timestamp,
+            event_type=models.GameEventType.REWARDS_CLAIMED,
+            user_address=user_address,
+            amount=amount,
+            session=session,
+        )
     )
 
     # Update user deposits to reflect claimed rewards (if they exist)
@@ -2,6 +2,10 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import save_entity
+from defi_space_indexer.reserve_history import record_reserves
 from defi_space_indexer.types.amm_pair.starknet_events.skim import SkimPayload
 
 
@@ -10,7 +14,7 @@ async def on_skim(
     event: StarknetEvent[SkimPayload],
 ) -> None:
     # Extract data from event payload
-    sender_address = f'0x{event.payload.sender:x}'
+    sender_address = normalize_address(event.payload.sender)
     reserve0 = event.payload.reserve0
     reserve1 = event.payload.reserve1
     amount0 = event.payload.amount0
@@ -18,10 +22,10 @@ async def on_skim(
     block_timestamp = event.payload.block_timestamp
 
     # Get pair address from event data
-    pair_address = event.data.from_address
+    pair_address = normalize_address(event.data.from_address)
 
     # Get pair from database
-    pair = await models.Pair.get_or_none(address=pair_address)
+    pair = await get_entity(models.Pair, pair_address)
     if not pair:
         ctx.logger.warning(f'Pair {pair_address} not found when processing skim event')
         return
@@ -30,7 +34,10 @@ async def on_skim(
     pair.reserve0 = reserve0
     pair.reserve1 = reserve1
     pair.updated_at = block_timestamp
-    await pair.save()
+    await save_entity(pair)
+
+    # Keep the reserves of this block for historical queries
+    await record_reserves(pair, event.data.level, block_timestamp)
 
     ctx.logger.info(
         f'Skim event processed: sender={sender_address}, pair={pair_address}, amount0={amount0}, amount1={amount1}'
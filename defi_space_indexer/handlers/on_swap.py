@@ -1,9 +1,18 @@
-import decimal
-
 from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.amm_math import swap_price_impact
+from defi_space_indexer.amm_math import to_decimal
+from defi_space_indexer.candles import get_price
+from defi_space_indexer.candles import update_candles
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import save_entity
+from defi_space_indexer.event_buffer import add_event
+from defi_space_indexer.pair_stats import record_swap
+from defi_space_indexer.reserve_history import record_reserves
+from defi_space_indexer.scoring import mark_game_sessions_dirty
 from defi_space_indexer.types.amm_pair.starknet_events.swap import SwapPayload
 
 
@@ -12,7 +21,7 @@ async def on_swap(
     event: StarknetEvent[SwapPayload],
 ) -> None:
     # Extract data from event payload
-    sender_address = f'0x{event.payload.sender:x}'
+    sender_address = normalize_address(event.payload.sender)
     amount0_in = event.payload.amount0_in
     amount1_in = event.payload.amount1_in
     amount0_out = event.payload.amount0_out
@@ -22,94 +31,72 @@ async def on_swap(
     block_timestamp = event.payload.block_timestamp
 
     # Get pair address and transaction hash from event data
-    pair_address = event.data.from_address
+    pair_address = normalize_address(event.data.from_address)
     transaction_hash = event.data.transaction_hash
     block_number = event.data.level
 
     # Get pair from database
-    pair = await models.Pair.get_or_none(address=pair_address)
+    pair = await get_entity(models.Pair, pair_address)
     if not pair:
         ctx.logger.warning(f'Pair {pair_address} not found when processing swap event')
         return
 
-    # Calculate price impact using Uniswap V2 formula
-    price_impact = None
-    try:
-        # Get old reserves (before the swap)
-        old_reserve0 = pair.reserve0
-        old_reserve1 = pair.reserve1
-
-        # Determine which token is being swapped in and which is being swapped out
-        if amount0_in > 0 and amount1_out > 0:
-            # Swapping token0 for token1
-            reserve_in = old_reserve0
-            reserve_out = old_reserve1
-            amount_in = amount0_in
-            amount_out = amount1_out
-        elif amount1_in > 0 and amount0_out > 0:
-            # Swapping token1 for token0
-            reserve_in = old_reserve1
-            reserve_out = old_reserve0
-            amount_in = amount1_in
-            amount_out = amount0_out
-        else:
-            # Can't determine swap direction, skip price impact calculation
-            price_impact = decimal.Decimal('0')
-
-        if reserve_in > 0 and reserve_out > 0 and amount_in > 0 and amount_out > 0:
-            # Step 1: Calculate the swap fee (default 0.3% for Uniswap V2-like protocols)
-            fee = decimal.Decimal('0.003')  # 0.3%
-
-            # Step 2: Calculate amountOut using the constant product formula
-            amount_in_with_fee = decimal.Decimal(amount_in) * (decimal.Decimal('1') - fee)
-            (amount_in_with_fee * decimal.Decimal(reserve_out)) / (decimal.Decimal(reserve_in) + amount_in_with_fee)
-
-            # Step 3: Calculate effective price and market price
-            effective_price = decimal.Decimal(amount_in) / decimal.Decimal(amount_out)
-            market_price = decimal.Decimal(reserve_in) / decimal.Decimal(reserve_out)
-
-            # Step 4: Calculate price impact percentage
-            if effective_price > 0:
-                price_impact = decimal.Decimal('1') - (market_price / effective_price)
-
-                # Convert to percentage (keep as decimal for the database)
-                # No need to multiply by 100 as we'll store the raw value
-
-                # Ensure price impact is positive and not negative
-                price_impact = abs(price_impact)
-    except Exception as e:
-        ctx.logger.warning(f'Error calculating price impact: {e}')
-        price_impact = decimal.Decimal('0')
+    # Price impact of the swap, net of the constant 30 bps pair fee; 0 when the direction is ambiguous,
+    # NULL for an empty pool
+    price_impact_scaled = swap_price_impact(
+        amount0_in, amount1_in, amount0_out, amount1_out, reserve0, reserve1, pair.fee_bps
+    )
+    price_impact = to_decimal(price_impact_scaled) if price_impact_scaled is not None else None
 
     # Update pair reserves
     pair.reserve0 = reserve0
     pair.reserve1 = reserve1
     pair.updated_at = block_timestamp
-    await pair.save()
+    await save_entity(pair)
+
+    # Keep the reserves of this block for historical queries
+    await record_reserves(pair, event.data.level, block_timestamp)
+
+    # The event names the caller (usually the router), not the recipient of the output tokens;
+    # any agent of the pair's sessions may have received them
+    await mark_game_sessions_dirty(pair.game_session_id)
+
+    # Fold the trade into the pair's price candles
+    price = get_price(reserve0, reserve1)
+    if price is not None:
+        await update_candles(
+            pair,
+            price,
+            block_timestamp,
+            volume0=amount0_in + amount0_out,
+            volume1=amount1_in + amount1_out,
+            trades=1,
+        )
+
+    # Roll the pair's 24h and 7d counters forward
+    await record_swap(pair, amount0_in, amount1_in, amount0_out, amount1_out, block_timestamp)
 
     # In our payload we don't have a 'to' field, so we'll use the sender address
     # In more advanced implementations, the 'to' field would be extracted from the event payload if available
     to_address = sender_address  # Default to sender if 'to' is not in the payload
 
     # Create swap event record
-    await models.SwapEvent.create(
-        transaction_hash=transaction_hash,
-        created_at=block_timestamp,
-        block_number=block_number,
-        sender=sender_address,
-        to=to_address,  # Set the recipient address
-        amount0_in=amount0_in,
-        amount1_in=amount1_in,
-        amount0_out=amount0_out,
-        amount1_out=amount1_out,
-        price_impact=price_impact,
-        pair=pair,
+    await add_event(
+        models.SwapEvent(
+            transaction_hash=transaction_hash,
+            created_at=block_timestamp,
+            block_number=block_number,
+            sender=sender_address,
+            to=to_address,  # Set the recipient address
+            amount0_in=amount0_in,
+            amount1_in=amount1_in,
+            amount0_out=amount0_out,
+            amount1_out=amount1_out,
+            price_impact=price_impact,
+            pair=pair,
+        )
     )
 
-    # Calculate and log some useful metrics
-    amount0_in + (amount1_in * reserve0 // reserve1 if reserve1 > 0 else 0)
-    amount0_out + (amount1_out * reserve0 // reserve1 if reserve1 > 0 else 0)
-
     ctx.logger.info(
         f'Swap event processed: sender={sender_address}, pair={pair_address}, '
         f'amount0_in={amount0_in}, amount1_in={amount1_in}, '
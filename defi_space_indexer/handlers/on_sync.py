@@ -2,6 +2,13 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.candles import get_price
+from defi_space_indexer.candles import update_candles
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import save_entity
+from defi_space_indexer.reserve_history import record_reserves
+from defi_space_indexer.twap import update_price_accumulators
 from defi_space_indexer.types.amm_pair.starknet_events.sync import SyncPayload
 
 
@@ -17,10 +24,10 @@ async def on_sync(
     block_timestamp = event.payload.block_timestamp
 
     # Get pair address from event data
-    pair_address = event.data.from_address
+    pair_address = normalize_address(event.data.from_address)
 
     # Get pair from database
-    pair = await models.Pair.get_or_none(address=pair_address)
+    pair = await get_entity(models.Pair, pair_address)
     if not pair:
         ctx.logger.warning(f'Pair {pair_address} not found when processing sync event')
         return
@@ -28,10 +35,23 @@ async def on_sync(
     # Update pair data
     pair.reserve0 = reserve0
     pair.reserve1 = reserve1
-    pair.price_0_cumulative_last = price_0_cumulative_last
-    pair.price_1_cumulative_last = price_1_cumulative_last
-    pair.block_timestamp_last = block_timestamp
+    await update_price_accumulators(
+        pair,
+        price_0_cumulative_last,
+        price_1_cumulative_last,
+        block_timestamp,
+        event.data.transaction_hash,
+        event.data.level,
+    )
     pair.updated_at = block_timestamp
-    await pair.save()
+    await save_entity(pair)
+
+    # Keep the reserves of this block for historical queries
+    await record_reserves(pair, event.data.level, block_timestamp)
+
+    # Reserve-only moves (mints, burns, donations) shift the price too
+    price = get_price(reserve0, reserve1)
+    if price is not None:
+        await update_candles(pair, price, block_timestamp)
 
     ctx.logger.info(f'Sync event processed: pair={pair_address}, reserve0={reserve0}, reserve1={reserve1}')
@@ -2,8 +2,10 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.event_buffer import add_event
 from defi_space_indexer.types.faucet.starknet_events.token_added import TokenAddedPayload
-from defi_space_indexer.utils import get_token_info
+from defi_space_indexer.utils import get_cached_token_info
 
 
 async def on_token_added(
@@ -11,12 +13,12 @@ async def on_token_added(
     event: StarknetEvent[TokenAddedPayload],
 ) -> None:
     # Extract data from event payload
-    token_address = f'0x{event.payload.token:x}'
+    token_address = normalize_address(event.payload.token)
     amount = event.payload.amount
     claim_amount = event.payload.claim_amount
 
     # Get faucet address and other data from event data
-    faucet_address = event.data.from_address
+    faucet_address = normalize_address(event.data.from_address)
     transaction_hash = event.data.transaction_hash
     block_timestamp = event.payload.block_timestamp
 
@@ -33,7 +35,7 @@ async def on_token_added(
         await faucet.save()
 
     # Fetch token name, symbol, and decimals
-    token_name, token_symbol, token_decimals = await get_token_info(token_address)
+    token_name, token_symbol, token_decimals = await get_cached_token_info(token_address)
 
     # Create or update the FaucetToken model
     token, created = await models.FaucetToken.get_or_create(
@@ -63,17 +65,19 @@ async def on_token_added(
         await token.save()
 
     # Create claim event to track token addition
-    await models.ClaimEvent.create(
-        transaction_hash=transaction_hash,
-        created_at=block_timestamp,
-        event_type=models.ClaimEventType.TOKEN_ADDED,
-        user_address=faucet.owner,  # Using faucet owner as the user who added the token
-        token_address=token_address,
-        faucet_address=faucet_address,
-        amount=amount,
-        faucet=faucet,
-        token=token,
-        user=None,  # No specific user for token addition
+    await add_event(
+        models.ClaimEvent(
+            transaction_hash=transaction_hash,
+            created_at=block_timestamp,
+            event_type=models.ClaimEventType.TOKEN_ADDED,
+            user_address=faucet.owner,  # Using faucet owner as the user who added the token
+            token_address=token_address,
+            faucet_address=faucet_address,
+            amount=amount,
+            faucet=faucet,
+            token=token,
+            user=None,  # No specific user for token addition
+        )
     )
 
     ctx.logger.info(
@@ -2,6 +2,9 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.event_buffer import add_event
+from defi_space_indexer.scoring import mark_game_agent_dirty
 from defi_space_indexer.types.faucet.starknet_events.claim import ClaimPayload
 
 
@@ -10,10 +13,10 @@ async def on_token_claimed(
     event: StarknetEvent[ClaimPayload],
 ) -> None:
     # Extract data from event payload
-    sender_address = f'0x{event.payload.sender:x}'
-    token_address = f'0x{event.payload.token:x}'
+    sender_address = normalize_address(event.payload.sender)
+    token_address = normalize_address(event.payload.token)
     amount = event.payload.amount
-    faucet_address = f'0x{event.payload.faucet_address:x}'
+    faucet_address = normalize_address(event.payload.faucet_address)
     total_token_amount = event.payload.total_token_amount
     claimed_at = event.payload.claimed_at
     block_timestamp = event.payload.block_timestamp
@@ -57,19 +60,25 @@ async def on_token_claimed(
         user.updated_at = block_timestamp
         await user.save()
 
+    # Claimed tokens change the claimer's wallet balances
+    if faucet.game_session_id is not None:
+        await mark_game_agent_dirty(sender_address, faucet.game_session_id)
+
     # Create claim event
     if token:
-        await models.ClaimEvent.create(
-            transaction_hash=transaction_hash,
-            created_at=block_timestamp,
-            event_type=models.ClaimEventType.CLAIM,
-            user_address=sender_address,
-            token_address=token_address,
-            faucet_address=faucet_address,
-            amount=amount,
-            faucet=faucet,
-            token=token,
-            user=user,
+        await add_event(
+            models.ClaimEvent(
+                transaction_hash=transaction_hash,
+                created_at=block_timestamp,
+                event_type=models.ClaimEventType.CLAIM,
+                user_address=sender_address,
+                token_address=token_address,
+                faucet_address=faucet_address,
+                amount=amount,
+                faucet=faucet,
+                token=token,
+                user=user,
+            )
         )
     else:
         ctx.logger.warning(f'Token {token_address} not found in faucet {faucet_address} when creating claim event')
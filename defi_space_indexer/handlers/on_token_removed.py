@@ -2,6 +2,8 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.event_buffer import add_event
 from defi_space_indexer.types.faucet.starknet_events.token_removed import TokenRemovedPayload
 
 
@@ -10,11 +12,11 @@ async def on_token_removed(
     event: StarknetEvent[TokenRemovedPayload],
 ) -> None:
     # Extract data from event payload
-    token_address = f'0x{event.payload.token:x}'
+    token_address = normalize_address(event.payload.token)
     block_timestamp = event.payload.block_timestamp
 
     # Get faucet address from event data
-    faucet_address = event.data.from_address
+    faucet_address = normalize_address(event.data.from_address)
     transaction_hash = event.data.transaction_hash
 
     # Get faucet from database
@@ -35,17 +37,19 @@ async def on_token_removed(
         )
 
         # Create claim event to track token removal
-        await models.ClaimEvent.create(
-            transaction_hash=transaction_hash,
-            created_at=block_timestamp,
-            event_type=models.ClaimEventType.TOKEN_REMOVED,
-            user_address=faucet.owner,  # Using faucet owner as the user who removed the token
-            token_address=token_address,
-            faucet_address=faucet_address,
-            amount=token.initial_amount,  # Recording the amount that was removed
-            faucet=faucet,
-            token=token,
-            user=None,  # No specific user for token removal
+        await add_event(
+            models.ClaimEvent(
+                transaction_hash=transaction_hash,
+                created_at=block_timestamp,
+                event_type=models.ClaimEventType.TOKEN_REMOVED,
+                user_address=faucet.owner,  # Using faucet owner as the user who removed the token
+                token_address=token_address,
+                faucet_address=faucet_address,
+                amount=token.initial_amount,  # Recording the amount that was removed
+                faucet=faucet,
+                token=token,
+                user=None,  # No specific user for token removal
+            )
         )
 
         # Update faucet tokens list
@@ -2,9 +2,13 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.event_buffer import add_event
 from defi_space_indexer.types.farming_farm.starknet_events.unallocated_rewards_claimed import (
     UnallocatedRewardsClaimedPayload,
 )
+from defi_space_indexer.utils import to_amount
 
 
 async def on_unallocated_rewards_claimed(
@@ -12,17 +16,17 @@ async def on_unallocated_rewards_claimed(
     event: StarknetEvent[UnallocatedRewardsClaimedPayload],
 ) -> None:
     # Extract data from event payload
-    reward_token_address = f'0x{event.payload.reward_token:x}'
+    reward_token_address = normalize_address(event.payload.reward_token)
     amount = event.payload.amount
-    claimer_address = f'0x{event.payload.claimer:x}'
+    claimer_address = normalize_address(event.payload.claimer)
     unallocated_rewards = event.payload.unallocated_rewards
     block_timestamp = event.payload.block_timestamp
 
     # Get farm address from event data
-    farm_address = event.data.from_address
+    farm_address = normalize_address(event.data.from_address)
 
     # Get farm from database
-    farm = await models.Farm.get_or_none(address=farm_address)
+    farm = await get_entity(models.Farm, farm_address)
     if not farm:
         ctx.logger.warning(f'Farm {farm_address} not found when claiming unallocated rewards')
         return
@@ -35,24 +39,26 @@ async def on_unallocated_rewards_claimed(
         reward.unallocated_rewards = unallocated_rewards
 
         # Decrease remaining_amount when unallocated rewards are claimed
-        reward.remaining_amount = str(int(reward.remaining_amount) - int(amount))
+        reward.remaining_amount = to_amount(reward.remaining_amount) - amount
 
         reward.updated_at = block_timestamp
         await reward.save()
 
         # Create a reward event to track this claim
         transaction_hash = event.data.transaction_hash
-        await models.RewardEvent.create(
-            transaction_hash=transaction_hash,
-            created_at=block_timestamp,
-            event_type=models.RewardEventType.REWARD_ADDED,  # Using REWARD_ADDED as there's no specific type for unallocated claims
-            agent_address=claimer_address,
-            reward_token=reward_token_address,
-            reward_amount=amount,
-            reward_rate=None,
-            reward_duration=None,
-            period_finish=None,
-            farm=farm,
+        await add_event(
+            models.RewardEvent(
+                transaction_hash=transaction_hash,
+                created_at=block_timestamp,
+                event_type=models.RewardEventType.REWARD_ADDED,  # Using REWARD_ADDED as there's no specific type for unallocated claims
+                agent_address=claimer_address,
+                reward_token=reward_token_address,
+                reward_amount=amount,
+                reward_rate=None,
+                reward_duration=None,
+                period_finish=None,
+                farm=farm,
+            )
         )
 
     ctx.logger.info(
@@ -2,6 +2,8 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_entity
 from defi_space_indexer.types.farming_farm.starknet_events.unallocated_rewards_updated import (
     UnallocatedRewardsUpdatedPayload,
 )
@@ -12,16 +14,16 @@ async def on_unallocated_rewards_updated(
     event: StarknetEvent[UnallocatedRewardsUpdatedPayload],
 ) -> None:
     # Extract data from event payload
-    reward_token_address = f'0x{event.payload.reward_token:x}'
+    reward_token_address = normalize_address(event.payload.reward_token)
     previous_amount = event.payload.previous_amount
     new_amount = event.payload.new_amount
     block_timestamp = event.payload.block_timestamp
 
     # Get farm address from event data
-    farm_address = event.data.from_address
+    farm_address = normalize_address(event.data.from_address)
 
     # Get farm from database
-    farm = await models.Farm.get_or_none(address=farm_address)
+    farm = await get_entity(models.Farm, farm_address)
     if not farm:
         ctx.logger.warning(f'Farm {farm_address} not found when updating unallocated rewards')
         return
@@ -2,6 +2,12 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_agent_by_index
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import save_entity
+from defi_space_indexer.event_buffer import add_event
+from defi_space_indexer.scoring import mark_agent_dirty
 from defi_space_indexer.types.game_session.starknet_events.user_deposited import UserDepositedPayload
 
 
@@ -10,7 +16,7 @@ async def on_user_deposited(
     event: StarknetEvent[UserDepositedPayload],
 ) -> None:
     # Extract data from event payload
-    user_address = f'0x{event.payload.user:x}'
+    user_address = normalize_address(event.payload.user)
     agent_index = event.payload.agent_index
     amount = event.payload.amount
     old_score = event.payload.old_score
@@ -18,30 +24,25 @@ async def on_user_deposited(
     block_timestamp = event.payload.block_timestamp
 
     # Get session address from event data
-    session_address = event.data.from_address
+    session_address = normalize_address(event.data.from_address)
     transaction_hash = event.data.transaction_hash
 
     # Get session from database
-    session = await models.GameSession.get_or_none(address=session_address)
+    session = await get_entity(models.GameSession, session_address)
     if not session:
         ctx.logger.warning(f'Session {session_address} not found when processing user deposit')
         return
 
-    # Find the agent by index in the session's agents list
-    agent = None
-    for agent_address in session.agents_list:
-        agent_obj = await models.Agent.get_or_none(address=agent_address, session_address=session_address)
-        if agent_obj and agent_obj.agent_index == agent_index:
-            agent = agent_obj
-            break
-
+    # Find the agent by its index in the session
+    agent = await get_agent_by_index(session_address, agent_index)
     if not agent:
         ctx.logger.warning(f'Agent with index {agent_index} not found for session {session_address}')
         return
 
     # Update agent timestamp - total_deposited is handled by the on_agent_updated handler
     agent.updated_at = block_timestamp
-    await agent.save()
+    await save_entity(agent)
+    mark_agent_dirty(agent.address, session_address)
 
     # Check if a user deposit record already exists
     user_deposit = await models.UserDeposit.get_or_none(
@@ -80,16 +81,18 @@ async def on_user_deposited(
         )
 
     # Create game event record
-    await models.GameEvent.create(
-        transaction_hash=transaction_hash,
-        created_at=block_timestamp,
-        event_type=models.GameEventType.USER_DEPOSITED,
-        user_address=user_address,
-        agent_index=agent_index,
-        amount=amount,
-        old_score=old_score,
-        new_score=new_score,
-        session=session,
+    await add_event(
+        models.GameEvent(
+            transaction_hash=transaction_hash,
+            created_at=block_timestamp,
+            event_type=models.GameEventType.USER_DEPOSITED,
+            user_address=user_address,
+            agent_index=agent_index,
+            amount=amount,
+            old_score=old_score,
+            new_score=new_score,
+            session=session,
+        )
     )
 
     ctx.logger.info(
@@ -2,6 +2,7 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
 from defi_space_indexer.types.faucet.starknet_events.removed_from_whitelist import RemovedFromWhitelistPayload
 
 
@@ -10,10 +11,10 @@ async def on_user_removed_from_whitelist(
     event: StarknetEvent[RemovedFromWhitelistPayload],
 ) -> None:
     # Extract data from event payload
-    user_address = f'0x{event.payload.address:x}'
+    user_address = normalize_address(event.payload.address)
 
     # Get faucet address and timestamp from event data
-    faucet_address = event.data.from_address
+    faucet_address = normalize_address(event.data.from_address)
 
     # Get user from database
     user = await models.WhitelistedUser.get_or_none(address=user_address, faucet_address=faucet_address)
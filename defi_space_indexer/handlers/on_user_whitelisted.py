@@ -2,6 +2,7 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
 from defi_space_indexer.types.faucet.starknet_events.added_to_whitelist import AddedToWhitelistPayload
 
 
@@ -10,10 +11,10 @@ async def on_user_whitelisted(
     event: StarknetEvent[AddedToWhitelistPayload],
 ) -> None:
     # Extract data from event payload
-    user_address = f'0x{event.payload.address:x}'
+    user_address = normalize_address(event.payload.address)
 
     # Get faucet address from event data and timestamp from payload
-    faucet_address = event.data.from_address
+    faucet_address = normalize_address(event.data.from_address)
     block_timestamp = event.payload.block_timestamp
 
     # Get faucet from database
@@ -2,6 +2,11 @@ from dipdup.context import HandlerContext
 from dipdup.models.starknet import StarknetEvent
 
 from defi_space_indexer import models as models
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import save_entity
+from defi_space_indexer.event_buffer import add_event
+from defi_space_indexer.scoring import mark_game_agent_dirty
 from defi_space_indexer.types.farming_farm.starknet_events.withdraw import WithdrawPayload
 
 
@@ -10,7 +15,7 @@ async def on_withdraw(
     event: StarknetEvent[WithdrawPayload],
 ) -> None:
     # Extract data from event payload
-    user_address = f'0x{event.payload.user_address:x}'
+    user_address = normalize_address(event.payload.user_address)
     staked_amount = event.payload.staked_amount
     penalty_amount = event.payload.penalty_amount
     total_staked = event.payload.total_staked
@@ -19,11 +24,11 @@ async def on_withdraw(
     block_timestamp = event.payload.block_timestamp
 
     # Get farm address and transaction hash from event data
-    farm_address = event.data.from_address
+    farm_address = normalize_address(event.data.from_address)
     transaction_hash = event.data.transaction_hash
 
     # Get farm from database
-    farm = await models.Farm.get_or_none(address=farm_address)
+    farm = await get_entity(models.Farm, farm_address)
     if not farm:
         ctx.logger.warning(f'Farm {farm_address} not found when processing withdraw')
         return
@@ -31,7 +36,7 @@ async def on_withdraw(
     # Update farm total staked
     farm.total_staked = total_staked
     farm.updated_at = block_timestamp
-    await farm.save()
+    await save_entity(farm)
 
     # Get user's stake
     agent_stake = await models.AgentStake.get_or_none(agent_address=user_address, farm_address=farm_address)
@@ -42,21 +47,24 @@ async def on_withdraw(
         agent_stake.penalty_end_time = penalty_end_time
         agent_stake.updated_at = block_timestamp
         await agent_stake.save()
+        await mark_game_agent_dirty(user_address, farm.game_session_id)
     else:
         ctx.logger.warning(
             f'AgentStake for agent {user_address} in farm {farm_address} not found when processing withdraw'
         )
 
     # Create agent stake event
-    await models.AgentStakeEvent.create(
-        transaction_hash=transaction_hash,
-        created_at=block_timestamp,
-        event_type=models.StakeEventType.WITHDRAW,
-        agent_address=user_address,
-        staked_amount=staked_amount,
-        penalty_amount=penalty_amount,
-        farm=farm,
-        stake=agent_stake,
+    await add_event(
+        models.AgentStakeEvent(
+            transaction_hash=transaction_hash,
+            created_at=block_timestamp,
+            event_type=models.StakeEventType.WITHDRAW,
+            agent_address=user_address,
+            staked_amount=staked_amount,
+            penalty_amount=penalty_amount,
+            farm=farm,
+            stake=agent_stake,
+        )
     )
 
     ctx.logger.info(
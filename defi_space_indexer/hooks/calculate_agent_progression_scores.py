@@ -11,7 +11,7 @@ Total Score = Resource Balance Score + LP Token Balance Score + Farming Score
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 📊 1. RESOURCE BALANCE SCORE
-   Direct wallet token balances (ERC20 tokens) via RPC calls:
+   Direct wallet token balances (ERC20 tokens) via batched RPC calls, in both modes:
    
    Formula: Σ(token_balance × token_weight)
    
@@ -24,7 +24,7 @@ Total Score = Resource Balance Score + LP Token Balance Score + Farming Score
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 💧 2. LP TOKEN BALANCE SCORE
-   LP tokens held in wallet via RPC calls:
+   LP tokens held in wallet (rpc mode) or indexed LiquidityPosition rows (indexed mode):
    
    Formula: Σ(lp_balance × pool_weight)
    
@@ -39,7 +39,8 @@ Total Score = Resource Balance Score + LP Token Balance Score + Farming Score
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 🚜 3. FARMING SCORE
-   Farming rewards and participation via RPC calls:
+   Farming rewards and participation, from the farms' `earned` (rpc mode) or from
+   indexed reward checkpoints accrued up to the pass timestamp (indexed mode):
    
    Formula: Σ((pending_rewards × token_weight) × farm_multiplier)
    
@@ -51,31 +52,84 @@ Total Score = Resource Balance Score + LP Token Balance Score + Farming Score
 
 🔢 VALUE NORMALIZATION:
    All raw contract values are converted to human-readable format using proper decimals.
-   Token info is cached to minimize RPC calls.
+   Token info comes from the shared token metadata cache (in-process LRU backed by TokenMetadata).
 
 ⏰ EXECUTION:
-   • Runs every 5 minutes via cron job
-   • All scoring calculations done via RPC calls
-   • Stores results in AgentScore model with detailed breakdowns
+   • Runs every 5 minutes via the `progression_scores_every_5min` cron job, in either mode
+   • In indexed mode, also every SCORING_INTERVAL seconds via the `progression_scores_refresh` job
+   • Overlapping runs are skipped while a pass is still in progress
+   • Agents are scored concurrently; in-flight RPC calls are bounded by SCORING_CONCURRENCY
+   • Wallet and LP balances of a session are fetched with chunked JSON-RPC batch requests
+   • Only agents marked dirty by handlers (liquidity, staking, rewards, deposits, claims) in the
+     affected session are rescored, once the level that marked them is committed; a swap marks
+     every agent of the pair's sessions, as the event does not name the recipient. Flags taken by
+     a failed pass are put back. Every agent is rescored on a full sweep every
+     SCORING_FULL_SWEEP_INTERVAL seconds, on the first pass of the process and after a rollback
+   • Stores results in AgentScore model with detailed breakdowns, one bulk upsert per session
+
+🗂️ SCORING MODES (SCORING_MODE environment variable):
+   • rpc (default): all three components are read from the contracts via RPC
+   • indexed: LP and farming components are derived from indexed state
+     (LiquidityPosition, AgentStake, RewardPerAgent, Reward) with bulk queries; only raw ERC20
+     wallet balances still come from RPC. Cheap enough to run every few seconds
+     through the `refresh_progression_scores` job.
 """
 
+import asyncio
 import time
 from decimal import Decimal
-from typing import Dict, Optional, List, Tuple
+from typing import Awaitable, Dict, Optional, List, Set, Tuple, TypeVar
 import os
 
 from dipdup.context import HookContext
-from starknet_py.contract import Contract
-from starknet_py.net.full_node_client import FullNodeClient
-
-from defi_space_indexer.models import Agent, AgentScore, AgentStake, Farm, GameSession, Pair, Reward
-from defi_space_indexer.utils import get_token_info
-
-# Get the node URL from environment variables
-RPC_URL = os.environ.get('NODE_URL', '') + '/' + os.environ.get('NODE_API_KEY', '')
-
-# Token info cache to avoid repeated RPC calls
-TOKEN_INFO_CACHE: Dict[str, Tuple[str, str, int]] = {}
+from dipdup.models import Index
+from tortoise.expressions import Q
+
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.models import (
+    Agent,
+    AgentScore,
+    AgentStake,
+    Farm,
+    GameSession,
+    LiquidityPosition,
+    Pair,
+    Reward,
+    RewardPerAgent,
+)
+from defi_space_indexer.rpc import batch_call
+from defi_space_indexer.rpc import get_contract
+from defi_space_indexer.scoring import is_full_sweep_due
+from defi_space_indexer.scoring import mark_agent_dirty
+from defi_space_indexer.scoring import record_full_sweep
+from defi_space_indexer.scoring import restore_dirty_agents
+from defi_space_indexer.scoring import take_dirty_agents
+from defi_space_indexer.utils import get_cached_token_info
+
+# Maximum number of RPC calls in flight at once during a scoring pass
+SCORING_CONCURRENCY = int(os.environ.get('SCORING_CONCURRENCY', '32'))
+
+# Where LP and farming components come from: 'rpc' (contract calls) or 'indexed' (indexed database state)
+SCORING_MODE = os.environ.get('SCORING_MODE', 'rpc')
+
+# Maximum number of AgentScore rows per upsert statement
+SCORE_WRITE_BATCH_SIZE = int(os.environ.get('SCORE_WRITE_BATCH_SIZE', '500'))
+
+# AgentScore columns overwritten when a score row already exists (created_at is kept)
+AGENT_SCORE_UPDATE_FIELDS = [
+    'agent_index',
+    'resource_balance_score',
+    'lp_position_score',
+    'farming_score',
+    'total_score',
+    'last_calculated_at',
+    'updated_at',
+]
+
+# Prevents overlapping passes when a run outlasts the interval of the job triggering it
+_scoring_lock = asyncio.Lock()
+
+T = TypeVar('T')
 
 # Token weights configuration
 TOKEN_WEIGHTS = {
@@ -107,23 +161,10 @@ LP_POOL_WEIGHTS = {
 }
 
 
-async def get_cached_token_info(token_address: str) -> Tuple[str, str, int]:
-    """Get token info with caching to avoid repeated RPC calls"""
-    # Ensure address is properly formatted as hex string
-    if isinstance(token_address, int):
-        token_address = f"0x{token_address:x}"
-    elif isinstance(token_address, str) and not token_address.startswith('0x'):
-        # If it's a string but doesn't start with 0x, assume it's an integer string
-        try:
-            token_address = f"0x{int(token_address):x}"
-        except ValueError:
-            # If conversion fails, assume it's already a hex string without 0x
-            token_address = f"0x{token_address}"
-    
-    if token_address not in TOKEN_INFO_CACHE:
-        name, symbol, decimals = await get_token_info(token_address)
-        TOKEN_INFO_CACHE[token_address] = (name, symbol, decimals)
-    return TOKEN_INFO_CACHE[token_address]
+async def limited(semaphore: asyncio.Semaphore, awaitable: Awaitable[T]) -> T:
+    """Await an RPC call while holding a slot of the scoring concurrency limit"""
+    async with semaphore:
+        return await awaitable
 
 
 def normalize_token_amount(raw_amount: Decimal, decimals: int) -> Decimal:
@@ -131,6 +172,14 @@ def normalize_token_amount(raw_amount: Decimal, decimals: int) -> Decimal:
     return raw_amount / (Decimal(10) ** decimals)
 
 
+def get_pool_weight(pair: Pair) -> int:
+    """Get the LP pool weight of a pair, regardless of token order"""
+    pool_key = f"{pair.token0_symbol}/{pair.token1_symbol}"
+    if pool_key not in LP_POOL_WEIGHTS:
+        pool_key = f"{pair.token1_symbol}/{pair.token0_symbol}"
+    return LP_POOL_WEIGHTS.get(pool_key, 1)
+
+
 def handle_u256_value(value) -> Decimal:
     """Handle u256 format values from Starknet contracts"""
     if isinstance(value, dict) and 'low' in value and 'high' in value:
@@ -141,30 +190,169 @@ def handle_u256_value(value) -> Decimal:
         return Decimal(str(value))
 
 
+class SessionScoringContext:
+    """
+    Everything scoring reads from the database for one game session, loaded once per pass:
+    pairs, farms, reward tokens, farm multipliers, token metadata and the agents' stakes.
+    Per-agent scoring is then pure computation plus RPC, without database queries.
+    """
+
+    def __init__(
+        self,
+        session: GameSession,
+        pairs: List[Pair],
+        farms: List[Farm],
+        rewards_by_farm: Dict[str, List[Reward]],
+        stakes_by_agent: Dict[str, List[AgentStake]],
+        reward_states: Dict[Tuple[int, str], RewardPerAgent],
+        token_info: Dict[str, Tuple[str, int]],
+    ) -> None:
+        self.session = session
+        self.pairs = pairs
+        self.farms = {farm.address: farm for farm in farms}
+        self.rewards_by_farm = rewards_by_farm
+        self.stakes_by_agent = stakes_by_agent
+        # RewardPerAgent checkpoints by (stake id, reward token address)
+        self.reward_states = reward_states
+        # (symbol, decimals) by token and LP pair address
+        self.token_info = token_info
+
+        # ERC20 tokens of the session: pair tokens and farm reward tokens
+        self.token_addresses = set()
+        for pair in pairs:
+            self.token_addresses.update((pair.token0_address, pair.token1_address))
+        for farm in farms:
+            self.token_addresses.update(farm.reward_tokens or [])
+
+        # farm_multiplier = 1 + Σ(reward_token_weight / 10)
+        self.farm_multipliers = {}
+        for farm in farms:
+            farm_multiplier = Decimal(1)
+            for reward in rewards_by_farm.get(farm.address, []):
+                farm_multiplier += Decimal(str(TOKEN_WEIGHTS.get(reward.reward_token_symbol, 1))) / Decimal(10)
+            self.farm_multipliers[farm.address] = farm_multiplier
+
+    @classmethod
+    async def load(cls, session: GameSession, agent_addresses: List[str]) -> 'SessionScoringContext':
+        """Load the scoring context of a session for the given agents"""
+        game_session_id = session.game_session_index
+        pairs = await Pair.filter(game_session_id=game_session_id)
+        farms = await Farm.filter(game_session_id=game_session_id)
+        farm_addresses = [farm.address for farm in farms]
+
+        rewards_by_farm: Dict[str, List[Reward]] = {}
+        stakes_by_agent: Dict[str, List[AgentStake]] = {}
+        reward_states: Dict[Tuple[int, str], RewardPerAgent] = {}
+        if farm_addresses:
+            for reward in await Reward.filter(farm_address__in=farm_addresses):
+                rewards_by_farm.setdefault(reward.farm_address, []).append(reward)
+            if agent_addresses:
+                stakes = await AgentStake.filter(farm_address__in=farm_addresses, agent_address__in=agent_addresses)
+                for stake in stakes:
+                    stakes_by_agent.setdefault(stake.agent_address, []).append(stake)
+                if SCORING_MODE == 'indexed':
+                    reward_state_rows = await RewardPerAgent.filter(
+                        farm_address__in=farm_addresses, agent_address__in=agent_addresses
+                    )
+                    for reward_state in reward_state_rows:
+                        reward_states[(reward_state.agent_stake_id, reward_state.reward_token_address)] = reward_state
+
+        token_addresses = {pair.address for pair in pairs}
+        for pair in pairs:
+            token_addresses.update((pair.token0_address, pair.token1_address))
+        for farm in farms:
+            token_addresses.update(farm.reward_tokens or [])
+        token_addresses = list(token_addresses)
+        token_infos = await asyncio.gather(*(get_cached_token_info(address) for address in token_addresses))
+        token_info = {
+            address: (symbol, decimals) for address, (_, symbol, decimals) in zip(token_addresses, token_infos)
+        }
+
+        return cls(session, pairs, farms, rewards_by_farm, stakes_by_agent, reward_states, token_info)
+
+    @property
+    def balance_token_addresses(self) -> List[str]:
+        """Tokens whose balance_of is read over RPC: ERC20 tokens, plus LP pairs in rpc mode"""
+        addresses = set(self.token_addresses)
+        if SCORING_MODE != 'indexed':
+            addresses.update(pair.address for pair in self.pairs)
+        return list(addresses)
+
+    async def get_token_info(self, token_address: str) -> Tuple[str, int]:
+        """Get (symbol, decimals) of a token, falling back to the shared cache for tokens outside the session"""
+        if token_address not in self.token_info:
+            _, symbol, decimals = await get_cached_token_info(token_address)
+            self.token_info[token_address] = (symbol, decimals)
+        return self.token_info[token_address]
+
+
 async def calculate_agent_progression_scores(
     ctx: HookContext,
 ) -> None:
     """
-    Calculate progression scores for agents based on their onchain state via RPC calls.
+    Calculate progression scores for agents based on their onchain state.
     
     Scoring Logic:
-    - Resource Balance Score: Direct wallet token balances * token weights (via RPC)
-    - LP Token Balance Score: LP token balances * pool weights (via RPC)  
-    - Farming Score: (Pending farm rewards * token weights) * farm multiplier (via RPC)
+    - Resource Balance Score: Direct wallet token balances * token weights (batched RPC)
+    - LP Token Balance Score: LP token balances * pool weights (RPC, or indexed positions)
+    - Farming Score: (Pending farm rewards * token weights) * farm multiplier (RPC, or indexed rewards)
     - Total Score: Resource + LP + Farming scores
     
-    All calculations are done via RPC calls for real-time accuracy.
+    SCORING_MODE selects where LP and farming components come from. Only agents marked dirty
+    are rescored, except on periodic full sweeps. A run is skipped if the previous one is still going.
     
     Note: Skips calculation for suspended or completed games to save resources.
     """
-    ctx.logger.info("Starting agent progression score calculation")
-    
-    # Clear token info cache at start of each run to get fresh data
-    TOKEN_INFO_CACHE.clear()
-    
-    # Get all agents
-    agents = await Agent.all()
-    
+    if _scoring_lock.locked():
+        ctx.logger.info("Previous agent progression score calculation still running, skipping")
+        return
+
+    async with _scoring_lock:
+        await run_scoring_pass(ctx)
+
+
+async def run_scoring_pass(ctx: HookContext) -> None:
+    """Score the dirty (or, on a full sweep, all) agents of active game sessions and store the results"""
+    full_sweep = is_full_sweep_due()
+    # Only flags of committed levels are taken, so the pass reads what their handlers wrote
+    committed_levels = dict(await Index.all().values_list('name', 'level'))
+    dirty_agents, dirty_sessions = take_dirty_agents(committed_levels)
+    try:
+        await score_agents(ctx, full_sweep, dirty_agents, dirty_sessions)
+    except BaseException:
+        # Keep the flags for the next pass rather than waiting for the next full sweep
+        restore_dirty_agents(dirty_agents, dirty_sessions)
+        raise
+
+
+async def score_agents(
+    ctx: HookContext,
+    full_sweep: bool,
+    dirty_agents: Set[Tuple[str, str]],
+    dirty_sessions: Set[str],
+) -> None:
+    """Score the given (or, on a full sweep, all) agents of active game sessions and store the results"""
+    ctx.logger.info(
+        f"Starting agent progression score calculation (mode={SCORING_MODE}, "
+        f"{'full sweep' if full_sweep else f'{len(dirty_agents)} dirty agents, {len(dirty_sessions)} dirty sessions'})"
+    )
+
+    if full_sweep:
+        agents = await Agent.all()
+    elif dirty_agents or dirty_sessions:
+        agents = await Agent.filter(
+            Q(session_address__in=list(dirty_sessions))
+            | Q(address__in=list({agent_address for agent_address, _ in dirty_agents}))
+        )
+        agents = [
+            agent
+            for agent in agents
+            if agent.session_address in dirty_sessions or (agent.address, agent.session_address) in dirty_agents
+        ]
+    else:
+        ctx.logger.info("No agent state changed since the last pass, nothing to score")
+        return
+
     current_time = int(time.time())
     
     ctx.logger.info(f"Processing {len(agents)} agents")
@@ -178,11 +366,16 @@ async def calculate_agent_progression_scores(
     
     # Check game status for each session and process only active games
     active_agents = []
+    active_sessions: Dict[str, GameSession] = {}
     skipped_sessions = 0
     
+    sessions = {
+        session.address: session
+        for session in await GameSession.filter(address__in=list(agents_by_session))
+    }
     for session_address, session_agents in agents_by_session.items():
         try:
-            session = await GameSession.get(address=session_address)
+            session = sessions[session_address]
             
             # Skip calculation if game is suspended or over
             if session.game_suspended or session.game_over:
@@ -192,6 +385,7 @@ async def calculate_agent_progression_scores(
                 
             # Add agents from active sessions to processing list
             active_agents.extend(session_agents)
+            active_sessions[session_address] = session
             
         except Exception as e:
             ctx.logger.error(f"Error checking session status for {session_address}: {e}")
@@ -199,47 +393,107 @@ async def calculate_agent_progression_scores(
     
     ctx.logger.info(f"Processing {len(active_agents)} agents from active games, skipped {skipped_sessions} suspended/completed sessions")
     
-    for agent in active_agents:
-        try:
-            # Calculate scores via RPC calls
-            resource_score = await calculate_resource_balance_score_rpc(ctx, agent.address, agent.session_address)
-            lp_score = await calculate_lp_balance_score_rpc(ctx, agent.address, agent.session_address)
-            farming_score = await calculate_pending_rewards_score_rpc(ctx, agent.address, agent.session_address)
-            
-            total_score = resource_score + lp_score + farming_score
-            
-            
-            # Update or create AgentScore record
-            agent_score, created = await AgentScore.get_or_create(
+    # Load everything scoring reads from the database once per session
+    scoring_contexts = dict(
+        zip(
+            active_sessions,
+            await asyncio.gather(
+                *(
+                    SessionScoringContext.load(session, [agent.address for agent in agents_by_session[session_address]])
+                    for session_address, session in active_sessions.items()
+                )
+            ),
+        )
+    )
+
+    # The semaphore bounds the number of in-flight RPC requests for the whole pass
+    semaphore = asyncio.Semaphore(SCORING_CONCURRENCY)
+
+    # Fetch every wallet (and in rpc mode LP) balance of each session with batched balance_of calls
+    session_balances = await asyncio.gather(
+        *(
+            fetch_session_balances(ctx, scoring_contexts[session_address], agents_by_session[session_address], semaphore)
+            for session_address in active_sessions
+        )
+    )
+    balances_by_session = dict(zip(active_sessions, session_balances))
+
+    if SCORING_MODE == 'indexed':
+        # Derive LP and farming components for whole sessions from indexed state
+        session_scores = await asyncio.gather(
+            *(
+                calculate_indexed_session_scores(
+                    ctx,
+                    scoring_contexts[session_address],
+                    agents_by_session[session_address],
+                    balances_by_session[session_address],
+                    current_time,
+                )
+                for session_address in active_sessions
+            )
+        )
+        scores_by_agent = {}
+        for scores in session_scores:
+            scores_by_agent.update(scores)
+        results = [scores_by_agent.get((agent.address, agent.session_address)) for agent in active_agents]
+    else:
+        # Score all agents concurrently
+        results = await asyncio.gather(
+            *(
+                calculate_agent_score(
+                    ctx,
+                    agent,
+                    scoring_contexts[agent.session_address],
+                    balances_by_session[agent.session_address][agent.address],
+                    semaphore,
+                )
+                for agent in active_agents
+            )
+        )
+
+    # Collect the computed scores per session, to be written with one upsert each
+    scores_by_session: Dict[str, List[AgentScore]] = {}
+    for agent, scores in zip(active_agents, results):
+        if scores is None:
+            # Retry agents that failed to score on the next pass
+            mark_agent_dirty(agent.address, agent.session_address)
+            continue
+
+        resource_score, lp_score, farming_score = scores
+        total_score = resource_score + lp_score + farming_score
+        scores_by_session.setdefault(agent.session_address, []).append(
+            AgentScore(
                 agent_address=agent.address,
                 session_address=agent.session_address,
-                defaults={
-                    'agent_index': agent.agent_index,
-                    'resource_balance_score': resource_score,
-                    'lp_position_score': lp_score,
-                    'farming_score': farming_score,
-                    'total_score': total_score,
-                    'last_calculated_at': current_time,
-                    'created_at': current_time,
-                    'updated_at': current_time,
-                }
+                agent_index=agent.agent_index,
+                resource_balance_score=resource_score,
+                lp_position_score=lp_score,
+                farming_score=farming_score,
+                total_score=total_score,
+                last_calculated_at=current_time,
+                created_at=current_time,
+                updated_at=current_time,
             )
-            
-            if not created:
-                # Update existing record
-                agent_score.resource_balance_score = resource_score
-                agent_score.lp_position_score = lp_score
-                agent_score.farming_score = farming_score
-                agent_score.total_score = total_score
-                agent_score.last_calculated_at = current_time
-                agent_score.updated_at = current_time
-                await agent_score.save()
-            
-            ctx.logger.info(f"Agent {agent.address}: total_score={total_score}")
-            
+        )
+        ctx.logger.debug(f"Agent {agent.address}: total_score={total_score}")
+
+    for session_address, agent_scores in scores_by_session.items():
+        try:
+            # INSERT ... ON CONFLICT (agent_address, session_address) DO UPDATE, on both PostgreSQL and SQLite
+            await AgentScore.bulk_create(
+                agent_scores,
+                batch_size=SCORE_WRITE_BATCH_SIZE,
+                on_conflict=['agent_address', 'session_address'],
+                update_fields=AGENT_SCORE_UPDATE_FIELDS,
+            )
+            ctx.logger.info(f"Stored {len(agent_scores)} agent scores for session {session_address}")
         except Exception as e:
-            ctx.logger.error(f"Error calculating score for agent {agent.address}: {e}")
-            continue
+            ctx.logger.error(f"Error saving agent scores for session {session_address}: {e}")
+            for agent_score in agent_scores:
+                mark_agent_dirty(agent_score.agent_address, agent_score.session_address)
+
+    if full_sweep:
+        record_full_sweep()
 
     # Execute SQL script for additional optimizations
     await ctx.execute_sql_script('calculate_agent_progression_scores')
@@ -247,11 +501,88 @@ async def calculate_agent_progression_scores(
     ctx.logger.info("Completed agent progression score calculation")
 
 
+async def fetch_session_balances(
+    ctx: HookContext,
+    scoring: SessionScoringContext,
+    agents: List[Agent],
+    semaphore: asyncio.Semaphore,
+) -> Dict[str, Dict[str, Decimal]]:
+    """
+    Fetch the balances every agent of a session holds in every session token and LP pair.
+    Tokens come from the session's pairs and farm reward tokens, plus every LP pair address.
+    """
+    token_addresses = scoring.balance_token_addresses
+    balances = await fetch_balance_matrix([agent.address for agent in agents], token_addresses, semaphore)
+    ctx.logger.info(f"Fetched {len(agents)}x{len(token_addresses)} balances for session {scoring.session.address}")
+    return balances
+
+
+async def fetch_balance_matrix(
+    agent_addresses: List[str],
+    token_addresses: List[str],
+    semaphore: asyncio.Semaphore,
+) -> Dict[str, Dict[str, Decimal]]:
+    """
+    Fetch balance_of for every (agent, token) combination using chunked JSON-RPC batch requests.
+    Returns a dense, zero-filled matrix indexed as balances[agent_address][token_address].
+    Calls that fail inside a batch are retried individually.
+    """
+    cells = [(agent_address, token_address) for agent_address in agent_addresses for token_address in token_addresses]
+    results = await batch_call(
+        [(token_address, 'balance_of', [int(agent_address, 16)]) for agent_address, token_address in cells],
+        semaphore,
+    )
+
+    balances = {
+        agent_address: {token_address: Decimal(0) for token_address in token_addresses}
+        for agent_address in agent_addresses
+    }
+    failed_cells = []
+    for (agent_address, token_address), result in zip(cells, results):
+        if not result:
+            failed_cells.append((agent_address, token_address))
+            continue
+        # u256 values are returned as (low, high) felts
+        value = {'low': result[0], 'high': result[1]} if len(result) > 1 else result[0]
+        balances[agent_address][token_address] = handle_u256_value(value)
+
+    fallback_balances = await asyncio.gather(
+        *(
+            limited(semaphore, get_wallet_token_balance(agent_address, token_address))
+            for agent_address, token_address in failed_cells
+        )
+    )
+    for (agent_address, token_address), balance in zip(failed_cells, fallback_balances):
+        balances[agent_address][token_address] = balance
+
+    return balances
+
+
+async def calculate_agent_score(
+    ctx: HookContext,
+    agent: Agent,
+    scoring: SessionScoringContext,
+    balances: Dict[str, Decimal],
+    semaphore: asyncio.Semaphore,
+) -> Optional[Tuple[Decimal, Decimal, Decimal]]:
+    """
+    Calculate the three score components of a single agent.
+    Returns (resource_score, lp_score, farming_score), or None if the agent could not be scored.
+    """
+    try:
+        resource_score = await calculate_resource_balance_score_rpc(ctx, scoring, balances)
+        lp_score = await calculate_lp_balance_score_rpc(ctx, scoring, balances)
+        farming_score = await calculate_pending_rewards_score_rpc(ctx, scoring, agent.address, semaphore)
+        return resource_score, lp_score, farming_score
+    except Exception as e:
+        ctx.logger.error(f"Error calculating score for agent {agent.address}: {e}")
+        return None
+
+
 async def get_wallet_token_balance(agent_address: str, token_address: str) -> Decimal:
     """Get token balance from agent's wallet via RPC call"""
     try:
-        client = FullNodeClient(node_url=RPC_URL)
-        contract = await Contract.from_address(address=token_address, provider=client)
+        contract = await get_contract(token_address)
         
         # Convert agent address string to integer for the contract call
         agent_address_int = int(agent_address, 16)
@@ -265,137 +596,144 @@ async def get_wallet_token_balance(agent_address: str, token_address: str) -> De
         return Decimal(0)
 
 
-async def get_farm_pending_rewards(agent_address: str, farm_address: str) -> Dict[str, Decimal]:
-    """Get pending rewards from a farm contract via RPC call"""
+async def get_farm_pending_rewards(
+    agent_address: str,
+    farm_address: str,
+    semaphore: asyncio.Semaphore,
+) -> Dict[str, Decimal]:
+    """Get pending rewards from a farm contract via RPC calls, one `earned` call per reward token in parallel"""
     try:
-        client = FullNodeClient(node_url=RPC_URL)
-        contract = await Contract.from_address(address=farm_address, provider=client)
+        contract = await limited(semaphore, get_contract(farm_address))
         
         # Get reward tokens
-        reward_tokens_result = await contract.functions['get_reward_tokens'].call()
+        reward_tokens_result = await limited(semaphore, contract.functions['get_reward_tokens'].call())
         reward_tokens = reward_tokens_result[0] if isinstance(reward_tokens_result, (list, tuple)) else reward_tokens_result
         
-        pending_rewards = {}
+        # Convert agent address string to integer for the contract call
+        agent_address_int = int(agent_address, 16)
         
         # Get earned amount for each reward token
-        for token_address in reward_tokens:
-            try:
-                # Convert agent address string to integer for the contract call
-                agent_address_int = int(agent_address, 16)
-                
-                earned_result = await contract.functions['earned'].call(agent_address_int, token_address)
-                earned = earned_result[0] if isinstance(earned_result, (list, tuple)) else earned_result
-                
-                earned_amount = handle_u256_value(earned)
-                
-                if earned_amount > 0:
-                    pending_rewards[str(token_address)] = earned_amount
-            except Exception:
+        earned_results = await asyncio.gather(
+            *(
+                limited(semaphore, contract.functions['earned'].call(agent_address_int, token_address))
+                for token_address in reward_tokens
+            ),
+            return_exceptions=True,
+        )
+        
+        pending_rewards = {}
+        for token_address, earned_result in zip(reward_tokens, earned_results):
+            if isinstance(earned_result, BaseException):
                 continue
+            
+            earned = earned_result[0] if isinstance(earned_result, (list, tuple)) else earned_result
+            earned_amount = handle_u256_value(earned)
+            
+            if earned_amount > 0:
+                pending_rewards[normalize_address(token_address)] = earned_amount
         
         return pending_rewards
     except Exception:
         return {}
 
 
-async def calculate_resource_balance_score_rpc(ctx: HookContext, agent_address: str, session_address: str) -> Decimal:
+async def calculate_resource_balance_score_rpc(
+    ctx: HookContext,
+    scoring: SessionScoringContext,
+    balances: Dict[str, Decimal],
+) -> Decimal:
     """
-    Calculate resource balance score using direct RPC calls for wallet token balances.
+    Calculate resource balance score from the agent's batched wallet token balances.
     Only considers tokens that exist in the current game session.
     """
     total_score = Decimal(0)
     
-    try:
-        # Get session to determine game_session_id
-        session = await GameSession.get(address=session_address)
-        game_session_id = session.game_session_index
-        
-        # Get all unique tokens from pairs in the same game session
-        unique_tokens = set()
-        pairs = await Pair.filter(game_session_id=game_session_id)
-        
-        for pair in pairs:
-            unique_tokens.add(pair.token0_address)
-            unique_tokens.add(pair.token1_address)
-        
-        # Add reward tokens from farms in the same game session
-        farms = await Farm.filter(game_session_id=game_session_id)
-        for farm in farms:
-            if farm.reward_tokens:
-                for token_addr in farm.reward_tokens:
-                    unique_tokens.add(token_addr)
-        
-        # Get wallet balances via RPC calls
-        for token_address in unique_tokens:
-            try:
-                balance = await get_wallet_token_balance(agent_address, token_address)
-                if balance > 0:
-                    # Get token info and normalize
-                    _, symbol, decimals = await get_cached_token_info(token_address)
-                    normalized_balance = normalize_token_amount(balance, decimals)
-                    
-                    # Apply weight
-                    weight = TOKEN_WEIGHTS.get(symbol, 1)
-                    score = normalized_balance * Decimal(str(weight))
-                    total_score += score
-                    
-            except Exception:
-                continue
-        
-    except Exception as e:
-        ctx.logger.error(f"Error calculating resource balance score: {e}")
+    for token_address in scoring.token_addresses:
+        try:
+            balance = balances.get(token_address, Decimal(0))
+            if balance > 0:
+                # Normalize with the session's token info
+                symbol, decimals = await scoring.get_token_info(token_address)
+                normalized_balance = normalize_token_amount(balance, decimals)
+                
+                # Apply weight
+                weight = TOKEN_WEIGHTS.get(symbol, 1)
+                score = normalized_balance * Decimal(str(weight))
+                total_score += score
+                
+        except Exception as e:
+            ctx.logger.error(f"Error scoring balance of token {token_address}: {e}")
+            continue
     
     return total_score
 
 
-async def calculate_lp_balance_score_rpc(ctx: HookContext, agent_address: str, session_address: str) -> Decimal:
+async def calculate_lp_balance_score_rpc(
+    ctx: HookContext,
+    scoring: SessionScoringContext,
+    balances: Dict[str, Decimal],
+) -> Decimal:
     """
-    Calculate LP token balance score using direct RPC calls for LP token balances.
+    Calculate LP token balance score from the agent's batched LP token balances.
     Only considers LP tokens from the current game session.
     """
     total_score = Decimal(0)
     
-    try:
-        # Get session to determine game_session_id
-        session = await GameSession.get(address=session_address)
-        game_session_id = session.game_session_index
-        
-        # Get all pairs from the same game session
-        pairs = await Pair.filter(game_session_id=game_session_id)
-        
-        for pair in pairs:
-            try:
-                # Get LP token balance via RPC
-                lp_balance = await get_wallet_token_balance(agent_address, pair.address)
+    for pair in scoring.pairs:
+        try:
+            lp_balance = balances.get(pair.address, Decimal(0))
+            if lp_balance > 0:
+                # Normalize LP balance (LP tokens typically have 18 decimals)
+                _, lp_decimals = await scoring.get_token_info(pair.address)
+                normalized_balance = normalize_token_amount(lp_balance, lp_decimals)
                 
-                if lp_balance > 0:
-                    # Normalize LP balance (LP tokens typically have 18 decimals)
-                    try:
-                        _, _, lp_decimals = await get_cached_token_info(pair.address)
-                    except Exception:
-                        lp_decimals = 18  # Default for LP tokens
-                    
-                    normalized_balance = normalize_token_amount(lp_balance, lp_decimals)
-                    
-                    # Get pool weight
-                    pool_key = f"{pair.token0_symbol}/{pair.token1_symbol}"
-                    if pool_key not in LP_POOL_WEIGHTS:
-                        pool_key = f"{pair.token1_symbol}/{pair.token0_symbol}"
-                    
-                    weight = LP_POOL_WEIGHTS.get(pool_key, 1)
-                    score = normalized_balance * Decimal(str(weight))
-                    total_score += score
-                    
-            except Exception:
-                continue
-        
-    except Exception as e:
-        ctx.logger.error(f"Error calculating LP balance score: {e}")
+                # Get pool weight
+                weight = get_pool_weight(pair)
+                score = normalized_balance * Decimal(str(weight))
+                total_score += score
+                
+        except Exception as e:
+            ctx.logger.error(f"Error scoring LP balance of pair {pair.address}: {e}")
+            continue
     
     return total_score
 
 
-async def calculate_pending_rewards_score_rpc(ctx: HookContext, agent_address: str, session_address: str) -> Decimal:
+async def calculate_farm_score_rpc(
+    scoring: SessionScoringContext,
+    agent_address: str,
+    farm_address: str,
+    semaphore: asyncio.Semaphore,
+) -> Decimal:
+    """Calculate the multiplied pending rewards score of an agent in a single farm"""
+    # Get pending rewards via RPC
+    pending_rewards = await get_farm_pending_rewards(agent_address, farm_address, semaphore)
+    
+    farm_pending_score = Decimal(0)
+    for token_address, reward_amount in pending_rewards.items():
+        try:
+            # Get token info and normalize
+            symbol, decimals = await scoring.get_token_info(token_address)
+            normalized_reward = normalize_token_amount(reward_amount, decimals)
+            
+            # Apply token weight
+            weight = TOKEN_WEIGHTS.get(symbol, 1)
+            reward_score = normalized_reward * Decimal(str(weight))
+            farm_pending_score += reward_score
+            
+        except Exception:
+            continue
+    
+    # Apply farm multiplier to the pending rewards score
+    return farm_pending_score * scoring.farm_multipliers[farm_address]
+
+
+async def calculate_pending_rewards_score_rpc(
+    ctx: HookContext,
+    scoring: SessionScoringContext,
+    agent_address: str,
+    semaphore: asyncio.Semaphore,
+) -> Decimal:
     """
     Calculate farming score using direct RPC calls to farm contracts.
     Only considers farms from the current game session.
@@ -406,64 +744,152 @@ async def calculate_pending_rewards_score_rpc(ctx: HookContext, agent_address: s
     """
     total_score = Decimal(0)
     
+    # The session context only holds stakes in farms of this game session
+    stakes = scoring.stakes_by_agent.get(agent_address, [])
+    
+    # Score all farms of the agent in parallel
+    farm_scores = await asyncio.gather(
+        *(calculate_farm_score_rpc(scoring, agent_address, stake.farm_address, semaphore) for stake in stakes),
+        return_exceptions=True,
+    )
+    for stake, farm_score in zip(stakes, farm_scores):
+        if isinstance(farm_score, BaseException):
+            ctx.logger.error(f"Error calculating farming score in farm {stake.farm_address}: {farm_score}")
+            continue
+        total_score += farm_score
+    
+    return total_score
+
+
+async def calculate_indexed_session_scores(
+    ctx: HookContext,
+    scoring: SessionScoringContext,
+    agents: List[Agent],
+    balances: Dict[str, Dict[str, Decimal]],
+    timestamp: int,
+) -> Dict[Tuple[str, str], Tuple[Decimal, Decimal, Decimal]]:
+    """
+    Calculate the score components of every agent of a session from indexed state.
+    The resource component still uses the batched RPC wallet balances; LP and farming
+    components are computed from a handful of bulk queries, without any RPC call.
+    Pending rewards are accrued up to `timestamp`, like the farm's view functions would.
+    Returns {(agent_address, session_address): (resource_score, lp_score, farming_score)}.
+    """
+    agent_addresses = [agent.address for agent in agents]
     try:
-        # Get session to determine game_session_id
-        session = await GameSession.get(address=session_address)
-        game_session_id = session.game_session_index
-        
-        # Get agent's stakes in farms from the same game session
-        stakes = await AgentStake.filter(agent_address=agent_address)
-        
-        session_farm_addresses = []
-        for stake in stakes:
-            farm = await Farm.get(address=stake.farm_address)
-            if farm.game_session_id == game_session_id:
-                session_farm_addresses.append(stake.farm_address)
-        
-        for farm_address in session_farm_addresses:
-            try:
-                # Get the farm to access reward token information
-                farm = await Farm.get(address=farm_address)
-                
-                # Calculate farm reward token multiplier using existing Reward models
-                farm_multiplier = Decimal(1)  # Base multiplier
-                
-                # Get reward models for this farm to access cached token symbols
-                rewards = await Reward.filter(farm_address=farm_address)
-                for reward in rewards:
-                    try:
-                        token_weight = TOKEN_WEIGHTS.get(reward.reward_token_symbol, 1)
-                        # Add token weight to multiplier (higher value tokens increase farm value)
-                        farm_multiplier += Decimal(str(token_weight)) / Decimal(10)  # Scale down to keep multiplier reasonable
-                    except Exception:
-                        continue
-                
-                # Get pending rewards via RPC
-                pending_rewards = await get_farm_pending_rewards(agent_address, farm_address)
-                
-                farm_pending_score = Decimal(0)
-                for token_address, reward_amount in pending_rewards.items():
-                    try:
-                        # Get token info and normalize
-                        _, symbol, decimals = await get_cached_token_info(token_address)
-                        normalized_reward = normalize_token_amount(reward_amount, decimals)
-                        
-                        # Apply token weight
-                        weight = TOKEN_WEIGHTS.get(symbol, 1)
-                        reward_score = normalized_reward * Decimal(str(weight))
-                        farm_pending_score += reward_score
-                        
-                    except Exception:
-                        continue
-                
-                # Apply farm multiplier to the pending rewards score
-                farm_total_score = farm_pending_score * farm_multiplier
-                total_score += farm_total_score
-                
-            except Exception:
-                continue
-        
+        lp_scores = await calculate_indexed_lp_scores(scoring, agent_addresses)
+        farming_scores = await calculate_indexed_farming_scores(scoring, agent_addresses, timestamp)
     except Exception as e:
-        ctx.logger.error(f"Error calculating farming score: {e}")
-    
-    return total_score 
\ No newline at end of file
+        ctx.logger.error(f"Error calculating indexed scores for session {scoring.session.address}: {e}")
+        return {}
+
+    scores = {}
+    for agent in agents:
+        resource_score = await calculate_resource_balance_score_rpc(ctx, scoring, balances[agent.address])
+        scores[(agent.address, agent.session_address)] = (
+            resource_score,
+            lp_scores[agent.address],
+            farming_scores[agent.address],
+        )
+    return scores
+
+
+async def calculate_indexed_lp_scores(
+    scoring: SessionScoringContext,
+    agent_addresses: List[str],
+) -> Dict[str, Decimal]:
+    """
+    Calculate LP scores of a session's agents from indexed LiquidityPosition rows.
+    Formula: Σ(normalized liquidity × pool weight), like the RPC mode.
+    """
+    scores = {agent_address: Decimal(0) for agent_address in agent_addresses}
+
+    pairs = {pair.address: pair for pair in scoring.pairs}
+    if not pairs or not agent_addresses:
+        return scores
+
+    # Only the columns of idx_liquidity_position_pair_agent, so the lookup can be an index-only scan
+    positions = await LiquidityPosition.filter(
+        pair_address__in=list(pairs),
+        agent_address__in=agent_addresses,
+        liquidity__gt=0,
+    ).values_list('pair_address', 'agent_address', 'liquidity')
+    for pair_address, agent_address, liquidity in positions:
+        pair = pairs[pair_address]
+        _, lp_decimals = await scoring.get_token_info(pair.address)
+        normalized_liquidity = normalize_token_amount(Decimal(liquidity), lp_decimals)
+        scores[agent_address] += normalized_liquidity * Decimal(str(get_pool_weight(pair)))
+
+    return scores
+
+
+def calculate_indexed_reward_per_token(reward: Reward, farm: Farm, timestamp: int) -> int:
+    """
+    Calculate a reward token's current reward per token, mirroring the farm's `rewardPerToken`
+    (and the reward_per_agent_pending view):
+    reward_per_token_stored
+    + (min(timestamp, period_finish) - last_update_time) × reward_rate × 10^decimals / total_staked
+    """
+    reward_per_token = int(reward.reward_per_token_stored)
+    total_staked = int(farm.total_staked)
+    last_time_applicable = min(timestamp, int(reward.period_finish))
+    if total_staked > 0 and last_time_applicable > reward.last_update_time:
+        elapsed = last_time_applicable - reward.last_update_time
+        reward_per_token += elapsed * int(reward.reward_rate) * 10**reward.decimals // total_staked
+    return reward_per_token
+
+
+def calculate_indexed_pending_rewards(
+    stake: AgentStake,
+    reward: Reward,
+    reward_state: Optional[RewardPerAgent],
+    reward_per_token: int,
+) -> int:
+    """
+    Calculate an agent's pending rewards for one reward token, mirroring the farm's `earned`:
+    rewards + staked × (reward_per_token - reward_per_token_paid) / 10^decimals
+    """
+    if reward_state is None:
+        # No checkpoint yet: the agent has not accrued anything for this token
+        return 0
+
+    accumulated = int(reward_state.rewards)
+    reward_per_token_paid = int(reward_state.reward_per_token_paid)
+    staked = int(stake.staked_amount)
+    if staked and reward_per_token > reward_per_token_paid:
+        accumulated += staked * (reward_per_token - reward_per_token_paid) // 10**reward.decimals
+    return accumulated
+
+
+async def calculate_indexed_farming_scores(
+    scoring: SessionScoringContext,
+    agent_addresses: List[str],
+    timestamp: int,
+) -> Dict[str, Decimal]:
+    """
+    Calculate farming scores of a session's agents from indexed AgentStake and Reward rows.
+    Formula: Σ((pending_rewards × token_weight) × farm_multiplier), like the RPC mode.
+    Rewards accrue up to `timestamp`, so agents keep earning between farm events.
+    """
+    scores = {agent_address: Decimal(0) for agent_address in agent_addresses}
+
+    # Reward per token of every reward of the session's farms, shared by all stakers
+    reward_per_token = {
+        reward.id: calculate_indexed_reward_per_token(reward, scoring.farms[farm_address], timestamp)
+        for farm_address, rewards in scoring.rewards_by_farm.items()
+        for reward in rewards
+    }
+
+    for agent_address in agent_addresses:
+        for stake in scoring.stakes_by_agent.get(agent_address, []):
+            farm_pending_score = Decimal(0)
+            for reward in scoring.rewards_by_farm.get(stake.farm_address, []):
+                reward_state = scoring.reward_states.get((stake.id, reward.address))
+                pending = calculate_indexed_pending_rewards(stake, reward, reward_state, reward_per_token[reward.id])
+                if pending > 0:
+                    normalized_reward = normalize_token_amount(Decimal(pending), reward.decimals)
+                    farm_pending_score += normalized_reward * Decimal(str(TOKEN_WEIGHTS.get(reward.reward_token_symbol, 1)))
+
+            scores[agent_address] += farm_pending_score * scoring.farm_multipliers[stake.farm_address]
+
+    return scores
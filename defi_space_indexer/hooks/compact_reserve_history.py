@@ -0,0 +1,41 @@
+import os
+
+from dipdup.context import HookContext
+
+from defi_space_indexer import models as models
+from defi_space_indexer.reserve_history import RESOLUTION_BLOCK
+from defi_space_indexer.reserve_history import RESOLUTION_HOUR
+from defi_space_indexer.reserve_history import RESOLUTION_MINUTE
+from defi_space_indexer.reserve_history import downsample_reserve_history
+
+# Age in seconds after which per-block snapshots are merged per minute, and per-minute ones per hour
+RESERVE_HISTORY_BLOCK_RETENTION = int(os.environ.get('RESERVE_HISTORY_BLOCK_RETENTION', '86400'))
+RESERVE_HISTORY_MINUTE_RETENTION = int(os.environ.get('RESERVE_HISTORY_MINUTE_RETENTION', '604800'))
+# Snapshots read per compaction pass
+RESERVE_HISTORY_COMPACTION_BATCH_SIZE = int(os.environ.get('RESERVE_HISTORY_COMPACTION_BATCH_SIZE', '10000'))
+
+
+async def compact_reserve_history(
+    ctx: HookContext,
+) -> None:
+    """Downsample old reserve history: per block, then per minute, then per hour."""
+    # Ages are measured against the latest indexed block, not the wall clock, so a syncing indexer keeps full detail
+    latest = await models.ReserveSnapshot.all().order_by('-block_timestamp').first()
+    if latest is None:
+        return
+    now = latest.block_timestamp
+
+    deleted = await downsample_reserve_history(
+        RESOLUTION_BLOCK,
+        RESOLUTION_MINUTE,
+        now - RESERVE_HISTORY_BLOCK_RETENTION,
+        RESERVE_HISTORY_COMPACTION_BATCH_SIZE,
+    )
+    deleted += await downsample_reserve_history(
+        RESOLUTION_MINUTE,
+        RESOLUTION_HOUR,
+        now - RESERVE_HISTORY_MINUTE_RETENTION,
+        RESERVE_HISTORY_COMPACTION_BATCH_SIZE,
+    )
+    if deleted:
+        ctx.logger.info(f'Compacted reserve history: {deleted} snapshots merged')
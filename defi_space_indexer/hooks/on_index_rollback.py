@@ -1,6 +1,13 @@
 from dipdup.context import HookContext
 from dipdup.index import Index
 
+from defi_space_indexer.candles import clear_candle_cache
+from defi_space_indexer.entity_cache import clear_entity_cache
+from defi_space_indexer.pair_stats import clear_pair_stats_cache
+from defi_space_indexer.reserve_history import clear_reserve_history_cache
+from defi_space_indexer.scoring import request_full_sweep
+from defi_space_indexer.utils import clear_token_metadata_cache
+
 
 async def on_index_rollback(
     ctx: HookContext,
@@ -14,3 +21,11 @@ async def on_index_rollback(
         from_level=from_level,
         to_level=to_level,
     )
+    # Rolled back levels may have removed or reverted rows still held in memory
+    clear_token_metadata_cache()
+    clear_entity_cache()
+    clear_candle_cache()
+    clear_pair_stats_cache()
+    clear_reserve_history_cache()
+    # Scores may reflect reverted state of agents no longer marked dirty
+    request_full_sweep()
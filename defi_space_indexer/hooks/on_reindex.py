@@ -5,3 +5,4 @@ async def on_reindex(
     ctx: HookContext,
 ) -> None:
     await ctx.execute_sql_script('on_reindex')
+    await ctx.execute_sql_script('schema_indexes')
@@ -1,9 +1,22 @@
 from dipdup.context import HookContext
 
+from defi_space_indexer.rpc import close as close_rpc
+
 
 async def on_restart(
     ctx: HookContext,
 ) -> None:
     """Run on restart."""
+    # Drop the shared RPC session left over from a previous run; the next call opens a fresh one
+    await close_rpc()
+
     # Update SQL script if needed
     await ctx.execute_sql_script('on_restart')
+
+    # Indexes for handler lookups and Hasura queries; idempotent, so existing databases pick up new ones
+    await ctx.execute_sql_script('schema_indexes')
+
+    # On-read pending rewards view and TWAP function; rely on PostgreSQL numeric and SQL functions
+    if ctx.config.database.kind == 'postgres':
+        await ctx.execute_sql_script('pending_rewards')
+        await ctx.execute_sql_script('twap')
@@ -0,0 +1,17 @@
+import os
+
+from dipdup.context import HookContext
+
+from defi_space_indexer.pair_stats import refresh_stale_pair_stats
+
+# Rows per UPDATE statement when writing refreshed stats
+PAIR_STATS_WRITE_BATCH_SIZE = int(os.environ.get('PAIR_STATS_WRITE_BATCH_SIZE', '500'))
+
+
+async def refresh_pair_stats(
+    ctx: HookContext,
+) -> None:
+    """Expire old activity from the rolling windows of pairs that stopped trading."""
+    refreshed = await refresh_stale_pair_stats(PAIR_STATS_WRITE_BATCH_SIZE)
+    if refreshed:
+        ctx.logger.info(f'Refreshed rolling stats of {refreshed} pairs')
@@ -0,0 +1,14 @@
+from dipdup.context import HookContext
+
+from defi_space_indexer.hooks.calculate_agent_progression_scores import SCORING_MODE
+from defi_space_indexer.hooks.calculate_agent_progression_scores import calculate_agent_progression_scores
+
+
+async def refresh_progression_scores(
+    ctx: HookContext,
+) -> None:
+    """Refresh progression scores from indexed state; a no-op unless SCORING_MODE=indexed."""
+    if SCORING_MODE != 'indexed':
+        return
+
+    await calculate_agent_progression_scores(ctx)
@@ -6,7 +6,13 @@ from defi_space_indexer.models.amm_models import LiquidityEvent  # Event Models
 from defi_space_indexer.models.amm_models import LiquidityEventType
 from defi_space_indexer.models.amm_models import LiquidityPosition
 from defi_space_indexer.models.amm_models import Pair
+from defi_space_indexer.models.amm_models import PairCandle  # Analytics Models
+from defi_space_indexer.models.amm_models import PairStats
+from defi_space_indexer.models.amm_models import PriceAccumulatorSnapshot
+from defi_space_indexer.models.amm_models import ReserveSnapshot
 from defi_space_indexer.models.amm_models import SwapEvent
+from defi_space_indexer.models.config_models import ConfigChange  # Config History Models
+from defi_space_indexer.models.config_models import ConfigEntityType
 from defi_space_indexer.models.farms_models import AgentStake
 from defi_space_indexer.models.farms_models import AgentStakeEvent  # Event Models
 from defi_space_indexer.models.farms_models import Farm
@@ -30,6 +36,7 @@ from defi_space_indexer.models.game_models import GameEventType
 from defi_space_indexer.models.game_models import GameFactory  # Core Models
 from defi_space_indexer.models.game_models import GameSession
 from defi_space_indexer.models.game_models import UserDeposit
+from defi_space_indexer.models.token_models import TokenMetadata
 
 __all__ = [
     'Agent',
@@ -42,6 +49,9 @@ __all__ = [
     # Faucet Event Models
     'ClaimEvent',
     'ClaimEventType',
+    # Config History Models
+    'ConfigChange',
+    'ConfigEntityType',
     'Farm',
     # Farming Core Models
     'FarmFactory',
@@ -60,6 +70,11 @@ __all__ = [
     'LiquidityEventType',
     'LiquidityPosition',
     'Pair',
+    # AMM Analytics Models
+    'PairCandle',
+    'PairStats',
+    'PriceAccumulatorSnapshot',
+    'ReserveSnapshot',
     'Reward',
     'RewardEvent',
     'RewardEventType',
@@ -67,6 +82,8 @@ __all__ = [
     'Rewarder',
     'StakeEventType',
     'SwapEvent',
+    # Token Models
+    'TokenMetadata',
     'UserDeposit',
     'WhitelistedUser',
 ]
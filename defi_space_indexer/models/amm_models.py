@@ -16,7 +16,7 @@ class AmmFactory(Model):
     - Maintains ownership and administrative settings
 
     Historical tracking:
-    - Stores configuration changes in config_history
+    - Records configuration changes as ConfigChange rows
     - Tracks ownership transfers
     - Records fee receiver updates
     """
@@ -28,7 +28,6 @@ class AmmFactory(Model):
     owner = fields.TextField()  # Current owner
     fee_to = fields.TextField()  # Current fee receiver
     pair_contract_class_hash = fields.TextField()  # Current implementation
-    config_history = fields.JSONField()  # List of {field, old_value, new_value, timestamp}
 
     created_at = fields.BigIntField()
     updated_at = fields.BigIntField()
@@ -77,10 +76,12 @@ class Pair(Model):
     reserve1 = fields.DecimalField(max_digits=100, decimal_places=0)
     total_supply = fields.DecimalField(max_digits=100, decimal_places=0)
     klast = fields.DecimalField(max_digits=100, decimal_places=0)
+    # Swap fee on input amounts, in basis points. Always DEFAULT_FEE_BPS (30): pairs emit no fee rate
+    fee_bps = fields.IntField(default=30)
 
-    # TWAP data
-    price_0_cumulative_last = fields.BigIntField()
-    price_1_cumulative_last = fields.BigIntField()
+    # TWAP data; history is kept in PriceAccumulatorSnapshot
+    price_0_cumulative_last = fields.DecimalField(max_digits=78, decimal_places=0)
+    price_1_cumulative_last = fields.DecimalField(max_digits=78, decimal_places=0)
     block_timestamp_last = fields.BigIntField()
 
     # Game integration
@@ -222,3 +223,154 @@ class SwapEvent(Model):
 
     # Relationships
     pair: fields.ForeignKeyField[Pair] = fields.ForeignKeyField('models.Pair', related_name='swaps')
+
+
+class PriceAccumulatorSnapshot(Model):
+    """
+    Records the price accumulators of a pair each time they change.
+    Append-only history behind time-weighted average prices.
+
+    Key responsibilities:
+    - Stores cumulative prices with their block and timestamp
+    - Serves TWAP(pair, t0, t1) with two indexed point lookups (see `pair_twap` in sql/twap)
+
+    Differs from Pair model:
+    - Keeps every accumulator checkpoint vs only the latest one
+
+    Used for:
+    - TWAP oracles
+    - Manipulation-resistant pricing
+    """
+
+    id = fields.IntField(primary_key=True)
+    transaction_hash = fields.TextField()
+    block_number = fields.BigIntField()
+    block_timestamp = fields.BigIntField()
+
+    pair_address = fields.TextField()  # ContractAddress
+    price_0_cumulative = fields.DecimalField(max_digits=78, decimal_places=0)
+    price_1_cumulative = fields.DecimalField(max_digits=78, decimal_places=0)
+
+    # Relationships
+    pair: fields.ForeignKeyField[Pair] = fields.ForeignKeyField('models.Pair', related_name='price_snapshots')
+
+    class Meta:
+        indexes = [('pair_address', 'block_timestamp')]
+
+
+class ReserveSnapshot(Model):
+    """
+    Records the reserves of a pair at the end of a block.
+    Compacted over time: per block for recent history, then per minute, then per hour.
+
+    Key responsibilities:
+    - Stores at most one row per pair per block
+    - Answers reserves, price and TVL of a pair at a past time
+
+    Differs from Pair model:
+    - Keeps historical reserves vs only the current ones
+
+    Maintained by:
+    - Swap, sync, mint, burn, skim and reserve update events
+    - The compact_reserve_history job, which downsamples old rows
+    """
+
+    id = fields.IntField(primary_key=True)
+    block_number = fields.BigIntField()  # Last block of the row's period
+    block_timestamp = fields.BigIntField()
+
+    pair_address = fields.TextField()  # ContractAddress
+    reserve0 = fields.DecimalField(max_digits=78, decimal_places=0)
+    reserve1 = fields.DecimalField(max_digits=78, decimal_places=0)
+    resolution = fields.IntField(default=0)  # Seconds covered by the row; 0 for a single block
+
+    # Relationships
+    pair: fields.ForeignKeyField[Pair] = fields.ForeignKeyField('models.Pair', related_name='reserve_snapshots')
+
+    class Meta:
+        indexes = [('pair_address', 'block_timestamp'), ('resolution', 'block_timestamp')]
+
+
+class PairCandle(Model):
+    """
+    OHLCV candle of a pair for one time bucket at one resolution.
+    Maintained incrementally from swap and sync events, so charts read pre-aggregated rows.
+
+    Key responsibilities:
+    - Tracks open, high, low and close price of token0 in token1 (raw reserve ratio)
+    - Accumulates traded volume of both tokens
+    - Counts swaps in the bucket
+
+    Differs from SwapEvent:
+    - Aggregates trades per bucket vs individual trades
+    - Also follows reserve-only price moves (mints, burns, syncs)
+
+    Used for:
+    - Price charts at 1m, 5m, 1h and 1d resolutions
+    """
+
+    id = fields.IntField(primary_key=True)
+    pair_address = fields.TextField()  # ContractAddress
+    interval = fields.IntField()  # Bucket length in seconds
+    bucket_start = fields.BigIntField()  # Timestamp of the start of the bucket
+
+    open = fields.DecimalField(max_digits=100, decimal_places=36)
+    high = fields.DecimalField(max_digits=100, decimal_places=36)
+    low = fields.DecimalField(max_digits=100, decimal_places=36)
+    close = fields.DecimalField(max_digits=100, decimal_places=36)
+
+    volume0 = fields.DecimalField(max_digits=78, decimal_places=0, default=0)  # token0 in + out
+    volume1 = fields.DecimalField(max_digits=78, decimal_places=0, default=0)  # token1 in + out
+    trade_count = fields.IntField(default=0)
+
+    updated_at = fields.BigIntField()
+
+    # Relationships
+    pair: fields.ForeignKeyField[Pair] = fields.ForeignKeyField('models.Pair', related_name='candles')
+
+    class Meta:
+        unique_together = [('pair_address', 'interval', 'bucket_start')]
+
+
+class PairStats(Model):
+    """
+    Rolling 24h and 7d trading counters of a pair.
+    Maintained incrementally from swap events over hourly buckets, so rankings are plain indexed sorts.
+
+    Key responsibilities:
+    - Tracks rolling volume, fees and trade count per token
+    - Keeps the hourly buckets of the last 7 days to expire old activity
+
+    Differs from PairCandle:
+    - Rolling windows vs fixed buckets
+    - One row per pair vs one row per bucket
+
+    Updated by:
+    - Swap events
+    - The refresh_pair_stats job, for pairs without recent swaps
+    """
+
+    pair_address = fields.TextField(primary_key=True)  # ContractAddress
+
+    volume0_24h = fields.DecimalField(max_digits=78, decimal_places=0, default=0)
+    volume1_24h = fields.DecimalField(max_digits=78, decimal_places=0, default=0)
+    fees0_24h = fields.DecimalField(max_digits=78, decimal_places=0, default=0)
+    fees1_24h = fields.DecimalField(max_digits=78, decimal_places=0, default=0)
+    trade_count_24h = fields.IntField(default=0)
+
+    volume0_7d = fields.DecimalField(max_digits=78, decimal_places=0, default=0)
+    volume1_7d = fields.DecimalField(max_digits=78, decimal_places=0, default=0)
+    fees0_7d = fields.DecimalField(max_digits=78, decimal_places=0, default=0)
+    fees1_7d = fields.DecimalField(max_digits=78, decimal_places=0, default=0)
+    trade_count_7d = fields.IntField(default=0)
+
+    # Hourly ring buffer: [[hour_start, volume0, volume1, fees0, fees1, trades], ...], amounts as strings
+    buckets = fields.JSONField(default=list)
+
+    updated_at = fields.BigIntField()  # Block timestamp the windows end at
+
+    # Relationships
+    pair: fields.OneToOneRelation[Pair] = fields.OneToOneField('models.Pair', related_name='stats')
+
+    class Meta:
+        indexes = [('volume0_24h',), ('volume1_24h',), ('trade_count_24h',)]
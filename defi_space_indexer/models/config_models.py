@@ -0,0 +1,43 @@
+from enum import Enum
+
+from dipdup import fields
+from dipdup.models import Model
+
+
+class ConfigEntityType(Enum):
+    AMM_FACTORY = 'AMM_FACTORY'
+    FARM_FACTORY = 'FARM_FACTORY'
+    FARM = 'FARM'
+    GAME_FACTORY = 'GAME_FACTORY'
+    GAME_SESSION = 'GAME_SESSION'
+    FAUCET_FACTORY = 'FAUCET_FACTORY'
+    FAUCET = 'FAUCET'
+
+
+class ConfigChange(Model):
+    """
+    Records a single configuration change of a factory, farm, game session or faucet.
+    Append-only history shared by every config, owner and ownership-transfer handler.
+
+    Key responsibilities:
+    - Records field updates with their old and new values
+    - Tracks ownership transfers and implementation upgrades
+
+    Used for:
+    - Configuration audits
+    - Paginated history queries per entity
+    """
+
+    id = fields.IntField(primary_key=True)
+    transaction_hash = fields.TextField()
+    created_at = fields.BigIntField()
+
+    entity_type = fields.EnumField(ConfigEntityType)
+    entity_address = fields.TextField()  # ContractAddress of the changed entity
+
+    field = fields.TextField()
+    old_value = fields.TextField(null=True)
+    new_value = fields.TextField(null=True)
+
+    class Meta:
+        indexes = [('entity_address', 'created_at')]
@@ -16,7 +16,7 @@ class FarmFactory(Model):
     - Manages ownership and permissions
 
     Historical tracking:
-    - Stores configuration changes in config_history
+    - Records configuration changes as ConfigChange rows
     - Tracks ownership transfers
     - Records farm implementations
 
@@ -33,7 +33,6 @@ class FarmFactory(Model):
     # Config with history
     owner = fields.TextField()
     farm_class_hash = fields.TextField()
-    config_history = fields.JSONField()  # List of {field, old_value, new_value, timestamp}
 
     created_at = fields.BigIntField()
     updated_at = fields.BigIntField()
@@ -70,8 +69,8 @@ class Farm(Model):
 
     # Current state
     owner = fields.TextField()
-    total_staked = fields.TextField()  # Changed from DecimalField to TextField
-    multiplier = fields.TextField()
+    total_staked = fields.DecimalField(max_digits=78, decimal_places=0)
+    multiplier = fields.DecimalField(max_digits=78, decimal_places=0)
 
     lp_token_name = fields.TextField()
     lp_token_symbol = fields.TextField()
@@ -80,11 +79,10 @@ class Farm(Model):
     updated_at = fields.BigIntField()
 
     # Config with history
-    penalty_duration = fields.TextField()
-    withdraw_penalty = fields.TextField()
+    penalty_duration = fields.DecimalField(max_digits=78, decimal_places=0)
+    withdraw_penalty = fields.DecimalField(max_digits=78, decimal_places=0)
     penalty_receiver = fields.TextField()
     authorized_rewarders = fields.JSONField()
-    config_history = fields.JSONField()  # List of {field, old_value, new_value, timestamp}
 
     # Game integration
     game_session_id = fields.IntField()
@@ -105,8 +103,7 @@ class AgentStake(Model):
     Key responsibilities:
     - Tracks staked LP token amount
     - Manages penalty timeframes
-    - Records earned rewards
-    - Calculates claimable rewards
+    - Links to per-token reward state (RewardPerAgent)
 
     Differs from LiquidityPosition:
     - Handles staking vs liquidity
@@ -124,12 +121,10 @@ class AgentStake(Model):
     agent_address = fields.TextField()  # ContractAddress
 
     # Current Position State
-    staked_amount = fields.TextField()  # Changed from DecimalField to TextField
+    staked_amount = fields.DecimalField(max_digits=78, decimal_places=0)
     penalty_end_time = fields.BigIntField()
 
-    # Reward State
-    reward_per_token_paid = fields.JSONField()  # Map<ContractAddress, u256>
-    rewards = fields.JSONField()  # Map<ContractAddress, u256>
+    # Per-token reward state lives in RewardPerAgent (related_name='reward_states')
 
     # Timestamps
     created_at = fields.BigIntField()  # First stake timestamp
@@ -164,14 +159,14 @@ class Reward(Model):
     game_session_id = fields.IntField()
 
     # Reward configuration
-    initial_amount = fields.TextField()  # Initial deposited reward amount
-    unallocated_rewards = fields.TextField()
-    remaining_amount = fields.TextField()  # initial_amount - unallocated_rewards - harvested rewards
-    rewards_duration = fields.TextField()
-    period_finish = fields.TextField()
-    reward_rate = fields.TextField()
+    initial_amount = fields.DecimalField(max_digits=78, decimal_places=0)  # Initial deposited reward amount
+    unallocated_rewards = fields.DecimalField(max_digits=78, decimal_places=0)
+    remaining_amount = fields.DecimalField(max_digits=78, decimal_places=0)  # initial_amount - unallocated_rewards - harvested rewards
+    rewards_duration = fields.DecimalField(max_digits=78, decimal_places=0)
+    period_finish = fields.DecimalField(max_digits=78, decimal_places=0)
+    reward_rate = fields.DecimalField(max_digits=78, decimal_places=0)
     last_update_time = fields.BigIntField()
-    reward_per_token_stored = fields.TextField()
+    reward_per_token_stored = fields.DecimalField(max_digits=78, decimal_places=0)
     decimals = fields.IntField()
 
     created_at = fields.BigIntField()
@@ -185,10 +180,12 @@ class RewardPerAgent(Model):
     """
     Tracks the rewards due to a specific agent for a specific token.
     Links agents, farms, and reward tokens together with current reward state.
+    Source of truth for the per-(stake, token) reward checkpoints of the farm contract.
 
     Key responsibilities:
     - Tracks pending rewards by token and agent
     - Manages reward debt (reward_per_token_paid)
+    - Keeps the checkpoint values from which pending rewards can be computed on read
     - Enables efficient reward claiming
     """
 
@@ -198,8 +195,9 @@ class RewardPerAgent(Model):
     farm_address = fields.TextField()  # Farm address
 
     # Reward state
-    last_pending_rewards = fields.TextField()  # Changed from DecimalField to TextField
-    reward_per_token_paid = fields.TextField()  # Changed from DecimalField to TextField
+    last_pending_rewards = fields.DecimalField(max_digits=78, decimal_places=0)
+    reward_per_token_paid = fields.DecimalField(max_digits=78, decimal_places=0)
+    rewards = fields.DecimalField(max_digits=78, decimal_places=0, default=0)  # Rewards accrued at the last checkpoint
 
     created_at = fields.BigIntField()
     updated_at = fields.BigIntField()
@@ -212,6 +210,8 @@ class RewardPerAgent(Model):
 
     class Meta:
         unique_together = [('agent_address', 'reward_token_address', 'farm_address')]
+        # Cross-staker scans of one reward token (RewardPerTokenUpdated)
+        indexes = [('farm_address', 'reward_token_address')]
 
 
 class Rewarder(Model):
@@ -269,8 +269,8 @@ class AgentStakeEvent(Model):
 
     event_type = fields.EnumField(StakeEventType)
     agent_address = fields.TextField()
-    staked_amount = fields.TextField()  # Changed from DecimalField to TextField
-    penalty_amount = fields.TextField(null=True)  # Changed from DecimalField to TextField
+    staked_amount = fields.DecimalField(max_digits=78, decimal_places=0)
+    penalty_amount = fields.DecimalField(max_digits=78, decimal_places=0, null=True)
 
     # Relationships
     farm: fields.ForeignKeyField[Farm] = fields.ForeignKeyField('models.Farm', related_name='stake_events')
@@ -311,12 +311,12 @@ class RewardEvent(Model):
     event_type = fields.EnumField(RewardEventType)
     agent_address = fields.TextField(null=True)  # For harvests
     reward_token = fields.TextField()
-    reward_amount = fields.TextField()  # Changed from DecimalField to TextField
+    reward_amount = fields.DecimalField(max_digits=78, decimal_places=0)
 
     # Additional fields for REWARD_ADDED
-    reward_rate = fields.TextField(null=True)  # Changed from DecimalField to TextField
-    reward_duration = fields.TextField(null=True)  # Changed from BigIntField to TextField
-    period_finish = fields.TextField(null=True)  # Changed from BigIntField to TextField
+    reward_rate = fields.DecimalField(max_digits=78, decimal_places=0, null=True)
+    reward_duration = fields.DecimalField(max_digits=78, decimal_places=0, null=True)
+    period_finish = fields.DecimalField(max_digits=78, decimal_places=0, null=True)
 
     # Relationships
     farm: fields.ForeignKeyField[Farm] = fields.ForeignKeyField('models.Farm', related_name='reward_events')
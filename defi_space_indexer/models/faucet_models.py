@@ -16,7 +16,7 @@ class FaucetFactory(Model):
     - Maintains ownership and administrative settings
 
     Historical tracking:
-    - Stores configuration changes in config_history
+    - Records configuration changes as ConfigChange rows
     - Tracks ownership transfers
     - Records faucet implementations
 
@@ -34,7 +34,6 @@ class FaucetFactory(Model):
     # Config with history
     owner = fields.TextField()  # Current owner
     faucet_class_hash = fields.TextField()  # Current implementation
-    config_history = fields.JSONField(default=list)  # List of {field, old_value, new_value, timestamp}
 
     created_at = fields.BigIntField()
     updated_at = fields.BigIntField()
@@ -73,9 +72,6 @@ class Faucet(Model):
     # Lists
     tokens_list = fields.JSONField(default=list)  # Array of token addresses
 
-    # Config with history
-    config_history = fields.JSONField(default=list)  # List of {field, old_value, new_value, timestamp}
-
     created_at = fields.BigIntField()
     updated_at = fields.BigIntField()
 
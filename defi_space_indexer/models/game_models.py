@@ -16,7 +16,7 @@ class GameFactory(Model):
     - Maintains ownership and administrative settings
 
     Historical tracking:
-    - Stores configuration changes in config_history
+    - Records configuration changes as ConfigChange rows
     - Tracks ownership transfers
     - Records game session implementations
     """
@@ -24,13 +24,7 @@ class GameFactory(Model):
     address = fields.TextField(primary_key=True)  # ContractAddress
     owner = fields.TextField()  # Current owner
     game_session_class_hash = fields.TextField()  # Current implementation
-    game_session_count = fields.IntField()  # Number of game sessions
-
-    # Config with history
-    config_history = fields.JSONField()  # List of {field, old_value, new_value, timestamp}
-
-    # Lists
-    game_sessions_list = fields.JSONField(default=list)  # Array of game session addresses
+    game_session_count = fields.IntField()  # Number of game sessions, listed through the `sessions` relation
 
     created_at = fields.BigIntField()
     updated_at = fields.BigIntField()
@@ -92,20 +86,19 @@ class GameSession(Model):
     total_rewards = fields.DecimalField(max_digits=100, decimal_places=0, default=0)
 
     game_session_index = fields.IntField()
-    # Lists
-    agents_list = fields.JSONField(default=list)  # Array of agent addresses
+    agent_count = fields.IntField(default=0)  # Number of agents, listed through the `agents` relation
 
     # Timestamps
     created_at = fields.BigIntField()
     updated_at = fields.BigIntField()
     ended_at = fields.BigIntField(null=True)
 
-    # Config with history
-    config_history = fields.JSONField()  # List of {field, old_value, new_value, timestamp}
-
     # Relationships
     factory: fields.ForeignKeyField[GameFactory] = fields.ForeignKeyField('models.GameFactory', related_name='sessions')
 
+    class Meta:
+        indexes = [('game_factory', 'game_session_index')]
+
 
 class Agent(Model):
     """
@@ -133,6 +126,7 @@ class Agent(Model):
 
     class Meta:
         unique_together = [('address', 'session_address')]
+        indexes = [('session_address', 'agent_index')]
 
 
 class UserDeposit(Model):
@@ -198,7 +192,7 @@ class AgentScore(Model):
     resource_balance_score = fields.DecimalField(max_digits=100, decimal_places=0, default=0)
     lp_position_score = fields.DecimalField(max_digits=100, decimal_places=0, default=0)
     farming_score = fields.DecimalField(max_digits=100, decimal_places=0, default=0)
-    
+
     # Total aggregated score
     total_score = fields.DecimalField(max_digits=100, decimal_places=0, default=0)
 
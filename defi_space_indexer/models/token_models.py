@@ -0,0 +1,26 @@
+from dipdup import fields
+from dipdup.models import Model
+
+
+class TokenMetadata(Model):
+    """
+    Stores the ERC20 metadata (name, symbol, decimals) of a token contract.
+    Acts as the persistent level of the token metadata cache used by handlers and hooks.
+
+    Key responsibilities:
+    - Records metadata fetched from the token contract
+    - Avoids repeated name/symbol/decimals RPC calls for known tokens
+
+    Lifecycle:
+    - Filled lazily the first time a token is seen
+    - Listed in `immune_tables`, so it survives reindexing
+    """
+
+    address = fields.TextField(primary_key=True)  # ContractAddress
+
+    name = fields.TextField()
+    symbol = fields.TextField()
+    decimals = fields.IntField()
+
+    created_at = fields.BigIntField()
+    updated_at = fields.BigIntField()
@@ -0,0 +1,148 @@
+from defi_space_indexer import models as models
+from defi_space_indexer.amm_math import BPS
+from defi_space_indexer.entity_cache import save_entity
+
+# Bucket length and rolling windows, in seconds
+STATS_BUCKET = 3600
+WINDOW_24H = 86400
+WINDOW_7D = 604800
+
+# Live PairStats rows by pair address; written through save_entity like other per-pair state
+_stats: dict[str, models.PairStats] = {}
+
+
+async def get_pair_stats(pair: models.Pair, timestamp: int) -> models.PairStats:
+    """Get the stats row of a pair, creating an empty one on the first swap."""
+    stats = _stats.get(pair.address)
+    if stats is None:
+        stats = await models.PairStats.get_or_none(pair_address=pair.address)
+        if stats is None:
+            stats = models.PairStats(pair_address=pair.address, buckets=[], updated_at=timestamp, pair=pair)
+        _stats[pair.address] = stats
+    return stats
+
+
+def expire_pair_stats(stats: models.PairStats, timestamp: int) -> None:
+    """Drop buckets older than 7 days and recompute the window totals as of `timestamp`.
+
+    Args:
+        stats: Stats row to update in place
+        timestamp: End of the windows, the latest block timestamp
+    """
+    cutoff_24h = timestamp - WINDOW_24H
+    cutoff_7d = timestamp - WINDOW_7D
+    buckets = [bucket for bucket in stats.buckets if bucket[0] + STATS_BUCKET > cutoff_7d]
+
+    totals_24h = [0, 0, 0, 0, 0]
+    totals_7d = [0, 0, 0, 0, 0]
+    for hour_start, *values in buckets:
+        in_24h = hour_start + STATS_BUCKET > cutoff_24h
+        for i, value in enumerate(values):
+            totals_7d[i] += int(value)
+            if in_24h:
+                totals_24h[i] += int(value)
+
+    stats.buckets = buckets
+    stats.volume0_24h, stats.volume1_24h, stats.fees0_24h, stats.fees1_24h, stats.trade_count_24h = totals_24h
+    stats.volume0_7d, stats.volume1_7d, stats.fees0_7d, stats.fees1_7d, stats.trade_count_7d = totals_7d
+    stats.updated_at = timestamp
+
+
+async def record_swap(
+    pair: models.Pair,
+    amount0_in: int,
+    amount1_in: int,
+    amount0_out: int,
+    amount1_out: int,
+    timestamp: int,
+) -> None:
+    """Add a swap to the current hourly bucket of the pair and roll its 24h and 7d windows forward.
+
+    Args:
+        pair: Pair the swap happened in
+        amount0_in: token0 sent to the pair
+        amount1_in: token1 sent to the pair
+        amount0_out: token0 sent by the pair
+        amount1_out: token1 sent by the pair
+        timestamp: Block timestamp of the swap
+    """
+    stats = await get_pair_stats(pair, timestamp)
+
+    volume0 = amount0_in + amount0_out
+    volume1 = amount1_in + amount1_out
+    fees0 = amount0_in * pair.fee_bps // BPS
+    fees1 = amount1_in * pair.fee_bps // BPS
+
+    hour_start = timestamp - timestamp % STATS_BUCKET
+    buckets = stats.buckets
+    if buckets and buckets[-1][0] == hour_start:
+        _, *values = buckets[-1]
+        buckets[-1] = [
+            hour_start,
+            str(int(values[0]) + volume0),
+            str(int(values[1]) + volume1),
+            str(int(values[2]) + fees0),
+            str(int(values[3]) + fees1),
+            values[4] + 1,
+        ]
+    else:
+        buckets.append([hour_start, str(volume0), str(volume1), str(fees0), str(fees1), 1])
+
+    expire_pair_stats(stats, timestamp)
+    await save_entity(stats)
+
+
+async def refresh_stale_pair_stats(batch_size: int) -> int:
+    """Roll the windows of pairs without recent swaps forward to the latest swap of any pair.
+
+    Chain time is taken from the stats rows themselves, so windows never expire ahead of indexing.
+    Only rows freshly read from the database are modified: the cached instances belong to the
+    handlers and their level transactions, and record_swap expires them again on the next swap.
+
+    Args:
+        batch_size: Rows per UPDATE statement
+
+    Returns:
+        int: Number of refreshed pairs
+    """
+    latest = await models.PairStats.all().order_by('-updated_at').first()
+    if latest is None:
+        return 0
+    timestamp = latest.updated_at
+
+    stale = await models.PairStats.filter(updated_at__lte=timestamp - STATS_BUCKET, trade_count_7d__gt=0)
+    # Leave pairs whose cached stats moved past the stored row to the handlers, so their new buckets are not lost
+    stale = [
+        stats
+        for stats in stale
+        if stats.pair_address not in _stats or _stats[stats.pair_address].updated_at <= stats.updated_at
+    ]
+    if not stale:
+        return 0
+    for stats in stale:
+        expire_pair_stats(stats, timestamp)
+
+    await models.PairStats.bulk_update(
+        stale,
+        fields=[
+            'volume0_24h',
+            'volume1_24h',
+            'fees0_24h',
+            'fees1_24h',
+            'trade_count_24h',
+            'volume0_7d',
+            'volume1_7d',
+            'fees0_7d',
+            'fees1_7d',
+            'trade_count_7d',
+            'buckets',
+            'updated_at',
+        ],
+        batch_size=batch_size,
+    )
+    return len(stale)
+
+
+def clear_pair_stats_cache() -> None:
+    """Drop the cached stats rows, e.g. after a rollback reverted them."""
+    _stats.clear()
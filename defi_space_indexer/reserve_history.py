@@ -0,0 +1,103 @@
+from defi_space_indexer import models as models
+from defi_space_indexer.entity_cache import save_entity
+
+# Resolutions of ReserveSnapshot rows, in seconds
+RESOLUTION_BLOCK = 0
+RESOLUTION_MINUTE = 60
+RESOLUTION_HOUR = 3600
+
+# Latest snapshot per pair; events of the same block update it instead of adding rows
+_latest: dict[str, models.ReserveSnapshot] = {}
+
+
+async def record_reserves(pair: models.Pair, block_number: int, block_timestamp: int) -> None:
+    """Record the current reserves of a pair as its snapshot for the block.
+
+    Writes go through save_entity, so a block moving the reserves of a pair several times
+    (Sync, Swap, ReserveUpdated) results in a single row.
+
+    Args:
+        pair: Pair with up-to-date reserves
+        block_number: Block being processed
+        block_timestamp: Timestamp of the block
+    """
+    snapshot = _latest.get(pair.address)
+    if snapshot is None or snapshot.block_number != block_number:
+        snapshot = models.ReserveSnapshot(
+            block_number=block_number,
+            block_timestamp=block_timestamp,
+            pair_address=pair.address,
+            resolution=RESOLUTION_BLOCK,
+            pair=pair,
+        )
+        _latest[pair.address] = snapshot
+
+    snapshot.reserve0 = pair.reserve0
+    snapshot.reserve1 = pair.reserve1
+    await save_entity(snapshot)
+
+
+async def downsample_reserve_history(resolution: int, target: int, before: int, batch_size: int) -> int:
+    """Merge snapshots of one resolution older than `before` into one row per pair and `target` period.
+
+    The last snapshot of each period is kept, as it holds the reserves the period ended with.
+    Only periods that end by `before` are merged, so a period is never split between two runs.
+
+    Args:
+        resolution: Resolution of the rows to merge
+        target: Resolution of the merged rows, in seconds
+        before: Only periods ending at or before this block timestamp are merged
+        batch_size: Maximum number of rows read per pass
+
+    Returns:
+        int: Number of deleted rows
+    """
+    boundary = before - before % target
+    deleted = 0
+    while True:
+        rows = (
+            await models.ReserveSnapshot.filter(resolution=resolution, block_timestamp__lt=boundary)
+            .order_by('block_timestamp', 'id')
+            .limit(batch_size)
+            .values_list('id', 'pair_address', 'block_timestamp')
+        )
+        if not rows:
+            return deleted
+
+        # The last period of a full batch may continue in the next one; leave it for then
+        full_batch = len(rows) == batch_size
+        if full_batch:
+            last_period = rows[-1][2] // target
+            complete = [row for row in rows if row[2] // target < last_period]
+            if not complete:
+                # A single period holds more rows than a batch; read all of it at once
+                rows = (
+                    await models.ReserveSnapshot.filter(
+                        resolution=resolution,
+                        block_timestamp__gte=last_period * target,
+                        block_timestamp__lt=(last_period + 1) * target,
+                    )
+                    .order_by('block_timestamp', 'id')
+                    .values_list('id', 'pair_address', 'block_timestamp')
+                )
+            else:
+                rows = complete
+
+        kept: dict[tuple[str, int], int] = {}
+        for snapshot_id, pair_address, block_timestamp in rows:
+            kept[(pair_address, block_timestamp // target)] = snapshot_id
+        kept_ids = set(kept.values())
+        dropped_ids = [row[0] for row in rows if row[0] not in kept_ids]
+
+        for i in range(0, len(dropped_ids), batch_size):
+            await models.ReserveSnapshot.filter(id__in=dropped_ids[i : i + batch_size]).delete()
+        await models.ReserveSnapshot.filter(id__in=list(kept_ids)).update(resolution=target)
+        deleted += len(dropped_ids)
+
+        if not full_batch:
+            return deleted
+
+
+def clear_reserve_history_cache() -> None:
+    """Drop the cached latest snapshots, e.g. after a rollback removed them."""
+    _latest.clear()
@@ -0,0 +1,207 @@
+import asyncio
+import json
+import os
+from collections.abc import Awaitable
+from collections.abc import Callable
+from logging import getLogger
+from typing import Any
+from typing import TypeVar
+
+import aiohttp
+from starknet_py.contract import Contract
+from starknet_py.hash.selector import get_selector_from_name
+from starknet_py.net.client_models import SierraContractClass
+from starknet_py.net.full_node_client import FullNodeClient
+
+logger = getLogger(__name__)
+
+# Get the node URL from environment variables
+RPC_URL = os.environ.get('NODE_URL', '') + '/' + os.environ.get('NODE_API_KEY', '')
+
+# Size of the keep-alive connection pool shared by every RPC call of the process
+RPC_POOL_SIZE = int(os.environ.get('RPC_POOL_SIZE', '64'))
+RPC_KEEPALIVE_TIMEOUT = int(os.environ.get('RPC_KEEPALIVE_TIMEOUT', '60'))
+RPC_TIMEOUT = int(os.environ.get('RPC_TIMEOUT', '30'))
+
+# Maximum number of calls packed into a single JSON-RPC batch request
+RPC_BATCH_SIZE = int(os.environ.get('RPC_BATCH_SIZE', '100'))
+
+T = TypeVar('T')
+
+_session: aiohttp.ClientSession | None = None
+_client: FullNodeClient | None = None
+
+# ABI and Cairo version by class hash, so contracts sharing a class (e.g. all ERC20s) share one fetch
+_ABI_CACHE: dict[int, tuple[list[Any], int]] = {}
+# Contract objects by address
+_CONTRACT_CACHE: dict[int, Contract] = {}
+# In-flight lookups, so concurrent callers wait for the same request instead of issuing their own
+_PENDING_ABIS: dict[int, asyncio.Future[tuple[list[Any], int]]] = {}
+_PENDING_CONTRACTS: dict[int, asyncio.Future[Contract]] = {}
+
+
+def get_session() -> aiohttp.ClientSession:
+    """Get the process-wide HTTP session used for all node requests.
+
+    Returns:
+        aiohttp.ClientSession: Session backed by a keep-alive connection pool
+    """
+    global _session
+    if _session is None:
+        connector = aiohttp.TCPConnector(limit=RPC_POOL_SIZE, keepalive_timeout=RPC_KEEPALIVE_TIMEOUT)
+        _session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=RPC_TIMEOUT))
+    return _session
+
+
+def get_client() -> FullNodeClient:
+    """Get the process-wide Starknet client.
+
+    Returns:
+        FullNodeClient: Client bound to the shared HTTP session
+    """
+    global _client
+    if _client is None:
+        _client = FullNodeClient(node_url=RPC_URL, session=get_session())
+    return _client
+
+
+async def close() -> None:
+    """Close the shared HTTP session and drop the client along with the contracts bound to it."""
+    global _session, _client
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _client = None
+    _CONTRACT_CACHE.clear()
+
+
+async def _shared(pending: dict[Any, asyncio.Future[T]], key: Any, fetch: Callable[[], Awaitable[T]]) -> T:
+    """Run `fetch` once per key, letting concurrent callers await the same result."""
+    future = pending.get(key)
+    if future is None:
+        future = asyncio.ensure_future(fetch())
+        pending[key] = future
+        future.add_done_callback(lambda _: pending.pop(key, None))
+    return await future
+
+
+async def get_abi(class_hash: int) -> tuple[list[Any], int]:
+    """Get the ABI of a contract class, fetching it from the node only once per class hash.
+
+    Args:
+        class_hash: Class hash of the contract
+
+    Returns:
+        tuple: (abi, cairo_version) of the class
+    """
+    if class_hash in _ABI_CACHE:
+        return _ABI_CACHE[class_hash]
+
+    async def fetch() -> tuple[list[Any], int]:
+        contract_class = await get_client().get_class_by_hash(class_hash=class_hash)
+        if isinstance(contract_class, SierraContractClass):
+            abi, cairo_version = json.loads(contract_class.abi or '[]'), 1
+        else:
+            abi, cairo_version = contract_class.abi or [], 0
+        _ABI_CACHE[class_hash] = (abi, cairo_version)
+        return abi, cairo_version
+
+    return await _shared(_PENDING_ABIS, class_hash, fetch)
+
+
+async def get_contract(address: str | int) -> Contract:
+    """Get a Contract for the given address, reusing cached ABIs and Contract objects.
+
+    Args:
+        address: Contract address as an integer or hex string (0x...)
+
+    Returns:
+        Contract: Contract bound to the shared client
+    """
+    key = address if isinstance(address, int) else int(address, 16)
+    if key in _CONTRACT_CACHE:
+        return _CONTRACT_CACHE[key]
+
+    async def fetch() -> Contract:
+        class_hash = await get_client().get_class_hash_at(contract_address=key)
+        abi, cairo_version = await get_abi(class_hash)
+        contract = Contract(address=key, abi=abi, provider=get_client(), cairo_version=cairo_version)
+        _CONTRACT_CACHE[key] = contract
+        return contract
+
+    return await _shared(_PENDING_CONTRACTS, key, fetch)
+
+
+async def _post_batch(requests: list[dict[str, Any]]) -> dict[int, list[int] | None]:
+    """Send one JSON-RPC batch request and map each request id to its decoded result."""
+    async with get_session().post(RPC_URL, json=requests) as response:
+        response.raise_for_status()
+        replies = await response.json(content_type=None)
+
+    # Nodes without batch support answer with a single error object instead of a list
+    if not isinstance(replies, list):
+        raise ValueError(f'Node rejected batch request: {replies}')
+
+    results: dict[int, list[int] | None] = {}
+    for reply in replies:
+        if 'error' in reply:
+            logger.debug('Batched call %s failed: %s', reply.get('id'), reply['error'])
+            results[reply['id']] = None
+        else:
+            results[reply['id']] = [int(felt, 16) for felt in reply['result']]
+    return results
+
+
+async def batch_call(
+    calls: list[tuple[str | int, str, list[int]]],
+    semaphore: asyncio.Semaphore | None = None,
+    block_id: str = 'latest',
+) -> list[list[int] | None]:
+    """Execute many `starknet_call` requests as chunked JSON-RPC batch requests.
+
+    Args:
+        calls: List of (contract_address, function_name, calldata) tuples
+        semaphore: Optional limit on the number of batch requests in flight
+        block_id: Block to execute the calls against
+
+    Returns:
+        list: Raw felt results in the order of `calls`; None for calls that failed
+    """
+    selectors: dict[str, str] = {}
+    requests = []
+    for request_id, (address, function_name, calldata) in enumerate(calls):
+        if function_name not in selectors:
+            selectors[function_name] = hex(get_selector_from_name(function_name))
+        contract_address = address if isinstance(address, str) else hex(address)
+        requests.append(
+            {
+                'jsonrpc': '2.0',
+                'id': request_id,
+                'method': 'starknet_call',
+                'params': {
+                    'request': {
+                        'contract_address': contract_address,
+                        'entry_point_selector': selectors[function_name],
+                        'calldata': [hex(value) for value in calldata],
+                    },
+                    'block_id': block_id,
+                },
+            }
+        )
+
+    async def send(chunk: list[dict[str, Any]]) -> dict[int, list[int] | None]:
+        try:
+            if semaphore is None:
+                return await _post_batch(chunk)
+            async with semaphore:
+                return await _post_batch(chunk)
+        except Exception as e:
+            logger.warning('Batch request of %s calls failed: %s', len(chunk), e)
+            return {}
+
+    chunks = [requests[i : i + RPC_BATCH_SIZE] for i in range(0, len(requests), RPC_BATCH_SIZE)]
+    results: dict[int, list[int] | None] = {}
+    for chunk_results in await asyncio.gather(*(send(chunk) for chunk in chunks)):
+        results.update(chunk_results)
+
+    return [results.get(request_id) for request_id in range(len(calls))]
@@ -0,0 +1,144 @@
+import os
+import time
+from collections.abc import Iterable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TypeVar
+
+from defi_space_indexer.entity_cache import get_session_addresses
+
+# Seconds between full scoring sweeps; in between, only agents marked dirty are rescored.
+# Full sweeps catch what no handler marks: reward accrual over time (both modes score pending
+# rewards as of the pass) and token transfers that are not indexed
+SCORING_FULL_SWEEP_INTERVAL = int(os.environ.get('SCORING_FULL_SWEEP_INTERVAL', '900'))
+
+# (agent address, session address) pairs whose score inputs changed since the last scoring pass.
+# Each maps to the highest level per index that marked it; a pair is only handed to a pass once
+# those levels are committed, so a pass never scores state its level transaction has not written yet
+_dirty_agents: dict[tuple[str, str], dict[str, int]] = {}
+# Sessions all of whose agents must be rescored, for changes whose agent the event does not name
+_dirty_sessions: dict[str, dict[str, int]] = {}
+# (index name, level) of the level whose handlers are running; None outside of handlers
+_current_level: ContextVar[tuple[str, int] | None] = ContextVar('scoring_level', default=None)
+# Monotonic time of the last full sweep; None until the first one, so every process starts with a full sweep
+_last_full_sweep: float | None = None
+
+KeyT = TypeVar('KeyT')
+
+
+@contextmanager
+def track_level(index_name: str, level: int) -> Iterator[None]:
+    """Tag agents marked dirty inside the block with the level being processed.
+
+    Args:
+        index_name: Name of the index processing the level
+        level: Level being processed
+    """
+    token = _current_level.set((index_name, level))
+    try:
+        yield
+    finally:
+        _current_level.reset(token)
+
+
+def _mark(marks: dict[str, int]) -> None:
+    level = _current_level.get()
+    if level is not None:
+        index_name, level_number = level
+        marks[index_name] = max(marks.get(index_name, 0), level_number)
+
+
+def mark_agent_dirty(agent_address: str, session_address: str) -> None:
+    """Flag an agent of a session for rescoring on the next scoring pass.
+
+    Args:
+        agent_address: Agent address (0x...)
+        session_address: Address of the game session the change counts for
+    """
+    _mark(_dirty_agents.setdefault((agent_address, session_address), {}))
+
+
+def mark_session_dirty(session_address: str) -> None:
+    """Flag every agent of a session for rescoring on the next scoring pass.
+
+    Args:
+        session_address: Game session address (0x...)
+    """
+    _mark(_dirty_sessions.setdefault(session_address, {}))
+
+
+async def mark_game_agent_dirty(agent_address: str, game_session_id: int) -> None:
+    """Flag an agent for rescoring in the sessions of a pair, farm or faucet.
+
+    Args:
+        agent_address: Agent address (0x...)
+        game_session_id: game_session_id of the pair, farm or faucet the agent interacted with
+    """
+    for session_address in await get_session_addresses(game_session_id):
+        mark_agent_dirty(agent_address, session_address)
+
+
+async def mark_game_sessions_dirty(game_session_id: int) -> None:
+    """Flag every agent of the sessions of a pair, farm or faucet for rescoring.
+
+    Args:
+        game_session_id: game_session_id of the pair, farm or faucet
+    """
+    for session_address in await get_session_addresses(game_session_id):
+        mark_session_dirty(session_address)
+
+
+def _take_committed(dirty: dict[KeyT, dict[str, int]], committed_levels: dict[str, int]) -> set[KeyT]:
+    taken = {
+        key
+        for key, marks in dirty.items()
+        if all(level <= committed_levels.get(index_name, 0) for index_name, level in marks.items())
+    }
+    for key in taken:
+        del dirty[key]
+    return taken
+
+
+def take_dirty_agents(committed_levels: dict[str, int]) -> tuple[set[tuple[str, str]], set[str]]:
+    """Take the dirty agents and sessions whose marking levels are committed.
+
+    Marks made by levels that are still in flight stay for a later pass, as do changes made during the pass.
+
+    Args:
+        committed_levels: Committed level of every index, by index name
+
+    Returns:
+        tuple: (agent address, session address) pairs and session addresses to rescore
+    """
+    return _take_committed(_dirty_agents, committed_levels), _take_committed(_dirty_sessions, committed_levels)
+
+
+def restore_dirty_agents(agents: Iterable[tuple[str, str]], sessions: Iterable[str]) -> None:
+    """Put back agents and sessions taken by a scoring pass that did not complete.
+
+    Args:
+        agents: (agent address, session address) pairs returned by take_dirty_agents
+        sessions: Session addresses returned by take_dirty_agents
+    """
+    for key in agents:
+        _dirty_agents.setdefault(key, {})
+    for session_address in sessions:
+        _dirty_sessions.setdefault(session_address, {})
+
+
+def is_full_sweep_due() -> bool:
+    """Check whether the next scoring pass must rescore every agent."""
+    return _last_full_sweep is None or time.monotonic() - _last_full_sweep >= SCORING_FULL_SWEEP_INTERVAL
+
+
+def record_full_sweep() -> None:
+    """Record that a full sweep has just completed."""
+    global _last_full_sweep
+    _last_full_sweep = time.monotonic()
+
+
+def request_full_sweep() -> None:
+    """Force the next scoring pass to rescore every agent, e.g. after a rollback."""
+    global _last_full_sweep
+    _last_full_sweep = None
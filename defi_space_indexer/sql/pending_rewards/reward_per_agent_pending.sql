@@ -0,0 +1,46 @@
+-- Pending rewards computed at query time from the indexed checkpoints, mirroring the farm's earned():
+--   reward_per_token = reward_per_token_stored
+--                      + (min(now, period_finish) - last_update_time) * reward_rate * 10^decimals / total_staked
+--   earned           = rewards + staked_amount * (reward_per_token - reward_per_token_paid) / 10^decimals
+-- With LAZY_PENDING_REWARDS=true this view is the only up-to-date source of pending rewards,
+-- as reward_per_agent.last_pending_rewards is no longer rewritten on every RewardPerTokenUpdated.
+CREATE OR REPLACE VIEW reward_per_agent_pending AS
+WITH current_reward_per_token AS (
+    SELECT
+        r.id AS reward_id,
+        r.reward_per_token_stored::numeric
+        + CASE
+            WHEN f.total_staked::numeric > 0
+             AND LEAST(floor(extract(epoch FROM now()))::numeric, r.period_finish::numeric) > r.last_update_time
+            THEN div(
+                (LEAST(floor(extract(epoch FROM now()))::numeric, r.period_finish::numeric) - r.last_update_time)
+                * r.reward_rate::numeric
+                * power(10::numeric, r.decimals),
+                f.total_staked::numeric
+            )
+            ELSE 0
+        END AS reward_per_token
+    FROM reward r
+    JOIN farm f ON f.address = r.farm_address
+)
+SELECT
+    rpa.id,
+    rpa.agent_address,
+    rpa.farm_address,
+    rpa.reward_token_address,
+    s.staked_amount::numeric AS staked_amount,
+    rpa.reward_per_token_paid::numeric AS reward_per_token_paid,
+    crpt.reward_per_token,
+    rpa.rewards::numeric
+    + CASE
+        WHEN s.staked_amount::numeric > 0 AND crpt.reward_per_token > rpa.reward_per_token_paid::numeric
+        THEN div(
+            s.staked_amount::numeric * (crpt.reward_per_token - rpa.reward_per_token_paid::numeric),
+            power(10::numeric, r.decimals)
+        )
+        ELSE 0
+    END AS pending_rewards
+FROM reward_per_agent rpa
+JOIN agent_stake s ON s.id = rpa.agent_stake_id
+JOIN reward r ON r.id = rpa.reward_id
+JOIN current_reward_per_token crpt ON crpt.reward_id = rpa.reward_id;
@@ -0,0 +1,55 @@
+-- Composite and covering indexes for the lookups of handlers, hooks and Hasura queries.
+-- Declared here rather than in Meta.indexes so they can be added to an existing database
+-- without a reindex; every statement is idempotent and runs on reindex and on restart.
+-- Each index is listed with the lookups it serves.
+
+-- on_mint, on_burn: LiquidityPosition.get_or_create(pair_address, agent_address)
+-- calculate_indexed_lp_scores: filter(pair_address__in, agent_address__in, liquidity__gt=0) selecting only
+-- pair_address, agent_address and liquidity, so it can be served by an index-only scan
+CREATE INDEX IF NOT EXISTS idx_liquidity_position_pair_agent
+ON liquidity_position (pair_address, agent_address, liquidity);
+
+-- on_reward_added, on_reward_per_token_updated, on_reward_state_updated, on_harvest,
+-- on_unallocated_rewards_claimed, on_unallocated_rewards_updated: Reward.get_or_none(address, farm_address)
+-- SessionScoringContext.load: Reward.filter(farm_address__in)
+CREATE INDEX IF NOT EXISTS idx_reward_farm_address
+ON reward (farm_address, address);
+
+-- on_rewarder_added, on_rewarder_removed: Rewarder.get_or_create / get_or_none(address, farm_address)
+CREATE INDEX IF NOT EXISTS idx_rewarder_farm_address
+ON rewarder (farm_address, address);
+
+-- SessionScoringContext.load: Pair.filter(game_session_id)
+CREATE INDEX IF NOT EXISTS idx_pair_game_session_id
+ON pair (game_session_id);
+
+-- SessionScoringContext.load: Farm.filter(game_session_id)
+CREATE INDEX IF NOT EXISTS idx_farm_game_session_id
+ON farm (game_session_id);
+
+-- Hasura: stakes of an agent across farms (farm-first lookups use the unique constraint)
+CREATE INDEX IF NOT EXISTS idx_agent_stake_agent
+ON agent_stake (agent_address);
+
+-- on_emergency_withdraw, on_rewards_claimed: UserDeposit.filter(user_address, session_address)
+CREATE INDEX IF NOT EXISTS idx_user_deposit_user_session
+ON user_deposit (user_address, session_address);
+
+-- Hasura: latest events of a pair, farm, session or faucet, paginated by time
+CREATE INDEX IF NOT EXISTS idx_swap_event_pair_created
+ON swap_event (pair_id, created_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_liquidity_event_pair_created
+ON liquidity_event (pair_id, created_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_agent_stake_event_farm_created
+ON agent_stake_event (farm_id, created_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_reward_event_farm_created
+ON reward_event (farm_id, created_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_game_event_session_created
+ON game_event (session_id, created_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_claim_event_faucet_created
+ON claim_event (faucet_id, created_at DESC);
@@ -0,0 +1,35 @@
+-- Time-weighted average prices of a pair between two timestamps, from two indexed point lookups
+-- on price_accumulator_snapshot (pair_address, block_timestamp):
+--   average = (cumulative(t1) - cumulative(t0)) / (t1 - t0)
+-- Each bound resolves to the latest snapshot at or before it; the window actually averaged over
+-- is returned alongside. Averages are in accumulator units (raw fixed-point price per second),
+-- and no row is returned when both bounds resolve to the same snapshot.
+CREATE OR REPLACE FUNCTION pair_twap(p_pair_address TEXT, p_t0 BIGINT, p_t1 BIGINT)
+RETURNS TABLE (
+    price_0_average NUMERIC,
+    price_1_average NUMERIC,
+    window_start BIGINT,
+    window_end BIGINT
+)
+LANGUAGE sql STABLE AS $$
+    SELECT
+        (s1.price_0_cumulative - s0.price_0_cumulative) / (s1.block_timestamp - s0.block_timestamp),
+        (s1.price_1_cumulative - s0.price_1_cumulative) / (s1.block_timestamp - s0.block_timestamp),
+        s0.block_timestamp,
+        s1.block_timestamp
+    FROM (
+        SELECT block_timestamp, price_0_cumulative, price_1_cumulative
+        FROM price_accumulator_snapshot
+        WHERE pair_address = p_pair_address AND block_timestamp <= p_t0
+        ORDER BY block_timestamp DESC, id DESC
+        LIMIT 1
+    ) s0
+    CROSS JOIN (
+        SELECT block_timestamp, price_0_cumulative, price_1_cumulative
+        FROM price_accumulator_snapshot
+        WHERE pair_address = p_pair_address AND block_timestamp <= p_t1
+        ORDER BY block_timestamp DESC, id DESC
+        LIMIT 1
+    ) s1
+    WHERE s1.block_timestamp > s0.block_timestamp
+$$;
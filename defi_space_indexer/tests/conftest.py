@@ -0,0 +1,17 @@
+from collections.abc import Iterator
+
+import pytest
+
+from defi_space_indexer.candles import clear_candle_cache
+from defi_space_indexer.entity_cache import clear_entity_cache
+from defi_space_indexer.pair_stats import clear_pair_stats_cache
+from defi_space_indexer.reserve_history import clear_reserve_history_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches() -> Iterator[None]:
+    yield
+    clear_entity_cache()
+    clear_candle_cache()
+    clear_pair_stats_cache()
+    clear_reserve_history_cache()
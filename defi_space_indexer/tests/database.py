@@ -0,0 +1,82 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from decimal import Decimal
+
+from dipdup.database import tortoise_wrapper
+from dipdup.models import ModelUpdate
+from dipdup.transactions import TransactionManager
+from tortoise import Tortoise
+
+from defi_space_indexer import models as models
+from defi_space_indexer.entity_cache import clear_entity_cache
+from defi_space_indexer.entity_cache import coalesce_entity_saves
+from defi_space_indexer.event_buffer import buffer_events
+
+INDEX = 'pair_events'
+ROLLBACK_DEPTH = 20
+
+PAIR_ADDRESS = '0x1234'
+FACTORY_ADDRESS = '0xfac'
+
+
+@asynccontextmanager
+async def versioned_database() -> AsyncIterator[TransactionManager]:
+    """In-memory database with a registered transaction manager, as used by the indexer in realtime."""
+    async with tortoise_wrapper('sqlite://:memory:', 'defi_space_indexer.models'):
+        await Tortoise.generate_schemas()
+        transactions = TransactionManager(depth=ROLLBACK_DEPTH)
+        async with transactions.register():
+            yield transactions
+
+
+@asynccontextmanager
+async def process_level(transactions: TransactionManager, level: int) -> AsyncIterator[None]:
+    """Run the block like the batch handler runs a level, inside a versioned transaction."""
+    async with transactions.in_transaction(level=level, sync_level=level, index=INDEX):
+        async with coalesce_entity_saves(), buffer_events():
+            yield
+
+
+async def rollback(transactions: TransactionManager, from_level: int, to_level: int) -> None:
+    """Revert the model updates of the levels after `to_level`, like HookContext.rollback."""
+    async with transactions.in_transaction():
+        updates = await ModelUpdate.filter(index=INDEX, level__lte=from_level, level__gt=to_level).order_by('-id')
+        for update in updates:
+            await update.revert(getattr(models, update.model_name))
+    clear_entity_cache()
+
+
+async def create_pair() -> models.Pair:
+    """Create a factory and an empty pair outside of any versioned transaction."""
+    factory = await models.AmmFactory.create(
+        address=FACTORY_ADDRESS,
+        num_of_pairs=1,
+        owner='0x1',
+        fee_to='0x2',
+        pair_contract_class_hash='0x3',
+        created_at=0,
+        updated_at=0,
+    )
+    return await models.Pair.create(
+        address=PAIR_ADDRESS,
+        factory_address=FACTORY_ADDRESS,
+        token0_address='0xa',
+        token1_address='0xb',
+        token0_symbol='A',
+        token1_symbol='B',
+        token0_name='A',
+        token1_name='B',
+        lp_token_symbol='A-B',
+        lp_token_name='A-B LP',
+        reserve0=Decimal(0),
+        reserve1=Decimal(0),
+        total_supply=Decimal(0),
+        klast=Decimal(0),
+        price_0_cumulative_last=Decimal(0),
+        price_1_cumulative_last=Decimal(0),
+        block_timestamp_last=0,
+        game_session_id=1,
+        created_at=0,
+        updated_at=0,
+        factory=factory,
+    )
@@ -0,0 +1,64 @@
+import asyncio
+
+from defi_space_indexer import models as models
+from defi_space_indexer.entity_cache import get_entity
+from defi_space_indexer.entity_cache import save_entity
+from tests.database import PAIR_ADDRESS
+from tests.database import create_pair
+from tests.database import process_level
+from tests.database import rollback
+from tests.database import versioned_database
+
+
+async def _set_reserves(pair_address: str, reserve0: int, reserve1: int) -> None:
+    pair = await get_entity(models.Pair, pair_address)
+    assert pair is not None
+    pair.reserve0 = reserve0
+    pair.reserve1 = reserve1
+    await save_entity(pair)
+
+
+def test_rollback_restores_previous_level_of_cached_pair() -> None:
+    async def run() -> None:
+        async with versioned_database() as transactions:
+            await create_pair()
+
+            # The same cached instance is updated by two consecutive levels
+            async with process_level(transactions, 10):
+                await _set_reserves(PAIR_ADDRESS, 100, 200)
+            async with process_level(transactions, 11):
+                await _set_reserves(PAIR_ADDRESS, 150, 140)
+
+            await rollback(transactions, from_level=11, to_level=10)
+
+            pair = await models.Pair.get(address=PAIR_ADDRESS)
+            assert (pair.reserve0, pair.reserve1) == (100, 200)
+
+            await rollback(transactions, from_level=10, to_level=9)
+
+            pair = await models.Pair.get(address=PAIR_ADDRESS)
+            assert (pair.reserve0, pair.reserve1) == (0, 0)
+
+    asyncio.run(run())
+
+
+def test_rollback_restores_level_with_several_saves() -> None:
+    async def run() -> None:
+        async with versioned_database() as transactions:
+            await create_pair()
+
+            async with process_level(transactions, 10):
+                await _set_reserves(PAIR_ADDRESS, 100, 200)
+            async with process_level(transactions, 11):
+                # Coalesced into a single save of the final state
+                await _set_reserves(PAIR_ADDRESS, 110, 190)
+                await _set_reserves(PAIR_ADDRESS, 120, 180)
+            async with process_level(transactions, 12):
+                await _set_reserves(PAIR_ADDRESS, 130, 170)
+
+            await rollback(transactions, from_level=12, to_level=11)
+
+            pair = await models.Pair.get(address=PAIR_ADDRESS)
+            assert (pair.reserve0, pair.reserve1) == (120, 180)
+
+    asyncio.run(run())
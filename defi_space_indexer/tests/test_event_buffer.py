@@ -0,0 +1,60 @@
+import asyncio
+from decimal import Decimal
+
+from defi_space_indexer import models as models
+from defi_space_indexer.event_buffer import add_event
+from defi_space_indexer.event_buffer import buffer_events
+from tests.database import create_pair
+from tests.database import process_level
+from tests.database import rollback
+from tests.database import versioned_database
+
+
+def _swap_event(pair: models.Pair, transaction_hash: str) -> models.SwapEvent:
+    return models.SwapEvent(
+        transaction_hash=transaction_hash,
+        created_at=0,
+        sender='0x5',
+        amount0_in=Decimal(1),
+        amount1_in=Decimal(0),
+        amount0_out=Decimal(0),
+        amount1_out=Decimal(1),
+        pair=pair,
+    )
+
+
+def test_buffered_events_are_versioned() -> None:
+    async def run() -> None:
+        async with versioned_database() as transactions:
+            pair = await create_pair()
+
+            async with process_level(transactions, 10):
+                await add_event(_swap_event(pair, '0x10'))
+            async with process_level(transactions, 11):
+                await add_event(_swap_event(pair, '0x11a'))
+                await add_event(_swap_event(pair, '0x11b'))
+
+            hashes = await models.SwapEvent.all().order_by('id').values_list('transaction_hash', flat=True)
+            assert hashes == ['0x10', '0x11a', '0x11b']
+
+            await rollback(transactions, from_level=11, to_level=10)
+
+            hashes = await models.SwapEvent.all().order_by('id').values_list('transaction_hash', flat=True)
+            assert hashes == ['0x10']
+
+    asyncio.run(run())
+
+
+def test_buffered_events_are_bulk_inserted_outside_versioned_levels() -> None:
+    async def run() -> None:
+        async with versioned_database() as transactions:
+            pair = await create_pair()
+
+            # No level: the transaction is not versioned, as for levels far behind the head
+            async with transactions.in_transaction(), buffer_events():
+                await add_event(_swap_event(pair, '0x1'))
+                await add_event(_swap_event(pair, '0x2'))
+
+            assert await models.SwapEvent.all().count() == 2
+
+    asyncio.run(run())
@@ -0,0 +1,45 @@
+from defi_space_indexer import models as models
+from defi_space_indexer.event_buffer import add_event
+
+
+async def update_price_accumulators(
+    pair: models.Pair,
+    price_0_cumulative: int,
+    price_1_cumulative: int,
+    block_timestamp: int,
+    transaction_hash: str,
+    block_number: int,
+) -> None:
+    """Set the pair's price accumulators, recording a snapshot when they moved.
+
+    Sync and PriceAccumulatorUpdated both carry the accumulators, so the same checkpoint
+    usually arrives twice; only the first one is recorded.
+
+    Args:
+        pair: Pair to update; the caller saves it
+        price_0_cumulative: Cumulative price of token0
+        price_1_cumulative: Cumulative price of token1
+        block_timestamp: Block timestamp of the checkpoint
+        transaction_hash: Transaction that emitted the event
+        block_number: Block that emitted the event
+    """
+    if (
+        int(pair.price_0_cumulative_last) != price_0_cumulative
+        or int(pair.price_1_cumulative_last) != price_1_cumulative
+        or pair.block_timestamp_last != block_timestamp
+    ):
+        await add_event(
+            models.PriceAccumulatorSnapshot(
+                transaction_hash=transaction_hash,
+                block_number=block_number,
+                block_timestamp=block_timestamp,
+                pair_address=pair.address,
+                price_0_cumulative=price_0_cumulative,
+                price_1_cumulative=price_1_cumulative,
+                pair=pair,
+            )
+        )
+
+    pair.price_0_cumulative_last = price_0_cumulative
+    pair.price_1_cumulative_last = price_1_cumulative
+    pair.block_timestamp_last = block_timestamp
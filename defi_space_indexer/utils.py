@@ -1,13 +1,24 @@
+import asyncio
 import os
+import time
+from collections import OrderedDict
+from decimal import Decimal
 from logging import getLogger
 
-from starknet_py.contract import Contract
-from starknet_py.net.full_node_client import FullNodeClient
+from defi_space_indexer.addresses import normalize_address
+from defi_space_indexer.models import TokenMetadata
+from defi_space_indexer.rpc import get_contract
 
 logger = getLogger(__name__)
 
-# Get the node URL from environment variables
-RPC_URL = os.environ.get('NODE_URL', '') + '/' + os.environ.get('NODE_API_KEY', '')
+# Returned by get_token_info when the token contract could not be queried
+DEFAULT_TOKEN_INFO = ('Unknown', 'UNK', 18)
+
+# Number of tokens kept in the in-process level of the token metadata cache
+TOKEN_METADATA_CACHE_SIZE = int(os.environ.get('TOKEN_METADATA_CACHE_SIZE', '4096'))
+
+_token_metadata_cache: OrderedDict[str, tuple[str, str, int]] = OrderedDict()
+_pending_token_metadata: dict[str, asyncio.Future[tuple[str, str, int]]] = {}
 
 
 def felt_to_string(felt: int) -> str:
@@ -25,34 +36,39 @@ def felt_to_string(felt: int) -> str:
     return felt_bytes.decode('utf-8').strip('\x00')
 
 
-async def get_token_info(address: str) -> tuple:
+def to_amount(value: int | str | Decimal | None) -> int:
+    """Convert an on-chain amount to an exact integer.
+
+    Amounts are stored as NUMERIC(78,0) columns (read back as Decimal) and as strings inside
+    JSON maps. Arithmetic on u256 values must be done on int, as Decimal rounds to 28 digits.
+
+    Args:
+        value: Amount as a Decimal, a decimal string, an int or None
+
+    Returns:
+        int: The amount, 0 for None or an empty string
+    """
+    if value is None or value == '':
+        return 0
+    return int(value)
+
+
+async def get_token_info(address: str | int) -> tuple:
     """
     Get token name, symbol, and decimals for the given token address.
     Handles both ByteArray and felt252 return types for name and symbol.
 
     Args:
-        address: Token contract address in hex format (0x...)
+        address: Token contract address as an integer or hex string
 
     Returns:
         tuple: (name, symbol, decimals) of the token
     """
     try:
-        # Create a client to interact with Starknet
-        client = FullNodeClient(node_url=RPC_URL)
-
-        # Ensure address is properly formatted as hex string
-        if isinstance(address, int):
-            address = f"0x{address:x}"
-        elif isinstance(address, str) and not address.startswith('0x'):
-            # If it's a string but doesn't start with 0x, assume it's an integer string
-            try:
-                address = f"0x{int(address):x}"
-            except ValueError:
-                # If conversion fails, assume it's already a hex string without 0x
-                address = f"0x{address}"
+        address = normalize_address(address)
 
         logger.info(f'Trying token {address}')
-        contract = await Contract.from_address(address=address, provider=client)
+        contract = await get_contract(address)
 
         # Get name - handle both ByteArray and felt252 return types
         try:
@@ -88,4 +104,67 @@ async def get_token_info(address: str) -> tuple:
 
     except Exception as e:
         logger.error(f'Error getting token info for {address}: {e!s}', exc_info=True)
-        return 'Unknown', 'UNK', 18  # Default to 18 decimals if there's an error
+        return DEFAULT_TOKEN_INFO  # Default to 18 decimals if there's an error
+
+
+async def get_cached_token_info(address: str | int) -> tuple[str, str, int]:
+    """
+    Get token name, symbol, and decimals through the two-level token metadata cache.
+    Lookups hit the in-process LRU first, then the TokenMetadata table, and only
+    fall back to RPC calls for tokens never seen before.
+
+    Args:
+        address: Token contract address as an integer or hex string
+
+    Returns:
+        tuple: (name, symbol, decimals) of the token
+    """
+    # Same token, same key, whatever the input format
+    address = normalize_address(address)
+
+    info = _token_metadata_cache.get(address)
+    if info is not None:
+        _token_metadata_cache.move_to_end(address)
+        return info
+
+    future = _pending_token_metadata.get(address)
+    if future is None:
+        future = asyncio.ensure_future(_load_token_metadata(address))
+        _pending_token_metadata[address] = future
+        future.add_done_callback(lambda _: _pending_token_metadata.pop(address, None))
+    info = await future
+
+    if info != DEFAULT_TOKEN_INFO:
+        _token_metadata_cache[address] = info
+        if len(_token_metadata_cache) > TOKEN_METADATA_CACHE_SIZE:
+            _token_metadata_cache.popitem(last=False)
+    return info
+
+
+async def _load_token_metadata(address: str) -> tuple[str, str, int]:
+    """Load token metadata from the database, fetching and storing it over RPC on a miss."""
+    token = await TokenMetadata.get_or_none(address=address)
+    if token:
+        return token.name, token.symbol, token.decimals
+
+    name, symbol, decimals = await get_token_info(address)
+
+    # Don't persist fallback values, so the token is fetched again once the node answers
+    if (name, symbol, decimals) != DEFAULT_TOKEN_INFO:
+        now = int(time.time())
+        await TokenMetadata.get_or_create(
+            address=address,
+            defaults={
+                'name': name,
+                'symbol': symbol,
+                'decimals': decimals,
+                'created_at': now,
+                'updated_at': now,
+            },
+        )
+    return name, symbol, decimals
+
+
+def clear_token_metadata_cache() -> None:
+    """Drop the in-process level of the token metadata cache."""
+    _token_metadata_cache.clear()